@@ -0,0 +1,40 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.fleet import FleetConfigurationRunner, \
+    fleet_argument_spec
+try:
+    import radware.alteon  # noqa: F401
+    HAS_ALTEON_SDK = True
+except ModuleNotFoundError:
+    HAS_ALTEON_SDK = False
+
+
+class ActionModule(ActionBase):
+    """
+    run the fleet configuration in the controller process
+    devices are reached directly over REST, the task connection is not used and no module is shipped
+    """
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        if not HAS_ALTEON_SDK:
+            raise AnsibleActionFail('The alteon-sdk package is required')
+        new_module_args = self.validate_argument_spec(argument_spec=fleet_argument_spec)[1]
+
+        try:
+            runner = FleetConfigurationRunner(new_module_args, check_mode=self._task.check_mode, diff=self._task.diff)
+        except RadwareModuleError as e:
+            raise AnsibleActionFail(str(e))
+        result.update(runner.run())
+        return result
@@ -0,0 +1,25 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.facts import decompress_facts, from_columnar
+
+
+def alteon_facts_decompress(facts_obj):
+    """restore facts_obj returned by alteon_device_facts with compress enabled"""
+    return decompress_facts(facts_obj)
+
+
+def alteon_facts_records(facts_obj):
+    """restore facts_obj returned by alteon_device_facts to lists of records, decompressing it when needed"""
+    return from_columnar(decompress_facts(facts_obj))
+
+
+class FilterModule(object):
+    def filters(self):
+        return {
+            'alteon_facts_decompress': alteon_facts_decompress,
+            'alteon_facts_records': alteon_facts_records
+        }
@@ -0,0 +1,98 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+name: alteon_object_index
+short_description: Resolve Alteon object names to their index
+description:
+  - Resolve Alteon object names to the object index from the object index gathered by
+    M(radware.radware_alteon.alteon_device_object_index), the device is not contacted.
+  - An object index is returned as is, so references given either by name or by index resolve to the index.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  _terms:
+    description: Object names or indexes to resolve.
+    required: true
+  kind:
+    description: Kind of the referenced objects.
+    type: str
+    required: true
+    choices:
+    - server_group
+    - server
+    - virtual_server
+    - ssl_policy
+    - ssl_cert
+    - ssl_cert_group
+    - http_mod_policy
+    - network_class
+    - appshape
+    - health_check
+  index:
+    description:
+      - Object index gathered by M(radware.radware_alteon.alteon_device_object_index).
+      - Defaults to the C(alteon_object_index) fact of the host.
+    type: dict
+  default:
+    description:
+      - Value returned for the objects not found in the index, unresolved objects fail the lookup when not provided.
+    type: raw
+'''
+
+EXAMPLES = r'''
+- name: server group index
+  ansible.builtin.debug:
+    msg: "{{ lookup('radware.radware_alteon.alteon_object_index', 'web_servers', kind='server_group') }}"
+
+- name: real server indexes, unknown servers are skipped
+  ansible.builtin.set_fact:
+    server_indexes: "{{ query('radware.radware_alteon.alteon_object_index', *server_names, kind='server',
+                        index=alteon_object_index, default='') | select | list }}"
+'''
+
+RETURN = r'''
+_raw:
+  description: Index of each object, in the order of the terms.
+  type: list
+  elements: str
+'''
+
+from ansible.errors import AnsibleError
+from ansible.plugins.lookup import LookupBase
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.object_index import ObjectIndex, \
+    OBJECT_INDEX_FACTS
+
+MISSING = object()
+
+
+class LookupModule(LookupBase):
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        kind = self.get_option('kind')
+        index = self.get_option('index')
+        if index is None:
+            index = (variables or {}).get(OBJECT_INDEX_FACTS)
+        if index is None:
+            raise AnsibleError(f'{OBJECT_INDEX_FACTS} is not defined, run alteon_device_object_index first')
+        object_index = ObjectIndex(index)
+        if not object_index.covers(kind):
+            raise AnsibleError(f'{kind} objects are not part of the object index')
+        default = kwargs.get('default', MISSING)
+        ret = []
+        for term in terms:
+            try:
+                object_id = object_index.resolve((kind,), term)
+            except RadwareModuleError as e:
+                raise AnsibleError(str(e)) from e
+            if object_id is None:
+                if default is MISSING:
+                    raise AnsibleError(f'{kind} {term} not found in the object index')
+                object_id = default
+            ret.append(object_id)
+        return ret
@@ -5,14 +5,35 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.radware.radware_alteon.plugins.module_utils.configuration import ConfigurationArgumentSpec, ConfigurationModule
-from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareBaseModule, radware_server_argument_spec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.configuration import ConfigurationArgumentSpec, ConfigurationModule, \
+    ANSIBLE_TO_SDK_CMD
+from ansible_collections.radware.radware_alteon.plugins.module_utils.bulk import BulkConfigurationArgumentSpec, BulkConfigurationModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareBaseModule, RadwareModuleError, \
+    radware_server_argument_spec, retry_server_spec, lock_server_spec, ha_server_spec, async_server_spec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.retry import RetryPolicy, RetryDeviceConnection
+from ansible_collections.radware.radware_alteon.plugins.module_utils.async_rest import AsyncDeviceConnection, \
+    configurator_read_beans
+from ansible_collections.radware.radware_alteon.plugins.module_utils.device_lock import DeviceLock, LOCK_SECTION_DEVICE
+from ansible_collections.radware.radware_alteon.plugins.module_utils.ha import HighAvailabilityPrimary, ha_role, \
+    HA_MODE_PRIMARY, HA_ROLE_MASTER, HA_ROLE_NONE, MSG_HA_SKIPPED
+from ansible_collections.radware.radware_alteon.plugins.module_utils.capabilities import capabilities_argument_spec, \
+    is_configurator_supported, MSG_NOT_SUPPORTED
+from ansible_collections.radware.radware_alteon.plugins.module_utils.object_index import object_index_argument_spec, \
+    ObjectIndex, CONFIGURATOR_REFERENCES
+from ansible_collections.radware.radware_alteon.plugins.module_utils.index_allocator import IndexAllocator, \
+    allocation_argument_spec, prepare_index, INDEX
+from ansible_collections.radware.radware_alteon.plugins.module_utils.snapshot import snapshot_argument_spec, \
+    load_snapshot, configurator_key, SnapshotConfigurator
+from ansible_collections.radware.radware_alteon.plugins.module_utils.session import session_argument_spec, \
+    ConfigurationSession, SessionConfigurator, REVERT_SCOPE_SESSION, object_fingerprint
 from ansible_collections.radware.radware_alteon.plugins.module_utils.management import ManagementArgumentSpec, ManagementFunctionArgumentSpec, \
     ManagementModule
 try:
     from radware.alteon.api.mgmt import AlteonManagement
     from radware.alteon.api import AlteonDeviceConnection
     from radware.alteon import __minimum_supported_version__
+    from radware.sdk.exceptions import RadwareError
+    from radware.sdk.configurator import MSG_NO_CHANGE
 except ModuleNotFoundError:
     if __name__ == '__main__':
         AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
@@ -54,13 +75,78 @@ class AlteonConfigurationArgumentSpec(ConfigurationArgumentSpec):
         super().__init__(config_class)
         additional_argument_spec = {"revert_on_error": {"required": False, "type": 'bool', "default": False}}
         self.argument_spec.update(additional_argument_spec)
+        self.argument_spec.update(capabilities_argument_spec)
+        self.argument_spec.update(object_index_argument_spec)
+        self.argument_spec.update(snapshot_argument_spec)
+        self.argument_spec.update(session_argument_spec)
+        allocation_argument_spec(self.argument_spec, configurator_key(config_class))
+
+
+class AlteonBulkConfigurationArgumentSpec(BulkConfigurationArgumentSpec):
+
+    def __init__(self, *sections):
+        super().__init__(*sections)
+        additional_argument_spec = {"revert_on_error": {"required": False, "type": 'bool', "default": False}}
+        self.argument_spec.update(additional_argument_spec)
 
 
 class AlteonAnsibleModule(RadwareBaseModule):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._connection = AlteonDeviceConnection(**self.provider)
+        self._connection_details = dict((k, v) for k, v in self.provider.items()
+                                        if k not in retry_server_spec and k not in lock_server_spec and
+                                        k not in ha_server_spec and k not in async_server_spec)
+        self._connection = AsyncDeviceConnection.from_provider(
+            RetryDeviceConnection(AlteonDeviceConnection(**self._connection_details),
+                                  RetryPolicy.from_provider(self.provider)), self.provider, self.module.warn)
         self._mng = AlteonManagement(self._connection)
+        self._ha_role = None
+
+    def device_lock(self, section=None, required=False):
+        """
+        write lock of the device when enabled in the provider or required by the run, None otherwise
+        """
+        if not (self.provider.get('lock') or required) or self.module.check_mode:
+            return None
+        return DeviceLock.from_provider(self.provider, section)
+
+    def exec_locked(self, func, section=None, required=False):
+        lock = self.device_lock(section, required)
+        if lock is None:
+            return func()
+        with lock:
+            result = func()
+        result.update(lock=lock.metrics)
+        return result
+
+    @property
+    def ha_primary(self):
+        return self.provider.get('ha_mode') == HA_MODE_PRIMARY
+
+    def ha_skipped(self):
+        """
+        HA role of the device when HA primary execution leaves it to the config sync of the master, None otherwise
+        """
+        if not self.ha_primary:
+            return None
+        self._ha_role = ha_role(self._mng)
+        if self._ha_role in (HA_ROLE_MASTER, HA_ROLE_NONE):
+            return None
+        return self._ha_role
+
+    @property
+    def ha_commits(self):
+        # changes of the HA master are applied and synced by the module
+        return self.ha_primary and self._ha_role == HA_ROLE_MASTER and not self.module.check_mode
+
+    def _peer_connection(self, server):
+        return RetryDeviceConnection(AlteonDeviceConnection(**dict(self._connection_details, server=server)),
+                                     RetryPolicy.from_provider(self.provider))
+
+    def ha_commit(self, objects):
+        primary = HighAvailabilityPrimary(self._mng, self._connection, self._peer_connection,
+                                          self.provider.get('ha_peers'))
+        return primary.commit(objects)
 
     def module_warn_alteon_version(self):
         self.module.warn(f'please verify your alteon is running a version >= {__minimum_supported_version__}')
@@ -87,8 +173,173 @@ class AlteonManagementModule(AlteonAnsibleModule, ManagementModule):
 class AlteonConfigurationModule(AlteonAnsibleModule, ConfigurationModule):
     def __init__(self, configurator_class, **kwargs):
         AlteonAnsibleModule.__init__(self, **kwargs)
+        self._index_auto = prepare_index(configurator_key(configurator_class), configurator_class,
+                                         self.params.get('parameters'))
+        self._auto_index = None
         ConfigurationModule.__init__(self, configurator_class, **kwargs)
+        self._configurator_class = configurator_class
+        self._revert_on_error = self.params['revert_on_error']
+        self._capabilities = self.params.get('capabilities')
+        self._session = None
+        self._use_snapshot()
+        self._use_session()
+
+    def _use_snapshot(self):
+        snapshot = load_snapshot(self.params.get('snapshot'), self.params.get('snapshot_src'))
+        if snapshot is None:
+            return
+        if not self.module.check_mode:
+            self.module.warn('snapshot is used in check mode only, ignoring')
+            return
+        key = configurator_key(self._configurator_class)
+        if key not in snapshot:
+            self.module.warn(f'{key} entries not found in snapshot, evaluating against the device')
+            return
+        # check mode reads are answered from the snapshot, the device is not contacted
+        self._configurator = SnapshotConfigurator(self._configurator, snapshot[key])
+
+    def _use_session(self):
+        if self.module.check_mode:
+            return
+        revert_scope_session = self._revert_on_error and self.params.get('revert_scope') == REVERT_SCOPE_SESSION
+        if not revert_scope_session and self.params.get('expected_fingerprint') is None:
+            return
+        self._session = ConfigurationSession(self._configurator, self.params.get('expected_fingerprint'))
+        self._configurator = SessionConfigurator(self._configurator, self._session)
+
+    @property
+    def _base(self):
+        return self
+
+    @property
+    def _device_mng(self):
+        return self._mng
+
+    @property
+    def _device_connection(self):
+        return self._connection
+
+    @property
+    def revert_on_error(self):
+        return self._revert_on_error
+
+    def _on_error(self):
+        if not self._capabilities:
+            self.module_warn_alteon_version()
+        if self._revert_on_error:
+            if self._session is not None and self.params.get('revert_scope') == REVERT_SCOPE_SESSION:
+                # only the objects written by this run are restored, other pending changes are kept
+                failed = self._session.revert(self._config_manager)
+                if failed:
+                    self.module.warn(f'unable to restore {", ".join(", ".join(key) for key in failed)}')
+            else:
+                self._mng.config.revert()
+
+    def exec_module(self):
+        # capabilities gathered once per host by alteon_device_capabilities spare the device round trip
+        if self._capabilities:
+            if not self._capabilities.get('version_supported', True):
+                self.module_warn_alteon_version()
+            if not is_configurator_supported(self._capabilities, self._configurator_class):
+                self.module.warn(f'{self._configurator_class.__name__} is not supported on '
+                                 f'{self._capabilities.get("form_factor")} devices, skipping')
+                return dict(changed=False, status=MSG_NOT_SUPPORTED, obj=None)
+        if self._index_auto and self._state in ('read', 'absent'):
+            if self._find_index() is None:
+                return dict(changed=False, status='not found' if self._state == 'read' else MSG_NO_CHANGE, obj=None)
+        if self._state == 'read':
+            self._prefetch_object()
+            result = super().exec_module()
+            # passed back as expected_fingerprint, a later write fails when another writer changed the object meanwhile
+            result.update(fingerprint=object_fingerprint(result.get('obj')))
+            if self._auto_index is not None:
+                result.update(index=self._auto_index)
+            return result
+        role = self.ha_skipped()
+        if role is not None:
+            return dict(changed=False, status=MSG_HA_SKIPPED, obj=None, ha=dict(role=role))
+        resolved = self._resolve_references()
+        # the expected fingerprint is checked once the lock is held, no writer lands between the check and the write
+        # the HA master applies its changes, the whole device is locked
+        # allocated indexes are handed out under the lock, concurrent tasks of the device allocate one at a time
+        result = self.exec_locked(self._exec_session, LOCK_SECTION_DEVICE if self.ha_primary else None,
+                                  required=self._index_auto)
+        if resolved:
+            result.update(resolved=resolved)
+        if self._auto_index is not None:
+            result.update(index=self._auto_index)
+        return result
+
+    def _index_allocator(self):
+        object_index = ObjectIndex(self.params['object_index']) if self.params.get('object_index') else None
+        return IndexAllocator(self._configurator_class(self._connection), configurator_key(self._configurator_class),
+                              self._connection, object_index)
+
+    def _set_index(self, index):
+        self.params['parameters'][INDEX] = index
+        self.arguments.set_attributes(**{INDEX: index})
+
+    def _find_index(self):
+        self._auto_index = self._index_allocator().find(self.params['parameters'])
+        if self._auto_index is not None:
+            self._set_index(self._auto_index)
+        return self._auto_index
+
+    def _allocate_index(self):
+        if not self._index_auto:
+            return
+        self._auto_index = self._index_allocator().allocate(self.params['parameters'])
+        self._set_index(self._auto_index)
+
+    def _resolve_references(self):
+        """
+        referenced objects are checked against the object index gathered once per host by alteon_device_object_index,
+        names are replaced with their index. unresolved references fail the task before the device is written
+        """
+        references = CONFIGURATOR_REFERENCES.get(configurator_key(self._configurator_class))
+        if not self.params.get('object_index') or not references or self._state == 'absent':
+            return None
+        # check mode snapshot runs do not contact the device
+        connection = None if isinstance(self._configurator, SnapshotConfigurator) else self._connection
+        object_index = ObjectIndex(self.params['object_index'], connection)
+        try:
+            resolved, missing = object_index.resolve_parameters(references, self.params['parameters'])
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+        if missing:
+            raise RadwareModuleError(f'reference validation failed: unresolved {", ".join(missing)}')
+        if resolved:
+            self.arguments.set_attributes(**self.params['parameters'])
+        return resolved
+
+    def _prefetch_object(self):
+        # the beans of the object are read concurrently ahead of the sequential SDK read
+        if isinstance(self._configurator, SnapshotConfigurator) or \
+                (self._state != 'read' and self._state not in ANSIBLE_TO_SDK_CMD):
+            return
+        self._connection.prefetch(configurator_read_beans(self._configurator_class(self._connection), self.arguments))
+
+    def _exec_session(self):
+        self._allocate_index()
+        self._prefetch_object()
+        if self._session is not None:
+            try:
+                self._session.begin(self.arguments)
+            except RadwareError as e:
+                raise RadwareModuleError(e) from e
+        result = super().exec_module()
+        if self.ha_commits and result.get('changed'):
+            result.update(ha=self.ha_commit([(self._configurator_class, self.arguments)]))
+        return result
+
+
+class AlteonBulkConfigurationModule(AlteonAnsibleModule, BulkConfigurationModule):
+    def __init__(self, sections, **kwargs):
+        AlteonAnsibleModule.__init__(self, **kwargs)
+        BulkConfigurationModule.__init__(self, sections, **kwargs)
         self._revert_on_error = self.params['revert_on_error']
+        if self.params.get('object_index'):
+            self._object_index = ObjectIndex(self.params['object_index'])
 
     @property
     def _base(self):
@@ -110,3 +361,34 @@ class AlteonConfigurationModule(AlteonAnsibleModule, ConfigurationModule):
         self.module_warn_alteon_version()
         if self._revert_on_error:
             self._mng.config.revert()
+
+    def _changed_objects(self):
+        sections = dict(self._sections)
+        objects = {}
+        for change in self.changes:
+            config_class = sections[change['section']]
+            key = (change['section'], tuple(sorted(change['id'].items())))
+            objects[key] = (config_class, config_class.get_parameters_class().get_instance(**change['id']))
+        return list(objects.values())
+
+    def _exec_and_apply(self):
+        # modules declaring `apply` commit the whole run with a single apply once every section is written
+        result = BulkConfigurationModule.exec_module(self)
+        if self.ha_commits and self.changed:
+            result.update(ha=self.ha_commit(self._changed_objects()))
+        elif self.params.get('apply') and self.changed and not self.module.check_mode:
+            try:
+                self._mng.config.apply()
+            except RadwareError as e:
+                self._on_error()
+                raise RadwareModuleError(e) from e
+            result.update(applied=True)
+        return result
+
+    def exec_module(self):
+        role = self.ha_skipped()
+        if role is not None:
+            return dict(changed=False, status=MSG_HA_SKIPPED, changes=[], ha=dict(role=role))
+        if self.params.get('apply') or self.ha_primary:
+            return self.exec_locked(self._exec_and_apply, LOCK_SECTION_DEVICE)
+        return self.exec_locked(self._exec_and_apply)
@@ -0,0 +1,209 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import async_server_spec
+try:
+    from radware.sdk.exceptions import RadwareError
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The radware-sdk-common package is required")
+
+
+DOCUMENTATION = r'''
+module: Device concurrent read engine module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+DEFAULT_READ_CONCURRENCY = async_server_spec['read_concurrency']['default']
+
+
+def _keep_alive_pool(rest):
+    """
+    urllib3 pool manager of the SDK REST client, None when the installed SDK does not expose it
+    """
+    pool_manager = getattr(getattr(rest, '_rest_client', None), 'http', None)
+    if not isinstance(getattr(pool_manager, 'connection_pool_kw', None), dict) or \
+            not callable(getattr(pool_manager, 'clear', None)):
+        return None
+    return pool_manager
+
+
+def _size_keep_alive_pool(rest, size):
+    # the SDK keeps a single keep-alive connection per device when certificates are validated, concurrent reads
+    # would open and drop a connection each. the pool is private to the SDK, it is resized only when found
+    pool_manager = _keep_alive_pool(rest)
+    if pool_manager is None:
+        return False
+    if pool_manager.connection_pool_kw.get('maxsize', 1) < size:
+        pool_manager.connection_pool_kw['maxsize'] = size
+        pool_manager.clear()
+    return True
+
+
+class AsyncDeviceAPI(object):
+    """
+    asyncio engine running independent device reads concurrently over the keep-alive connections of the SDK REST
+    client, bounded by a semaphore
+    the SDK client is blocking, every call runs in a worker thread of the engine. the sync functions are thin
+    wrappers running the coroutines to completion and returning the results in call order
+    reads run one at a time when the keep-alive pool of the SDK REST client cannot be sized for the concurrency
+    """
+    def __init__(self, rest, concurrency=DEFAULT_READ_CONCURRENCY, warn=None):
+        self._rest = rest
+        self.concurrency = max(1, concurrency or 1)
+        if self.concurrency > 1 and not _size_keep_alive_pool(rest, self.concurrency):
+            if warn is not None:
+                warn(f'read_concurrency {self.concurrency} is not supported by the installed SDK REST client, '
+                     f'reading one table at a time')
+            self.concurrency = 1
+
+    @staticmethod
+    async def _call(semaphore, executor, func, *args):
+        async with semaphore:
+            return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    async def gather(self, calls):
+        """
+        coroutine running the (function, *args) calls with at most `concurrency` of them in flight
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return await asyncio.gather(*(self._call(semaphore, executor, func, *args) for func, *args in calls))
+
+    @staticmethod
+    def _loop_running():
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def run_all(self, calls):
+        """
+        run the (function, *args) calls concurrently and return their results in call order
+        the first error is raised once the running calls completed, calls not started yet are dropped.
+        calls run in order on the current thread with a concurrency of one or from a running event loop
+        """
+        calls = list(calls)
+        if self.concurrency == 1 or len(calls) < 2 or self._loop_running():
+            return [func(*args) for func, *args in calls]
+        return asyncio.run(self.gather(calls))
+
+    def read_all_many(self, beans):
+        return self.run_all((self._rest.read_all, bean) for bean in beans)
+
+
+def _query_key(bean):
+    return type(bean), tuple(sorted((k, str(v)) for k, v in bean.__dict__.items() if v is not None))
+
+
+class PrefetchDeviceAPI(object):
+    """
+    device REST API answering reads from results fetched ahead concurrently
+    a prefetched result answers the first identical read only, any write drops every prefetched result
+    """
+    def __init__(self, rest, engine):
+        self._rest = rest
+        self._engine = engine
+        self._prefetched = {}
+        self.hits = 0
+
+    def _fetch(self, bean):
+        # a failed read is not kept, the caller read raises the error in place
+        try:
+            return True, self._rest.read_all(bean)
+        except RadwareError:
+            return False, None
+
+    def prefetch(self, beans):
+        beans = dict((_query_key(bean), bean) for bean in beans)
+        results = self._engine.run_all((self._fetch, bean) for bean in beans.values())
+        self._prefetched.update((key, result) for key, (fetched, result) in zip(beans.keys(), results) if fetched)
+
+    def read_all(self, bean, retries=3, timeout=None):
+        key = _query_key(bean)
+        if key in self._prefetched:
+            self.hits += 1
+            return self._prefetched.pop(key)
+        return self._rest.read_all(bean, retries, timeout)
+
+    def read(self, bean, retries=3, timeout=None):
+        if not hasattr(bean, 'get_index_names'):
+            return self.read_all(bean, retries, timeout)
+        result = self.read_all(bean, retries, timeout)
+        if result:
+            return result[0]
+
+    def update(self, bean, retries=3, dry_run=False, timeout=None):
+        if not dry_run:
+            self._prefetched.clear()
+        return self._rest.update(bean, retries=retries, dry_run=dry_run, timeout=timeout)
+
+    def delete(self, bean, retries=3, dry_run=False):
+        if not dry_run:
+            self._prefetched.clear()
+        return self._rest.delete(bean, retries=retries, dry_run=dry_run)
+
+    def __getattr__(self, item):
+        return getattr(self._rest, item)
+
+
+class AsyncDeviceConnection(object):
+    """
+    device connection with a concurrent read engine, reads are served from the prefetched results when available
+    """
+    def __init__(self, connection, concurrency=DEFAULT_READ_CONCURRENCY, warn=None):
+        self._connection = connection
+        self._concurrency = concurrency
+        self._warn = warn
+        self._rest = None
+        self._prefetch_rest = None
+        self._engine = None
+
+    @classmethod
+    def from_provider(cls, connection, provider, warn=None):
+        return cls(connection, (provider or {}).get('read_concurrency', DEFAULT_READ_CONCURRENCY), warn)
+
+    def _bind(self):
+        # the SDK replaces the REST client when the connection details are updated
+        if self._rest is not self._connection.rest:
+            self._rest = self._connection.rest
+            self._engine = AsyncDeviceAPI(self._rest, self._concurrency, self._warn)
+            self._prefetch_rest = PrefetchDeviceAPI(self._rest, self._engine)
+
+    @property
+    def rest(self):
+        self._bind()
+        return self._prefetch_rest
+
+    @property
+    def engine(self):
+        self._bind()
+        return self._engine
+
+    def prefetch(self, beans):
+        self.rest.prefetch(beans)
+
+    def __getattr__(self, item):
+        return getattr(self._connection, item)
+
+
+def configurator_read_beans(configurator, parameters):
+    """
+    queries of the SDK object read of a configurator, one per bean of its bean map
+    configurators reading their objects differently leave the prefetched results unused
+    """
+    try:
+        parameters = configurator._validate_prepare_parameters(parameters)
+    except RadwareError:
+        # invalid parameters are reported by the configurator run
+        return []
+    return [configurator._get_bean_instance(bean_class, parameters, bean_keys['attrs'])
+            for bean_class, bean_keys in configurator._bean_map.items()]
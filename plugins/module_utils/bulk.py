@@ -0,0 +1,446 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+import hashlib
+import json
+from abc import abstractmethod
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import BaseAPI, RadwareModuleError, radware_server_argument_spec, \
+    build_specs_from_annotation
+try:
+    from radware.sdk.exceptions import RadwareError
+    from radware.sdk.configurator import DeviceConfigurationManager, DeviceConfigurator
+    from radware.sdk.beans_common import BaseBeanEnum, READ_PROP
+    from radware.sdk.common import RadwareParametersStruct, PasswordArgument, get_annotation_class, get_type_hints, \
+        is_annotation_type_list_incl_optional_lookup
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Device Bulk Configurator module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+BULK_STATE = ['present', 'absent', 'append']
+BULK_TO_SDK_CMD = {
+    'present': 'update',
+    'absent': 'delete',
+    'append': 'update'
+}
+
+
+def _bean_key_value(value):
+    if isinstance(value, BaseBeanEnum):
+        return str(value.value)
+    return str(value)
+
+
+def entry_fingerprint(values):
+    """
+    stable digest of the provided (non None) entry values, two entries with the same fingerprint configure the
+    same object identically
+    """
+    provided = dict((k, v) for k, v in values.items() if v is not None)
+    return hashlib.sha256(json.dumps(provided, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class DeviceTableCache(object):
+    """
+    read-through cache in front of the device REST API
+    every indexed table is fetched once as a whole and the rows are served locally to configurators bound
+    to the cache. writes are forwarded to the device and applied to the cached rows so later reads in the
+    same run (e.g. used index lookups) stay coherent
+    """
+    def __init__(self, rest):
+        self._rest = rest
+        self._tables = {}
+        self._prefixes = {}
+        self._scalars = {}
+        self.table_reads = 0
+
+    @staticmethod
+    def _is_table(bean):
+        return hasattr(bean, 'get_index_names')
+
+    @staticmethod
+    def _index_values(bean):
+        values = []
+        for idx in bean.get_index_names():
+            val = getattr(bean, idx)
+            if val is None or val is READ_PROP:
+                values.append(None)
+            else:
+                # the SDK sends empty string indexes (e.g. SNMPv3 context prefix) as a blank
+                values.append(_bean_key_value(val).strip())
+        return tuple(values)
+
+    def table(self, bean_class):
+        # rows keyed by their full index tuple
+        if bean_class not in self._tables:
+            rows = {}
+            for row in self._rest.read_all(bean_class()) or []:
+                rows[self._index_values(row)] = row
+            self._tables[bean_class] = rows
+            self.table_reads += 1
+        return self._tables[bean_class]
+
+    def _prefix_keys(self, bean_class, first):
+        # row keys grouped by their first index, serves the sub table reads (e.g. the metrics of one rule)
+        if bean_class not in self._prefixes:
+            prefixes = {}
+            for row_key in self.table(bean_class):
+                prefixes.setdefault(row_key[0], []).append(row_key)
+            self._prefixes[bean_class] = prefixes
+        return self._prefixes[bean_class].get(first, [])
+
+    def _lookup(self, bean):
+        rows = self.table(type(bean))
+        key = self._index_values(bean)
+        if None not in key:
+            row = rows.get(key)
+            return [row] if row is not None else []
+        if key[0] is not None:
+            candidates = ((row_key, rows[row_key]) for row_key in self._prefix_keys(type(bean), key[0]))
+        else:
+            candidates = rows.items()
+        return [row for row_key, row in candidates if all(k is None or k == row_k for k, row_k in zip(key, row_key))]
+
+    def read_all(self, bean, retries=3, timeout=None):
+        if not self._is_table(bean):
+            key = (type(bean), tuple(sorted(k for k, v in bean.__dict__.items() if v is not None)))
+            if key not in self._scalars:
+                self._scalars[key] = self._rest.read_all(bean, retries, timeout)
+            return copy.copy(self._scalars[key])
+        return [copy.copy(row) for row in self._lookup(bean)]
+
+    def read(self, bean, retries=3, timeout=None):
+        result = self.read_all(bean, retries, timeout)
+        if not self._is_table(bean):
+            return result
+        if result:
+            return result[0]
+
+    def update(self, bean, retries=3, dry_run=False, timeout=None):
+        if dry_run:
+            return True
+        result = self._rest.update(bean, retries=retries, timeout=timeout)
+        self._scalars.clear()
+        if self._is_table(bean) and type(bean) in self._tables:
+            matched = self._lookup(bean)
+            if matched:
+                for k, v in bean.__dict__.items():
+                    if v is not None and v is not READ_PROP:
+                        setattr(matched[0], k, v)
+            else:
+                self._tables[type(bean)][self._index_values(bean)] = copy.copy(bean)
+                self._prefixes.pop(type(bean), None)
+        return result
+
+    def delete(self, bean, retries=3, dry_run=False):
+        if dry_run:
+            return True
+        result = self._rest.delete(bean, retries=retries)
+        self._scalars.clear()
+        if self._is_table(bean) and type(bean) in self._tables:
+            rows = self._tables[type(bean)]
+            for row in self._lookup(bean):
+                rows.pop(self._index_values(row), None)
+            self._prefixes.pop(type(bean), None)
+        return result
+
+    def __getattr__(self, item):
+        # any other REST function (file objects, no-translation reads) goes directly to the device
+        return getattr(self._rest, item)
+
+
+class CachedDeviceConnection(object):
+    """
+    device connection facade exposing a `DeviceTableCache` as its REST connector
+    """
+    def __init__(self, connection, cache):
+        self._connection = connection
+        self._cache = cache
+        self.id = connection.id
+
+    @property
+    def rest(self):
+        return self._cache
+
+    def get_connection_details(self):
+        return self._connection.get_connection_details()
+
+
+class ReferenceIndex(object):
+    """
+    name index of objects referenced by configurator parameters
+    references map a parameter field (`field` or `list_field.item_field`) to one or more (bean class, index attribute)
+    tables, each referenced table is read once through the table cache
+    objects found in the object index of the device skip the table read, tables are only read on a miss
+    """
+    def __init__(self, cache, references, object_index=None):
+        self._cache = cache
+        self._references = references or {}
+        self._object_index = object_index
+        self._names = {}
+
+    def names(self, field):
+        if field not in self._names:
+            names = set()
+            for bean_class, index_attr in self._references[field]:
+                for row in self._cache.table(bean_class).values():
+                    names.add(_bean_key_value(getattr(row, index_attr)))
+            self._names[field] = names
+        return self._names[field]
+
+    def _indexed(self, field, value):
+        if self._object_index is None:
+            return False
+        for bean_class, index_attr in self._references[field]:
+            ids = self._object_index.table_ids(bean_class)
+            if ids is not None and value in ids:
+                return True
+        return False
+
+    def exists(self, field, value):
+        value = _bean_key_value(value)
+        return self._indexed(field, value) or value in self.names(field)
+
+    def unresolved(self, entry):
+        missing = []
+        for field in self._references:
+            if '.' in field:
+                list_field, item_field = field.split('.', 1)
+                values = [item.get(item_field) for item in entry.get(list_field) or [] if item]
+            else:
+                values = [entry.get(field)]
+            for value in values:
+                if value is not None and value != '' and not self.exists(field, value):
+                    missing.append(f'{field}={value}')
+        return missing
+
+
+class CompiledEntryMatcher(object):
+    """
+    parameter field to bean attribute mapping compiled once per configurator
+    supported for flat parameter structs kept in direct indexed bean tables. an entry matching the cached rows on
+    every provided field is unchanged and skips the SDK dry run evaluation
+    """
+    def __init__(self, configurator):
+        params_class = configurator.get_parameters_class()
+        self.required = params_class().get_required_fields()
+        self.supported = True
+        self._tables = []
+        for k, v in get_type_hints(params_class).items():
+            annotation_class = get_annotation_class(v)
+            if is_annotation_type_list_incl_optional_lookup(v) or annotation_class == PasswordArgument or \
+                    issubclass(annotation_class, RadwareParametersStruct):
+                self.supported = False
+        for bean_class, bean_keys in configurator._bean_map.items():
+            if not bean_keys['direct'] or bean_keys['struct'] != params_class or \
+                    not hasattr(bean_class, 'get_index_names'):
+                self.supported = False
+                continue
+            attrs = bean_keys['attrs']
+            if any(idx not in attrs or attrs[idx] not in self.required for idx in bean_class.get_index_names()):
+                self.supported = False
+                continue
+            fields = {v: k for k, v in attrs.items() if v not in self.required}
+            self._tables.append((bean_class, bean_class.get_index_names(), attrs, fields))
+
+    def key(self, entry):
+        return tuple(_bean_key_value(entry.get(field)) for field in self.required)
+
+    def matches(self, cache, entry):
+        if not self.supported:
+            return False
+        checked = set()
+        for bean_class, index_names, attrs, fields in self._tables:
+            query = bean_class()
+            for idx in index_names:
+                setattr(query, idx, entry.get(attrs[idx]))
+            row = cache.read(query)
+            if row is None:
+                return False
+            for field, attr in fields.items():
+                value = entry.get(field)
+                if value is None:
+                    continue
+                row_value = getattr(row, attr)
+                if isinstance(row_value, BaseBeanEnum):
+                    row_value = row_value.name
+                if row_value != value:
+                    return False
+                checked.add(field)
+        return all(entry.get(field) is None or field in checked or field in self.required for field in entry)
+
+
+class BulkConfigurationArgumentSpec(object):
+    def __init__(self, *sections):
+        self.supports_check_mode = True
+        argument_spec = {"state": {"required": False, "choices": BULK_STATE, "default": 'present'},
+                         "validate_references": {"required": False, "type": "bool", "default": True}}
+        for name, config_class in sections:
+            argument_spec.update({name: {"required": False, "type": "list", "elements": "dict", "default": [],
+                                         "options": build_specs_from_annotation(config_class.get_parameters_class())}})
+        self.argument_spec = {}
+        self.argument_spec.update(radware_server_argument_spec)
+        self.argument_spec.update(argument_spec)
+
+
+class BulkConfigurationModule(BaseAPI):
+    """
+    apply many configurator entries in one run
+    current device configuration is read once per table through `DeviceTableCache`, each entry is evaluated
+    locally with the SDK dry run and only changed entries are written to the device.
+    sections are (parameter name, configurator class) pairs, written in order and deleted in reverse order
+    """
+    def __init__(self, sections, references=None, **kwargs):
+        self._sections = sections
+        self._state = self._base.params['state']
+        self._differential_update = self._state == 'present'
+        self._validate_references = self._base.params.get('validate_references', True)
+        self._config_manager = DeviceConfigurationManager()
+        self._cache = DeviceTableCache(self._device_connection.rest)
+        self._cached_connection = CachedDeviceConnection(self._device_connection, self._cache)
+        self._references = references or {}
+        self._object_index = None
+        self.result = {}
+        self.changed = False
+        self.changes = []
+        if hasattr(self._base.module, '_diff'):
+            self._report_diff = getattr(self._base.module, '_diff')
+        else:
+            self._report_diff = False
+
+    @abstractmethod
+    def _on_error(self):
+        pass
+
+    @property
+    def command(self):
+        return BULK_TO_SDK_CMD[self._state]
+
+    def _section_entries(self, name):
+        return self._base.params.get(name) or []
+
+    def _device_entries(self, name):
+        """
+        current device entries of an indexed section in parameters format, read from the table cache
+        entries spread over several tables are merged by their required fields
+        """
+        configurator = dict(self._sections)[name](self._cached_connection)
+        params_class = configurator.get_parameters_class()
+        required = params_class().get_required_fields()
+        entries = {}
+        for bean_class, bean_keys in configurator._bean_map.items():
+            if not bean_keys['direct'] or bean_keys['struct'] != params_class or \
+                    not hasattr(bean_class, 'get_index_names'):
+                continue
+            for row in self._cache.table(bean_class).values():
+                entry = {}
+                for attr, field in bean_keys['attrs'].items():
+                    value = getattr(row, attr)
+                    entry[field] = value.name if isinstance(value, BaseBeanEnum) else value
+                entries.setdefault(tuple(_bean_key_value(entry.get(field)) for field in required), {}).update(entry)
+        return list(entries.values())
+
+    @staticmethod
+    def _has_changes(diff):
+        if not diff:
+            return False
+        return bool(diff.get(DeviceConfigurationManager.DIFF_APPEND_KEY) or
+                    diff.get(DeviceConfigurationManager.DIFF_REMOVE_KEY))
+
+    def validate_references(self):
+        errors = []
+        for name, config_class in self._sections:
+            if name not in self._references:
+                continue
+            ref_index = ReferenceIndex(self._cache, self._references[name], self._object_index)
+            for position, entry in enumerate(self._section_entries(name)):
+                missing = ref_index.unresolved(entry)
+                if missing:
+                    errors.append(f'{name}[{position}]: unresolved {", ".join(missing)}')
+        if errors:
+            raise RadwareModuleError('reference validation failed:\n' + '\n'.join(errors))
+
+    def _purge_scope(self, name):
+        # sections supporting purge return the required fields shared by all their entries
+        return None
+
+    def _exec_entry(self, name, configurator, matcher, entry):
+        if self._state != 'absent' and matcher.matches(self._cache, entry):
+            return
+        arguments = configurator.get_parameters_class()()
+        arguments.set_attributes(**entry)
+        evaluation = self._config_manager.execute(configurator, self.command, arguments, dry_run=True,
+                                                  differential=self._differential_update, write_on_change=True,
+                                                  get_diff=True)
+        if not self._has_changes(evaluation.diff):
+            return
+        if not self._base.module.check_mode:
+            arguments = configurator.get_parameters_class()()
+            arguments.set_attributes(**entry)
+            self._config_manager.execute(configurator, self.command, arguments, dry_run=False,
+                                         differential=self._differential_update, write_on_change=False,
+                                         get_diff=False)
+        self._add_change(name, self.command, {k: entry.get(k) for k in matcher.required}, evaluation.diff)
+
+    def _add_change(self, name, command, entry_id, diff=None):
+        change = {"section": name, "command": command, "id": entry_id}
+        if self._report_diff and diff is not None:
+            change.update(diff=diff)
+        self.changes.append(change)
+
+    def _purge_section(self, name, configurator, matcher):
+        # delete device entries in the section scope which are not part of the desired entries
+        scope = self._purge_scope(name)
+        if scope is None:
+            return
+        desired = set(matcher.key(entry) for entry in self._section_entries(name))
+        query = configurator._entry_bean_instance(configurator.get_parameters_class().get_instance(**scope))
+        attrs = configurator._bean_map[type(query)]['attrs']
+        for row in self._cache.read_all(query):
+            current = {attrs[idx]: getattr(row, idx) for idx in row.get_index_names() if idx in attrs}
+            if matcher.key(current) in desired:
+                continue
+            arguments = configurator.get_parameters_class().get_instance(**current)
+            self._config_manager.execute(configurator, DeviceConfigurator.DELETE, arguments,
+                                         dry_run=self._base.module.check_mode)
+            self._add_change(name, DeviceConfigurator.DELETE, current)
+
+    def exec_module(self):
+        sections = self._sections
+        if self._state == 'absent':
+            sections = list(reversed(sections))
+        total = 0
+        try:
+            if self._validate_references and self._state != 'absent':
+                self.validate_references()
+            configurators = {}
+            for name, config_class in sections:
+                configurator = config_class(self._cached_connection)
+                matcher = CompiledEntryMatcher(configurator)
+                configurators[name] = (configurator, matcher)
+                for entry in self._section_entries(name):
+                    self._exec_entry(name, configurator, matcher, entry)
+                    total += 1
+            if self._base.params.get('purge') and self._state == 'present':
+                for name, config_class in reversed(sections):
+                    self._purge_section(name, *configurators[name])
+        except RadwareError as e:
+            self._on_error()
+            raise RadwareModuleError(e) from e
+
+        self.changed = len(self.changes) > 0
+        self.result.update(changed=self.changed, changes=self.changes,
+                           status=f'{len(self.changes)} of {total} entries changed',
+                           table_reads=self._cache.table_reads)
+        return self.result
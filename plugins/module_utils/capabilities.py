@@ -0,0 +1,107 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+try:
+    from typing import get_type_hints
+    from radware.alteon import __minimum_supported_version__
+    from radware.alteon.api.config import AlteonConfigurators
+    from radware.alteon.sdk.configurators.system_vx_peer_syncronization import VXPeerSyncConfigurator
+    from radware.alteon.sdk.configurators.vadc_instance import VADCInstanceConfigurator
+    from radware.alteon.sdk.configurators.spanning_tree import SpanningTreeConfigurator
+    from radware.alteon.sdk.configurators.l2_lldp import LLDPConfigurator
+    from radware.alteon.sdk.configurators.system_time_date import SystemTimeDateConfigurator
+    from radware.alteon.sdk.configurators.lacp_aggregation import LACPAggregationConfigurator
+    from radware.alteon.sdk.configurators.system_dns_client import SystemDNSClientConfigurator
+    from radware.alteon.sdk.configurators.l3_bootp_relay import BOOTPRelayConfigurator
+    from radware.alteon.sdk.configurators.ha_configuration_sync import ConfigurationSyncConfigurator
+    from radware.alteon.sdk.configurators.high_availability import HighAvailabilityConfigurator
+    from radware.alteon.sdk.configurators.global_traffic_redirection import GlobalRedirectionConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Alteon device capabilities module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+CAPABILITIES_FACTS = 'alteon_capabilities'
+MSG_NOT_SUPPORTED = 'not supported'
+
+capabilities_argument_spec = {
+    'capabilities': {"required": False, "type": 'dict'}
+}
+
+
+def _version_tuple(version):
+    result = []
+    for part in str(version).split('.'):
+        digits = ''.join(c for c in part if c.isdigit())
+        result.append(int(digits) if digits else 0)
+    return tuple(result)
+
+
+def is_version_supported(version, minimum_versions=None):
+    """
+    minimum versions are given per major release, a version of an unlisted major is supported
+    when it is newer than all the listed majors
+    """
+    if minimum_versions is None:
+        minimum_versions = __minimum_supported_version__
+    if not version:
+        return False
+    current = _version_tuple(version)
+    minimums = sorted(_version_tuple(v) for v in minimum_versions)
+    for minimum in minimums:
+        if current[0] == minimum[0]:
+            return current >= minimum
+    return current[0] > minimums[-1][0]
+
+
+def platform_unsupported_configurators(is_vx, is_container):
+    unsupported = []
+    if not is_vx:
+        unsupported.extend([VADCInstanceConfigurator, VXPeerSyncConfigurator])
+    if not is_container:
+        unsupported.extend([SystemTimeDateConfigurator, SpanningTreeConfigurator, LLDPConfigurator,
+                            LACPAggregationConfigurator])
+    if is_vx:
+        unsupported.extend([SystemDNSClientConfigurator, BOOTPRelayConfigurator, ConfigurationSyncConfigurator,
+                            HighAvailabilityConfigurator, GlobalRedirectionConfigurator])
+    return unsupported
+
+
+def probe_capabilities(device_mng):
+    form_factor = device_mng.info.form_factor
+    form_factor_lower = (form_factor or '').lower()
+    is_vx = form_factor_lower == 'vx'
+    is_container = form_factor_lower in ['vx', 'standalone']
+    software_version = device_mng.info.software
+
+    unsupported = platform_unsupported_configurators(is_vx, is_container)
+    unsupported_configurators = [k for k, v in get_type_hints(AlteonConfigurators).items() if v in unsupported]
+    return dict(form_factor=form_factor,
+                is_vx=is_vx,
+                is_container=is_container,
+                is_standalone=form_factor_lower == 'standalone',
+                is_vadc=form_factor_lower == 'vadc',
+                software_version=software_version,
+                minimum_supported_version=list(__minimum_supported_version__),
+                version_supported=is_version_supported(software_version),
+                unsupported_configurators=sorted(unsupported_configurators))
+
+
+def is_configurator_supported(capabilities, configurator_class):
+    if not capabilities:
+        return True
+    unsupported = capabilities.get('unsupported_configurators') or []
+    for k, v in get_type_hints(AlteonConfigurators).items():
+        if v is configurator_class and k in unsupported:
+            return False
+    return True
@@ -72,10 +72,85 @@ radware_vdirect_workflow_provider = {
         "required": False}
 }
 
+retry_server_spec = {
+    'retries': {
+        "required": False,
+        "type": 'int',
+        "fallback": (env_fallback, ['RADWARE_RETRIES']),
+        "default": 3},
+    'retry_backoff': {
+        "required": False,
+        "type": 'float',
+        "fallback": (env_fallback, ['RADWARE_RETRY_BACKOFF']),
+        "default": 0.5},
+    'retry_max_backoff': {
+        "required": False,
+        "type": 'float',
+        "fallback": (env_fallback, ['RADWARE_RETRY_MAX_BACKOFF']),
+        "default": 10.0},
+    'retry_on_status': {
+        "required": False,
+        "type": 'list',
+        "elements": 'int',
+        "default": [500, 502, 503, 504]}
+}
+
+lock_server_spec = {
+    'lock': {
+        "required": False,
+        "type": 'bool',
+        "fallback": (env_fallback, ['RADWARE_LOCK']),
+        "default": False},
+    'lock_section': {
+        "required": False,
+        "type": 'str',
+        "fallback": (env_fallback, ['RADWARE_LOCK_SECTION']),
+        "default": 'device'},
+    'lock_dir': {
+        "required": False,
+        "type": 'path',
+        "fallback": (env_fallback, ['RADWARE_LOCK_DIR'])},
+    'lock_timeout': {
+        "required": False,
+        "type": 'int',
+        "fallback": (env_fallback, ['RADWARE_LOCK_TIMEOUT']),
+        "default": 600},
+    'lock_lease': {
+        "required": False,
+        "type": 'int',
+        "fallback": (env_fallback, ['RADWARE_LOCK_LEASE']),
+        "default": 900}
+}
+
+ha_server_spec = {
+    'ha_mode': {
+        "required": False,
+        "type": 'str',
+        "choices": ['all', 'primary'],
+        "fallback": (env_fallback, ['RADWARE_HA_MODE']),
+        "default": 'all'},
+    'ha_peers': {
+        "required": False,
+        "type": 'list',
+        "elements": 'str'}
+}
+
+async_server_spec = {
+    'read_concurrency': {
+        "required": False,
+        "type": 'int',
+        "fallback": (env_fallback, ['RADWARE_READ_CONCURRENCY']),
+        "default": 1}
+}
+
 radware_server_spec = {}
 radware_server_spec.update(radware_provider_spec)
 radware_server_spec.update(ssh_server_spec)
 radware_server_spec.update(https_server_spec)
+radware_server_spec.update(retry_server_spec)
+radware_server_spec.update(lock_server_spec)
+radware_server_spec.update(ha_server_spec)
+radware_server_spec.update(async_server_spec)
 
 radware_vdirect_workflow_spec = {}
 radware_vdirect_workflow_spec.update(radware_provider_spec)
@@ -8,6 +8,7 @@ from abc import abstractmethod
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.radware.radware_alteon.plugins.module_utils.common import BaseAPI, RadwareModuleError, radware_server_argument_spec, \
     build_specs_from_annotation
+from ansible_collections.radware.radware_alteon.plugins.module_utils.diff import patch_configuration, list_identity_fields
 try:
     from radware.sdk.exceptions import RadwareError
     from radware.sdk.configurator import DeviceConfigurationManager, MSG_NO_CHANGE
@@ -107,23 +108,7 @@ class ConfigurationModule(BaseAPI):
             if device_current is None:
                 return self._base.params['parameters']
             if self._base.module.check_mode:
-                if '---' in self.changes:
-                    for key in self.changes['---'].keys():
-                        if key in device_current:
-                            if type(self.changes['---'][key]) == list:
-                                for item in self.changes['---'][key]:
-                                    device_current[key].remove(item)
-                            else:
-                                del device_current[key]
-                if '+++' in self.changes:
-                    for key in self.changes['+++'].keys():
-                        if type(self.changes['+++'][key]) == list:
-                            if type(device_current[key]) != list:
-                                device_current[key] = []
-                            for item in self.changes['+++'][key]:
-                                device_current[key].append(item)
-                        else:
-                            device_current[key] = self.changes['+++'][key]
+                patch_configuration(device_current, self.changes, list_identity_fields(type(self.arguments)))
             return device_current
 
         # try:
@@ -0,0 +1,320 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.module_utils.common.parameters import remove_values
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, \
+    radware_server_argument_spec, radware_server_spec, build_specs_from_annotation
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonAnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.device_lock import LOCK_SECTION_DEVICE
+from ansible_collections.radware.radware_alteon.plugins.module_utils.fleet import FleetDeviceModule, DEFAULT_FORKS, \
+    no_log_values
+try:
+    from radware.sdk.exceptions import RadwareError
+    from radware.sdk.configurator import DeviceConfigurationManager, DeviceConfigurator
+    from radware.alteon.api import AlteonDeviceConnection
+    from radware.alteon.sdk.alteon_managment import AlteonTools
+    from radware.alteon.sdk.configurators.system_tacacs_authentication import SystemTacacsAuthenticationConfigurator
+    from radware.alteon.sdk.configurators.system_radius_authentication import SystemRadiusAuthenticationConfigurator
+    from radware.alteon.sdk.configurators.system_local_user import LocalUserConfigurator
+    from radware.alteon.sdk.configurators.system_predefined_local_users import PredefinedLocalUsersConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Alteon credential rotation module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+DEFAULT_FINGERPRINT_STORE = '~/.ansible/radware_alteon/credential_fingerprints.json'
+FINGERPRINT_ITERATIONS = 100000
+LOCAL_USERS = 'local_users'
+PREDEFINED_ADMIN = 'admin'
+PREDEFINED_ADMIN_PASSWORD = 'new_admin_password'
+PROBE_TIMEOUT = 10
+
+credential_rotation_argument_spec = {
+    'devices': {"required": True, "type": 'list', "elements": 'dict'},
+    'provider': {"required": False, "type": 'dict', "default": {}},
+    'forks': {"required": False, "type": 'int', "default": DEFAULT_FORKS},
+    'fingerprint_store': {"required": False, "type": 'path', "default": DEFAULT_FINGERPRINT_STORE},
+    'force': {"required": False, "type": 'bool', "default": False},
+    'apply': {"required": False, "type": 'bool', "default": True},
+    'save': {"required": False, "type": 'bool', "default": False},
+    'verify': {"required": False, "type": 'bool', "default": True},
+    'auth_probe': {"required": False, "type": 'dict', "options": {
+        'user': {"required": True, "type": 'str'},
+        'password': {"required": True, "type": 'str', "no_log": True}}}
+}
+
+
+def credential_sections():
+    # (option, configurator class, rotated secret fields, field authorizing the change)
+    # written in this order, the predefined users last as the administrator password authorizes the other writes
+    return [('tacacs_auth', SystemTacacsAuthenticationConfigurator, ('primary_secret', 'secondary_secret'), None),
+            ('radius_auth', SystemRadiusAuthenticationConfigurator, ('primary_secret', 'secondary_secret'), None),
+            (LOCAL_USERS, LocalUserConfigurator, ('user_password',), 'admin_password'),
+            ('predefined_local_users', PredefinedLocalUsersConfigurator,
+             (PREDEFINED_ADMIN_PASSWORD, 'new_l4_admin_password', 'new_slb_admin_password', 'new_webapp_admin_password',
+              'new_oper_password', 'new_l4_oper_password', 'new_slb_viewer_password', 'new_user_password'),
+             'current_admin_password')]
+
+
+def secret_fingerprint(secret, salt, iterations=FINGERPRINT_ITERATIONS):
+    return hashlib.pbkdf2_hmac('sha256', str(secret).encode('utf-8'), bytes.fromhex(salt), iterations).hex()
+
+
+class CredentialRotationArgumentSpec(object):
+    def __init__(self):
+        self.supports_check_mode = True
+        self.argument_spec = {}
+        self.argument_spec.update(credential_rotation_argument_spec)
+        for name, config_class, secret_fields, auth_field in credential_sections():
+            options = build_specs_from_annotation(config_class.get_parameters_class())
+            if name == LOCAL_USERS:
+                self.argument_spec.update({name: {"required": False, "type": 'list', "elements": 'dict', "default": [],
+                                                  "options": options}})
+            else:
+                self.argument_spec.update({name: {"required": False, "type": 'dict', "options": options}})
+
+
+class FingerprintStore(object):
+    """
+    salted fingerprints of the secrets last pushed to every device, kept on the controller in a JSON file
+    a fingerprint is a PBKDF2 digest with a random salt per secret, the secret itself is never stored.
+    recorded fingerprints are merged into the file under an exclusive lock, concurrent runs do not lose updates
+    """
+    def __init__(self, path):
+        self._path = os.path.expanduser(path)
+        self._entries = self._load()
+        self._updates = {}
+        self._mutex = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            raise RadwareModuleError(f'credential fingerprint store {self._path}: {e}') from e
+
+    def matches(self, server, key, secret):
+        entry = self._entries.get(server, {}).get(key)
+        if entry is None:
+            return False
+        return hmac.compare_digest(entry['digest'], secret_fingerprint(secret, entry['salt'], entry['iterations']))
+
+    def record(self, server, key, secret):
+        salt = os.urandom(16).hex()
+        entry = dict(salt=salt, iterations=FINGERPRINT_ITERATIONS, digest=secret_fingerprint(secret, salt))
+        with self._mutex:
+            self._updates.setdefault(server, {})[key] = entry
+
+    def save(self):
+        if not self._updates:
+            return
+        directory = os.path.dirname(self._path)
+        os.makedirs(directory, exist_ok=True)
+        with open(self._path + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = self._load()
+            for server, keys in self._updates.items():
+                entries.setdefault(server, {}).update(keys)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.fingerprints.')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self._path)
+        self._entries = entries
+        self._updates = {}
+
+
+class CredentialRotationDevice(AlteonAnsibleModule):
+    """
+    rotation of the secrets of one device
+    secrets matching the stored fingerprint are skipped, the others are written with the other provided parameters
+    of their object, applied and verified by logging in with the new credential. fingerprints are recorded once the
+    secrets are applied, secrets left in the pending configuration are not skipped by the next run
+    """
+    def __init__(self, store, rotation_params, **kwargs):
+        super().__init__(**kwargs)
+        self._store = store
+        self._rotation = rotation_params
+        self._server = self.provider['server']
+        self._config_manager = DeviceConfigurationManager()
+
+    @staticmethod
+    def _entries(name, value):
+        if value is None:
+            return []
+        return value if name == LOCAL_USERS else [value]
+
+    @staticmethod
+    def _secret_key(name, entry, field):
+        if name == LOCAL_USERS:
+            return f'{name}/{entry["index"]}/{field}'
+        return f'{name}/{field}'
+
+    def _pending_secrets(self, name, entry, secret_fields):
+        return [field for field in secret_fields if entry.get(field) is not None and
+                (self._rotation['force'] or
+                 not self._store.matches(self._server, self._secret_key(name, entry, field), entry[field]))]
+
+    def _logins(self, rotated):
+        # credentials which can be verified by a login, local users and the administrator
+        logins = []
+        for name, entry, pending in rotated:
+            if name == LOCAL_USERS and entry.get('user_name') and entry.get('state') != 'disabled':
+                logins.append((entry['user_name'], entry['user_password']))
+            elif PREDEFINED_ADMIN_PASSWORD in pending:
+                logins.append((PREDEFINED_ADMIN, entry[PREDEFINED_ADMIN_PASSWORD]))
+            elif name in ('tacacs_auth', 'radius_auth') and self._rotation.get('auth_probe'):
+                probe = self._rotation['auth_probe']
+                logins.append((probe['user'], probe['password']))
+        return list(dict.fromkeys(logins))
+
+    def _probe(self, user, password):
+        details = self._connection.get_connection_details()
+        details.update(user=user, password=password)
+        try:
+            return AlteonTools.is_accessible(AlteonDeviceConnection(**details), PROBE_TIMEOUT, 1)
+        except RadwareError:
+            return False
+
+    def _write(self, name, config_class, entry, secret_fields, auth_field, pending):
+        values = dict((k, v) for k, v in entry.items()
+                      if v is not None and (k not in secret_fields or k in pending))
+        if auth_field and values.get(auth_field) is None:
+            values[auth_field] = self.provider['password']
+        arguments = config_class.get_parameters_class()()
+        arguments.set_attributes(**values)
+        self._config_manager.execute(config_class(self._connection), DeviceConfigurator.UPDATE, arguments,
+                                     dry_run=self.module.check_mode)
+
+    def _rotate(self):
+        rotated = []
+        skipped = []
+        for name, config_class, secret_fields, auth_field in credential_sections():
+            for entry in self._entries(name, self._rotation.get(name)):
+                pending = self._pending_secrets(name, entry, secret_fields)
+                skipped.extend(self._secret_key(name, entry, field) for field in secret_fields
+                               if entry.get(field) is not None and field not in pending)
+                if pending:
+                    self._write(name, config_class, entry, secret_fields, auth_field, pending)
+                    rotated.append((name, entry, pending))
+        result = dict(changed=bool(rotated), skipped=skipped,
+                      rotated=[self._secret_key(name, entry, field) for name, entry, pending in rotated
+                               for field in pending])
+        if not rotated or self.module.check_mode:
+            return result
+
+        logins = self._logins(rotated)
+        if not self._rotation['apply']:
+            # pending configuration may still be reverted, the secrets are written again until a run applies them
+            result.update(unapplied=result['rotated'])
+            return result
+        self._mng.config.apply()
+        # requests of this run are authenticated with the rotated password from now on
+        for user, password in logins:
+            if user == self.provider['user']:
+                self._connection.connection_details_update(
+                    **dict(self._connection.get_connection_details(), password=password))
+        if self._rotation['save']:
+            self._mng.config.save()
+        if self._rotation['verify']:
+            failed = [user for user, password in logins if not self._probe(user, password)]
+            result.update(verified=[user for user, password in logins if user not in failed])
+            if failed:
+                raise RadwareModuleError(f'login with the rotated credential failed for {", ".join(failed)}')
+        for name, entry, pending in rotated:
+            for field in pending:
+                self._store.record(self._server, self._secret_key(name, entry, field), entry[field])
+        return result
+
+    def exec_module(self):
+        try:
+            return self.exec_locked(self._rotate, LOCK_SECTION_DEVICE)
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+
+
+class CredentialRotationRunner(object):
+    """
+    rotate the secrets of many devices from a single process, at most `forks` devices at a time
+    """
+    def __init__(self, params, check_mode=False):
+        self._params = params
+        self._check_mode = check_mode
+        self._forks = max(1, params.get('forks') or DEFAULT_FORKS)
+        self._store = FingerprintStore(params['fingerprint_store'])
+
+    def _device_params(self, device):
+        provider = {}
+        provider.update(self._params.get('provider') or {})
+        provider.update(device)
+        validation = ArgumentSpecValidator(radware_server_argument_spec).validate(dict(provider=provider))
+        if validation.error_messages:
+            raise RadwareModuleError('; '.join(validation.error_messages))
+        return validation.validated_parameters
+
+    def _secret_values(self, device):
+        """
+        secrets of the run for a device: rotated and authorizing fields, provider password and auth probe password
+        SDK request errors carry the request body, every result is masked with these values
+        """
+        provider = {}
+        provider.update(self._params.get('provider') or {})
+        provider.update(device)
+        values = no_log_values(radware_server_spec, provider)
+        values.update(no_log_values(credential_rotation_argument_spec, self._params))
+        for name, config_class, secret_fields, auth_field in credential_sections():
+            fields = secret_fields + ((auth_field,) if auth_field else ())
+            for entry in CredentialRotationDevice._entries(name, self._params.get(name)):
+                values.update(str(entry[field]) for field in fields if entry.get(field) not in (None, ''))
+        return values
+
+    def _run_device(self, device):
+        result = dict(server=device.get('server'))
+        try:
+            module = FleetDeviceModule(self._device_params(device), check_mode=self._check_mode)
+            result['server'] = module.params['provider']['server']
+            result.update(CredentialRotationDevice(self._store, self._params, module=module).exec_module())
+            if module.warnings:
+                result.update(warnings=module.warnings)
+        except (RadwareError, RadwareModuleError) as e:
+            # the traceback of a device error holds the failed request, it is not returned
+            result.update(changed=False, failed=True, msg=str(e))
+        except Exception as e:
+            result.update(changed=False, failed=True, msg=str(e), exception=traceback.format_exc())
+        return remove_values(result, self._secret_values(device))
+
+    def run(self):
+        devices = self._params['devices']
+        with ThreadPoolExecutor(max_workers=min(self._forks, max(1, len(devices)))) as executor:
+            device_results = list(executor.map(self._run_device, devices))
+        if not self._check_mode:
+            self._store.save()
+
+        failed = [item['server'] for item in device_results if item.get('failed')]
+        changed = [item['server'] for item in device_results if item.get('changed')]
+        result = dict(changed=bool(changed), devices=device_results,
+                      status=f'{len(changed)} of {len(device_results)} devices rotated')
+        if failed:
+            result.update(failed=True, msg=f'{len(failed)} of {len(device_results)} devices failed: {", ".join(str(s) for s in failed)}')
+        return remove_values(result, set().union(*(self._secret_values(device) for device in devices)))
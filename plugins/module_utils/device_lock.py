@@ -0,0 +1,190 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import re
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, lock_server_spec
+
+
+DOCUMENTATION = r'''
+module: Device write lock module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+LOCK_SECTION_DEVICE = 'device'
+LOCK_DIR_NAME = 'radware_alteon_locks'
+_UNSAFE = re.compile(r'[^A-Za-z0-9_]')
+
+
+def _safe(value):
+    return _UNSAFE.sub('_', str(value))
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class Ticket(object):
+    """
+    queue entry of a lock waiter or holder, encoded in its file name
+    <enqueue time ns>.<host>.<pid>.<nonce>.<section>
+    """
+    def __init__(self, name):
+        self.name = name
+        parts = name.split('.', 4)
+        self.enqueued = int(parts[0])
+        self.host = parts[1]
+        self.pid = int(parts[2])
+        self.section = parts[4]
+
+    @classmethod
+    def new_name(cls, section):
+        return f'{time.time_ns():020d}.{_safe(socket.gethostname())}.{os.getpid()}.{uuid.uuid4().hex[:8]}.{_safe(section)}'
+
+    def conflicts(self, other):
+        return self.section == other.section or LOCK_SECTION_DEVICE in (self.section, other.section)
+
+
+class DeviceLock(object):
+    """
+    fair write lock per device and configuration section, shared by the processes of one controller through a
+    queue directory per device
+    every waiter enqueues a ticket file and holds the lock once no earlier ticket of a conflicting section remains,
+    waiters are served in arrival order. the `device` section conflicts with all sections (apply, save, revert),
+    other sections only with themselves so unrelated sections of one device are written concurrently.
+    tickets of dead processes of this host are dropped. tickets of other hosts sharing the lock directory are dropped
+    once older than the lease, the ticket of a waiter or holder is touched every third of the lease
+    """
+    def __init__(self, server, section=LOCK_SECTION_DEVICE, lock_dir=None, timeout=600, lease=900, poll=0.1):
+        self.server = server
+        self.section = section or LOCK_SECTION_DEVICE
+        self._queue_dir = os.path.join(lock_dir or os.path.join(tempfile.gettempdir(), LOCK_DIR_NAME), _safe(server))
+        self._timeout = timeout
+        self._lease = lease
+        self._poll = poll
+        self._ticket = None
+        self._acquired_at = None
+        self._heartbeat_stop = None
+        self.metrics = dict(server=server, section=self.section, waited=0.0, held=0.0, queued_behind=0)
+
+    @classmethod
+    def from_provider(cls, provider, section=None):
+        return cls(provider['server'],
+                   section=section or provider.get('lock_section') or lock_server_spec['lock_section']['default'],
+                   lock_dir=provider.get('lock_dir'),
+                   timeout=provider.get('lock_timeout', lock_server_spec['lock_timeout']['default']),
+                   lease=provider.get('lock_lease', lock_server_spec['lock_lease']['default']))
+
+    def _is_stale(self, ticket, path):
+        # a live process of this host keeps its ticket whatever its age, the lease covers the other hosts
+        if ticket.host == _safe(socket.gethostname()):
+            return not _pid_alive(ticket.pid)
+        try:
+            return os.path.getmtime(path) + self._lease < time.time()
+        except FileNotFoundError:
+            return True
+
+    def _blockers(self):
+        # live tickets enqueued before ours in a conflicting section
+        blockers = []
+        for name in sorted(os.listdir(self._queue_dir)):
+            if name == self._ticket.name:
+                break
+            try:
+                ticket = Ticket(name)
+            except (ValueError, IndexError):
+                continue
+            if not ticket.conflicts(self._ticket):
+                continue
+            path = os.path.join(self._queue_dir, name)
+            if self._is_stale(ticket, path):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                continue
+            blockers.append(ticket)
+        return blockers
+
+    def acquire(self):
+        os.makedirs(self._queue_dir, exist_ok=True)
+        self._ticket = Ticket(Ticket.new_name(self.section))
+        path = os.path.join(self._queue_dir, self._ticket.name)
+        with open(path, 'w'):
+            pass
+        start = time.time()
+        touched = start
+        delay = self._poll
+        blockers = self._blockers()
+        self.metrics['queued_behind'] = len(blockers)
+        while blockers:
+            if time.time() - start > self._timeout:
+                self._drop_ticket()
+                holder = blockers[0]
+                raise RadwareModuleError(f'device lock {self.server}/{self.section}: timeout after {self._timeout}s, '
+                                         f'held by {holder.host} pid {holder.pid} ({holder.section})')
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+            if time.time() - touched > self._lease / 3:
+                self.refresh()
+                touched = time.time()
+            blockers = self._blockers()
+        # the lease runs from the acquisition, not from the enqueue time
+        self.refresh()
+        self._acquired_at = time.time()
+        self.metrics['waited'] = round(self._acquired_at - start, 3)
+        self._heartbeat_stop = threading.Event()
+        threading.Thread(target=self._heartbeat, args=(self._heartbeat_stop,), daemon=True).start()
+
+    def _heartbeat(self, stop):
+        # the lease of the holder is extended until the lock is released
+        while not stop.wait(self._lease / 3):
+            self.refresh()
+
+    def refresh(self):
+        # extend the lease of the ticket
+        ticket = self._ticket
+        if ticket is not None:
+            try:
+                os.utime(os.path.join(self._queue_dir, ticket.name))
+            except FileNotFoundError:
+                pass
+
+    def _drop_ticket(self):
+        if self._ticket is not None:
+            try:
+                os.unlink(os.path.join(self._queue_dir, self._ticket.name))
+            except FileNotFoundError:
+                pass
+            self._ticket = None
+
+    def release(self):
+        if self._heartbeat_stop is not None:
+            self._heartbeat_stop.set()
+            self._heartbeat_stop = None
+        if self._acquired_at is not None:
+            self.metrics['held'] = round(time.time() - self._acquired_at, 3)
+            self._acquired_at = None
+        self._drop_ticket()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
@@ -0,0 +1,124 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from collections import Counter
+from ansible.module_utils.basic import AnsibleModule
+try:
+    from typing import get_type_hints
+    from radware.sdk.common import RadwareParametersStruct, get_annotation_class, is_annotation_type_list_incl_optional_lookup
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Configuration diff module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+DIFF_APPEND_KEY = '+++'
+DIFF_REMOVE_KEY = '---'
+
+_identity_cache = {}
+
+
+def hashable(item):
+    if isinstance(item, dict):
+        return tuple(sorted((k, hashable(v)) for k, v in item.items()))
+    if isinstance(item, list):
+        return tuple(hashable(v) for v in item)
+    return item
+
+
+def list_identity_fields(params_class):
+    """
+    identity fields of every list of structs in the parameters class, the required fields of the item struct
+    e.g. network_class_ip classes -> ('name', 'network_type')
+    lists of basic values, or of structs without required fields, are identified by the whole item
+    """
+    if params_class in _identity_cache:
+        return _identity_cache[params_class]
+    result = {}
+    for field, annotation in get_type_hints(params_class).items():
+        if not is_annotation_type_list_incl_optional_lookup(annotation):
+            continue
+        item_class = get_annotation_class(annotation)
+        if isinstance(item_class, type) and issubclass(item_class, RadwareParametersStruct):
+            required = tuple(item_class().get_required_fields())
+            if required:
+                result[field] = required
+    _identity_cache[params_class] = result
+    return result
+
+
+def item_key(item, identity=None):
+    if identity and isinstance(item, dict):
+        return tuple(hashable(item.get(field)) for field in identity)
+    return hashable(item)
+
+
+def patch_list(current, removed=None, added=None, identity=None):
+    """
+    remove then add list items in a single pass each
+    items are matched on their identity fields, an added item replacing an existing one is merged into it
+    """
+    result = current
+    if removed:
+        remove_counts = Counter(item_key(item, identity) for item in removed)
+        result = []
+        for item in current:
+            key = item_key(item, identity)
+            if remove_counts.get(key):
+                remove_counts[key] -= 1
+            else:
+                result.append(item)
+    if added:
+        if result is current:
+            result = list(current)
+        positions = {}
+        if identity:
+            positions = dict((item_key(item, identity), idx) for idx, item in enumerate(result))
+        for item in added:
+            key = item_key(item, identity)
+            idx = positions.get(key)
+            if idx is not None and isinstance(result[idx], dict) and isinstance(item, dict):
+                merged = dict(result[idx])
+                merged.update(item)
+                result[idx] = merged
+            else:
+                if identity:
+                    positions[key] = len(result)
+                result.append(item)
+    return result
+
+
+def patch_configuration(current, changes, identities=None):
+    """
+    apply a dry run diff to the current configuration dict
+    list items are matched through hash maps keyed by their identity fields, patching is linear in the list sizes
+    """
+    if not changes:
+        return current
+    identities = identities or {}
+    removed = changes.get(DIFF_REMOVE_KEY) or {}
+    added = changes.get(DIFF_APPEND_KEY) or {}
+    for key, value in removed.items():
+        if key not in current:
+            continue
+        if type(value) == list:
+            if type(current[key]) == list:
+                current[key] = patch_list(current[key], removed=value, identity=identities.get(key))
+        else:
+            del current[key]
+    for key, value in added.items():
+        if type(value) == list:
+            if type(current.get(key)) != list:
+                current[key] = []
+            current[key] = patch_list(current[key], added=value, identity=identities.get(key))
+        else:
+            current[key] = value
+    return current
@@ -0,0 +1,93 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import json
+import zlib
+
+
+DOCUMENTATION = r'''
+module: Facts serialization module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+FACTS_FORMAT_RECORDS = 'records'
+FACTS_FORMAT_COLUMNAR = 'columnar'
+FACTS_FORMATS = [FACTS_FORMAT_RECORDS, FACTS_FORMAT_COLUMNAR]
+COLUMNAR_FORMAT_KEY = 'alteon_facts_format'
+COLUMNAR_FIELDS_KEY = 'fields'
+COLUMNAR_VALUES_KEY = 'values'
+COLUMNAR_COUNT_KEY = 'count'
+COLUMNAR_MISSING_KEY = 'missing'
+COMPRESSION_ENCODING = 'zlib+base64'
+COMPRESSED_ENCODING_KEY = 'encoding'
+COMPRESSED_DATA_KEY = 'data'
+
+
+def _is_records(value):
+    return isinstance(value, list) and value and all(isinstance(item, dict) for item in value)
+
+
+def _is_columnar(value):
+    # facts are plain dictionaries, a columnar table is told apart by its format marker only
+    return isinstance(value, dict) and value.get(COLUMNAR_FORMAT_KEY) == FACTS_FORMAT_COLUMNAR
+
+
+def to_columnar(obj):
+    """
+    convert every list of records into a table marked with its format: one list of field names, a value array per
+    field and the record count
+    records missing a field get None in its array, the record indexes are listed per field in `missing`
+    (only present when a record misses a field), from_columnar restores the records as they were
+    """
+    if _is_records(obj):
+        fields = []
+        seen = set()
+        for record in obj:
+            for k in record:
+                if k not in seen:
+                    seen.add(k)
+                    fields.append(k)
+        values = [[to_columnar(record.get(k)) for record in obj] for k in fields]
+        result = {COLUMNAR_FORMAT_KEY: FACTS_FORMAT_COLUMNAR, COLUMNAR_FIELDS_KEY: fields, COLUMNAR_VALUES_KEY: values,
+                  COLUMNAR_COUNT_KEY: len(obj)}
+        missing = dict((k, [idx for idx, record in enumerate(obj) if k not in record]) for k in fields)
+        missing = dict((k, indexes) for k, indexes in missing.items() if indexes)
+        if missing:
+            result[COLUMNAR_MISSING_KEY] = missing
+        return result
+    if isinstance(obj, dict):
+        return dict((k, to_columnar(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return [to_columnar(item) for item in obj]
+    return obj
+
+
+def from_columnar(obj):
+    if _is_columnar(obj):
+        fields = obj[COLUMNAR_FIELDS_KEY]
+        columns = [[from_columnar(v) for v in column] for column in obj[COLUMNAR_VALUES_KEY]]
+        missing = dict((k, set(indexes)) for k, indexes in (obj.get(COLUMNAR_MISSING_KEY) or {}).items())
+        return [dict((fields[f], columns[f][idx]) for f in range(len(fields))
+                     if idx not in missing.get(fields[f], ())) for idx in range(obj[COLUMNAR_COUNT_KEY])]
+    if isinstance(obj, dict):
+        return dict((k, from_columnar(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return [from_columnar(item) for item in obj]
+    return obj
+
+
+def compress_facts(obj):
+    data = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    return {COMPRESSED_ENCODING_KEY: COMPRESSION_ENCODING,
+            COMPRESSED_DATA_KEY: base64.b64encode(zlib.compress(data, 9)).decode('ascii')}
+
+
+def decompress_facts(obj):
+    if not isinstance(obj, dict) or obj.get(COMPRESSED_ENCODING_KEY) != COMPRESSION_ENCODING:
+        return obj
+    return json.loads(zlib.decompress(base64.b64decode(obj[COMPRESSED_DATA_KEY])).decode('utf-8'))
@@ -0,0 +1,160 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import sys
+from functools import lru_cache
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+try:
+    from typing import get_type_hints
+    from radware.alteon.api.config import AlteonConfigurators
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Alteon facts collection plan module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+FACTS_ALL = 'all'
+STATE_BEANS_VAR_NAME = 'state_beans'
+STATS_BEANS_VAR_NAME = 'stats_beans'
+SYS_INFO_FACTS = 'system_info'
+SYS_CAPACITY_FACTS = 'system_capacity'
+SYS_TIMES_FACTS = 'system_times'
+ADC_SOFTWARE_FACTS = 'adc_software_images'
+VX_SOFTWARE_FACTS = 'vx_software_images'
+MNG_FACTS = [SYS_INFO_FACTS, SYS_TIMES_FACTS, SYS_CAPACITY_FACTS, ADC_SOFTWARE_FACTS, VX_SOFTWARE_FACTS]
+
+READ_CONFIG = 'config'
+READ_STATE = 'state'
+READ_STATS = 'stats'
+
+FACTS_PROFILES = {
+    'inventory': [SYS_INFO_FACTS, SYS_TIMES_FACTS, ADC_SOFTWARE_FACTS, VX_SOFTWARE_FACTS],
+    'slb': [SYS_INFO_FACTS, 'server', 'server_state', 'server_group', 'group_real_server', 'virtual_server',
+            'virtual_service', 'virtual_service_state', 'fdn_server', 'content_rule', 'sideband_policy', 'appshape',
+            'hc_tcp', 'hc_http', 'hc_logexp', 'slb_pip', 'slb_pip6', 'slb_port', 'network_class_ip',
+            'network_class_region', 'ssl_policy', 'ssl_cert', 'ssl_key', 'ssl_cert_group', 'ssl_client_auth_policy',
+            'ssl_server_auth_policy', 'l7_content_class', 'l7_content_class_hostname', 'l7_content_class_path',
+            'l7_content_class_filename', 'l7_content_class_filetype', 'l7_content_class_header',
+            'l7_content_class_cookie'],
+    'security': [SYS_INFO_FACTS, 'sys_local_user', 'sys_predefined_local_users', 'sys_management_access',
+                 'sys_radius_auth', 'sys_tacacs_auth', 'sys_snmp', 'snmp_general', 'snmpv3_usm_user', 'snmpv3_group',
+                 'snmpv3_access', 'snmpv3_community', 'snmpv3_view_tree_family', 'snmpv3_notify',
+                 'snmpv3_target_params', 'snmpv3_target_addr_new_cfg', 'security_global', 'secure_path_policy',
+                 'ssl_client_auth_policy', 'ssl_server_auth_policy'],
+    'full': [FACTS_ALL]
+}
+
+
+def exclude(k):
+    return f"!{k}"
+
+
+def state(k):
+    return f"{k}_state"
+
+
+def stats(k):
+    return f"{k}_stats"
+
+
+def _read_cost(config_class):
+    # tables read by the configurator, long reads are started first so they do not end the concurrent run
+    return len(getattr(sys.modules[config_class.__module__], 'bean_map', None) or {}) or 1
+
+
+@lru_cache(maxsize=None)
+def _config_facts():
+    """
+    (fact key, configurator name, read kind, cost) of every configuration, state and stats fact
+    """
+    facts = []
+    for k, v in get_type_hints(AlteonConfigurators).items():
+        facts.append((k, k, READ_CONFIG, _read_cost(v)))
+        config_class_meta = get_type_hints(v)
+        if STATE_BEANS_VAR_NAME in config_class_meta:
+            facts.append((state(k), k, READ_STATE, len(getattr(v, STATE_BEANS_VAR_NAME, None) or {}) or 1))
+        if STATS_BEANS_VAR_NAME in config_class_meta:
+            facts.append((stats(k), k, READ_STATS, len(getattr(v, STATS_BEANS_VAR_NAME, None) or {}) or 1))
+    return tuple(facts)
+
+
+@lru_cache(maxsize=None)
+def fact_choices():
+    choices = [FACTS_ALL, exclude(FACTS_ALL)]
+    for fact_key in MNG_FACTS + [fact[0] for fact in _config_facts()]:
+        choices.extend([fact_key, exclude(fact_key)])
+    return tuple(choices)
+
+
+def _validate_profiles(profiles):
+    choices = set(fact_choices())
+    for name, facts in (profiles or {}).items():
+        if not isinstance(facts, list) or not all(isinstance(fact, str) for fact in facts):
+            raise RadwareModuleError(f'facts profile {name} must be a list of fact names, got {facts!r}')
+        unknown = sorted(set(facts) - choices)
+        if unknown:
+            raise RadwareModuleError(f'unknown facts {", ".join(unknown)} in profile {name}')
+
+
+def profile_facts(profile=None, profiles=None, gather_facts=None):
+    """
+    facts of the profile, user defined profiles extend and override the built-in ones, followed by `gather_facts`
+    every user defined profile is validated, a profile is a list of fact names
+    """
+    _validate_profiles(profiles)
+    facts = []
+    if profile:
+        all_profiles = dict(FACTS_PROFILES)
+        all_profiles.update(profiles or {})
+        if profile not in all_profiles:
+            raise RadwareModuleError(f'unknown facts profile {profile}, expected one of {", ".join(sorted(all_profiles))}')
+        facts.extend(all_profiles[profile])
+    facts.extend(gather_facts or [])
+    unknown = sorted(set(facts) - set(fact_choices()))
+    if unknown:
+        raise RadwareModuleError(f'unknown facts {", ".join(unknown)}')
+    return tuple(facts)
+
+
+class FactsPlan(object):
+    """
+    collection plan compiled once per facts selection
+    `reads` lists the configuration, state and stats facts to read, most expensive first, `facts` all the facts in
+    output order. the device capabilities are probed only when configurators are read and the system information only
+    when it is part of the output
+    """
+    def __init__(self, mng_facts, reads, facts):
+        self.mng_facts = mng_facts
+        self.reads = reads
+        self.facts = facts
+        self.needs_capabilities = any(kind == READ_CONFIG for _, _, kind in reads)
+        self.needs_sys_info = SYS_INFO_FACTS in mng_facts or SYS_TIMES_FACTS in mng_facts
+
+
+@lru_cache(maxsize=64)
+def compile_plan(facts):
+    """
+    FactsPlan of a gather_facts selection, values starting with `!` exclude a fact
+    """
+    excluded = frozenset(x[1:] for x in facts if x.startswith('!'))
+    included = frozenset(x for x in facts if not x.startswith('!'))
+
+    collect_all = FACTS_ALL in included and FACTS_ALL not in excluded
+
+    def selected(fact_key):
+        return fact_key not in excluded and (collect_all or fact_key in included)
+
+    mng_facts = tuple(fact_key for fact_key in MNG_FACTS if selected(fact_key))
+    config_facts = [fact for fact in _config_facts() if selected(fact[0])]
+    order = sorted(range(len(config_facts)), key=lambda i: -config_facts[i][3])
+    reads = tuple(config_facts[i][:3] for i in order)
+    return FactsPlan(mng_facts, reads, tuple(fact[0] for fact in config_facts) + mng_facts)
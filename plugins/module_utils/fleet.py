@@ -0,0 +1,192 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+import importlib
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.module_utils.common.parameters import remove_values
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, radware_server_spec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.snapshot import snapshot_argument_spec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonConfigurationModule, \
+    AlteonConfigurationArgumentSpec, AlteonBulkConfigurationModule
+try:
+    from radware.alteon.sdk.alteon_configurator import AlteonConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Alteon fleet configuration module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+COLLECTION_MODULES_PACKAGE = 'ansible_collections.radware.radware_alteon.plugins.modules'
+COLLECTION_PREFIX = 'radware.radware_alteon.'
+DEFAULT_FORKS = 10
+
+fleet_argument_spec = {
+    'module': {"required": True, "type": 'str'},
+    'devices': {"required": True, "type": 'list', "elements": 'dict'},
+    'provider': {"required": False, "type": 'dict', "default": {}},
+    'parameters': {"required": False, "type": 'dict'},
+    'state': {"required": True, "type": 'str'},
+    'write_on_change': {"required": False, "type": 'bool', "default": False},
+    'revert_on_error': {"required": False, "type": 'bool', "default": False},
+    'revert_scope': {"required": False, "type": 'str', "choices": ['device', 'session'], "default": 'device'},
+    'forks': {"required": False, "type": 'int', "default": DEFAULT_FORKS}
+}
+
+
+def no_log_values(argument_spec, params):
+    """
+    values of the no_log options set in params, options of nested dicts and lists of dicts included
+    the fleet runner returns the device results without AnsibleModule.exit_json, they are masked with these values
+    """
+    values = set()
+    for name, spec in argument_spec.items():
+        value = (params or {}).get(name)
+        if value is None:
+            continue
+        if spec.get('no_log') and value != '':
+            values.add(str(value))
+        if spec.get('options'):
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, dict):
+                    values.update(no_log_values(spec['options'], item))
+    return values
+
+
+def resolve_configurator_module(module_name):
+    """
+    locate the configurator driven by an alteon_config_* module of this collection
+    returns the module ModuleManager class and its argument spec, bulk modules are validated against their own
+    argument spec
+    """
+    if module_name.startswith(COLLECTION_PREFIX):
+        module_name = module_name[len(COLLECTION_PREFIX):]
+    if not module_name.startswith('alteon_config_'):
+        raise RadwareModuleError(f'fleet: {module_name} is not an alteon_config_* module')
+    try:
+        target = importlib.import_module(f'{COLLECTION_MODULES_PACKAGE}.{module_name}')
+    except ImportError as e:
+        raise RadwareModuleError(f'fleet: unable to load module {module_name}: {e}') from e
+
+    manager_class = getattr(target, 'ModuleManager', None)
+    if manager_class is not None and issubclass(manager_class, AlteonBulkConfigurationModule):
+        return manager_class, target.ArgumentSpec().argument_spec
+    if manager_class is None or not issubclass(manager_class, AlteonConfigurationModule):
+        raise RadwareModuleError(f'fleet: module {module_name} is not a single configurator or bulk module')
+    configurators = set()
+    for value in vars(target).values():
+        if isinstance(value, type) and issubclass(value, AlteonConfigurator) and value is not AlteonConfigurator:
+            configurators.add(value)
+    if len(configurators) != 1:
+        raise RadwareModuleError(f'fleet: unable to resolve the configurator of module {module_name}')
+    return manager_class, AlteonConfigurationArgumentSpec(configurators.pop()).argument_spec
+
+
+class FleetDeviceModule(object):
+    """
+    stand-in for AnsibleModule handed to a ModuleManager running against a single fleet member
+    """
+    def __init__(self, params, check_mode=False, diff=False):
+        self.params = params
+        self.check_mode = check_mode
+        self._diff = diff
+        self.warnings = []
+
+    def warn(self, warning):
+        self.warnings.append(warning)
+
+
+class FleetConfigurationRunner(object):
+    """
+    run one alteon_config_* module, single configurator or bulk, against many devices from a single process
+    every device gets its own connection and ModuleManager, devices are processed by a thread pool
+    so a fleet-wide change is bounded by device latency rather than a process per device
+    """
+    def __init__(self, params, check_mode=False, diff=False):
+        self._params = params
+        self._check_mode = check_mode
+        self._diff = diff
+        self._manager_class, self._argument_spec = resolve_configurator_module(params['module'])
+        self._bulk = issubclass(self._manager_class, AlteonBulkConfigurationModule)
+        self._forks = max(1, params.get('forks') or DEFAULT_FORKS)
+
+    def _device_params(self, device):
+        # a device entry may carry its own check mode snapshot and expected fingerprint next to its connection details
+        device = dict(device)
+        snapshot = dict((k, device.pop(k)) for k in list(device) if k in snapshot_argument_spec)
+        expected_fingerprint = device.pop('expected_fingerprint', None)
+        provider = {}
+        provider.update(self._params.get('provider') or {})
+        provider.update(device)
+        unknown = set(provider) - set(radware_server_spec)
+        if unknown:
+            raise RadwareModuleError(f'fleet: unsupported provider options {sorted(unknown)}')
+        if self._bulk:
+            # bulk modules take their sections as top level options, carried by `parameters`
+            if snapshot or expected_fingerprint is not None:
+                raise RadwareModuleError(f'fleet: {self._params["module"]} does not support snapshots '
+                                         f'and expected fingerprints')
+            params = copy.deepcopy(self._params.get('parameters') or {})
+            params.update(provider=provider,
+                          state=self._params['state'],
+                          revert_on_error=self._params.get('revert_on_error', False))
+        else:
+            params = dict(provider=provider,
+                          parameters=copy.deepcopy(self._params.get('parameters')),
+                          state=self._params['state'],
+                          write_on_change=self._params.get('write_on_change', False),
+                          revert_on_error=self._params.get('revert_on_error', False),
+                          revert_scope=self._params.get('revert_scope', 'device'),
+                          expected_fingerprint=expected_fingerprint,
+                          **snapshot)
+        validation = ArgumentSpecValidator(self._argument_spec).validate(params)
+        if validation.error_messages:
+            raise RadwareModuleError('; '.join(validation.error_messages))
+        return validation.validated_parameters
+
+    def _no_log_values(self, device):
+        provider = {}
+        provider.update(self._params.get('provider') or {})
+        provider.update(device)
+        return no_log_values(radware_server_spec, provider)
+
+    def _run_device(self, device):
+        result = dict(server=device.get('server'))
+        no_log = self._no_log_values(device)
+        try:
+            params = self._device_params(device)
+            no_log.update(no_log_values(self._argument_spec, params))
+            module = FleetDeviceModule(params, check_mode=self._check_mode, diff=self._diff)
+            result['server'] = module.params['provider']['server']
+            mm = self._manager_class(module=module)
+            result.update(mm.exec_module())
+            result.setdefault('changed', False)
+            if module.warnings:
+                result.update(warnings=module.warnings)
+        except Exception as e:
+            result.update(changed=False, failed=True, msg=str(e), exception=traceback.format_exc())
+        return remove_values(result, no_log)
+
+    def run(self):
+        devices = self._params['devices']
+        with ThreadPoolExecutor(max_workers=min(self._forks, max(1, len(devices)))) as executor:
+            device_results = list(executor.map(self._run_device, devices))
+
+        failed = [item['server'] for item in device_results if item.get('failed')]
+        changed = [item['server'] for item in device_results if item.get('changed')]
+        result = dict(changed=bool(changed), devices=device_results,
+                      status=f'{len(changed)} of {len(device_results)} devices changed')
+        if failed:
+            result.update(failed=True, msg=f'{len(failed)} of {len(device_results)} devices failed: {", ".join(str(s) for s in failed)}')
+        return result
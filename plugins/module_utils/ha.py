@@ -0,0 +1,99 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.bulk import entry_fingerprint
+try:
+    from radware.sdk.exceptions import RadwareError
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: High availability primary execution module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+HA_MODE_ALL = 'all'
+HA_MODE_PRIMARY = 'primary'
+HA_ROLE_MASTER = 'master'
+# devices outside of an HA pair are configured directly
+HA_ROLE_NONE = 'none'
+MSG_HA_SKIPPED = 'not the HA master, configuration is synced from the master'
+
+
+def ha_role(mng):
+    """
+    HA state of the device, `none` when the device is not part of an HA pair (VX included)
+    """
+    try:
+        state = mng.info.ha_state
+    except RadwareError as e:
+        raise RadwareModuleError(e) from e
+    return str(state).lower() if state else HA_ROLE_NONE
+
+
+def config_checksum(config):
+    # digest of a configurator read, None when the object does not exist on the device
+    if config is None:
+        return None
+    return entry_fingerprint(config.translate_to_dict())
+
+
+class HighAvailabilityPrimary(object):
+    """
+    primary only execution of an HA pair
+    configuration is written and applied on the HA master only and pushed to the peers with a config sync.
+    the peers are then verified by comparing the checksum of every written object with the master, each object is
+    read by its index so neither a second push nor a full read of the peer configuration is needed
+    """
+    def __init__(self, mng, connection, peer_connection, peers=None):
+        self._mng = mng
+        self._connection = connection
+        self._peer_connection = peer_connection
+        self._peers = peers or []
+
+    @staticmethod
+    def _object_id(parameters):
+        return ', '.join(str(getattr(parameters, field, None)) for field in parameters.get_required_fields())
+
+    def _checksums(self, connection, objects):
+        checksums = []
+        for configurator_class, parameters in objects:
+            try:
+                config = configurator_class(connection).read(parameters)
+            except RadwareError as e:
+                raise RadwareModuleError(e) from e
+            checksums.append(config_checksum(config))
+        return checksums
+
+    def commit(self, objects):
+        """
+        apply on the master, sync the peers and verify the written objects on every peer
+        objects are the (configurator class, parameters) pairs written by the run
+        """
+        try:
+            self._mng.config.apply()
+            sync_status = self._mng.config.sync()
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+        result = dict(role=HA_ROLE_MASTER, applied=True, synced=sync_status, verified=[])
+        if not self._peers or not objects:
+            return result
+        expected = self._checksums(self._connection, objects)
+        mismatched = []
+        for peer in self._peers:
+            checksums = self._checksums(self._peer_connection(peer), objects)
+            for (configurator_class, parameters), checksum, peer_checksum in zip(objects, expected, checksums):
+                if checksum != peer_checksum:
+                    mismatched.append(f'{peer}: {configurator_class.__name__} {self._object_id(parameters)}')
+            result['verified'].append(peer)
+        if mismatched:
+            raise RadwareModuleError('HA peers differ from the master after config sync:\n' + '\n'.join(mismatched))
+        return result
@@ -0,0 +1,169 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+try:
+    from typing import get_type_hints
+    from radware.sdk.exceptions import RadwareError
+    from radware.alteon.beans.SlbNewCfgEnhRealServerTable import SlbNewCfgEnhRealServerTable
+    from radware.alteon.beans.SlbNewCfgEnhGroupTable import SlbNewCfgEnhGroupTable
+    from radware.alteon.beans.SlbNewSslCfgSSLPolTable import SlbNewSslCfgSSLPolTable
+    from radware.alteon.beans.HaFloatIpNewCfgTable import HaFloatIpNewCfgTable
+    from radware.alteon.beans.BgpNewCfgPeerTable import BgpNewCfgPeerTable
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Alteon free index allocation module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+INDEX = 'index'
+INDEX_AUTO = 'auto'
+UNSET_ADDRESSES = ('', '0.0.0.0', '::', '0:0:0:0:0:0:0:0')
+
+
+def index_allocations():
+    """
+    configurators accepting `index: auto`: configurator name to (bean class, identity fields, object index kind)
+    the first identity field set in the parameters identifies the object, an object with the same identity keeps its
+    index. tables without an object index kind list every index, their rows without identity are free
+    """
+    return {
+        'server': (SlbNewCfgEnhRealServerTable, ('name',), 'server'),
+        'server_group': (SlbNewCfgEnhGroupTable, ('name',), 'server_group'),
+        'ssl_policy': (SlbNewSslCfgSSLPolTable, ('name',), 'ssl_policy'),
+        'ha_floating_ip': (HaFloatIpNewCfgTable, ('ip4_address', 'ip6_address'), None),
+        'bgp_peer': (BgpNewCfgPeerTable, ('remote_addr', 'remote_ipv6_addr'), None)
+    }
+
+
+def _identity(value):
+    if value is None or str(value).strip() in UNSET_ADDRESSES:
+        return None
+    value = str(value).strip()
+    # names are case sensitive, IPv6 addresses are not
+    return value.lower() if ':' in value else value
+
+
+def is_index_auto(parameters):
+    return str((parameters or {}).get(INDEX)).lower() == INDEX_AUTO
+
+
+def allocation_argument_spec(argument_spec, key):
+    # `auto` is accepted in place of a numeric index, the index is converted once resolved
+    if key in index_allocations():
+        argument_spec['parameters']['options'][INDEX].update({"type": 'raw'})
+
+
+class IndexAllocator(object):
+    """
+    index allocation of an object configured with `index: auto`
+    the occupied indexes are read once from the device table, objects found in the object index gathered once per
+    play by alteon_device_object_index keep their index without a table read. the lowest free index is handed out,
+    concurrent tasks of the device are serialized by the device write lock held from the allocation to the write
+    """
+    def __init__(self, configurator, key, connection, object_index=None):
+        self._connection = connection
+        self._bean_class, self._identity_fields, self._kind = index_allocations()[key]
+        attrs = configurator._bean_map[self._bean_class]['attrs']
+        self._attrs = dict((field, attr) for attr, field in attrs.items())
+        self._numeric = get_type_hints(configurator.get_parameters_class()).get(INDEX) is int
+        self._object_index = object_index if object_index is not None and object_index.covers(self._kind) else None
+        self.table_reads = 0
+
+    def _index_value(self, index):
+        return int(index) if self._numeric else str(index)
+
+    def identity(self, parameters):
+        for field in self._identity_fields:
+            value = _identity(parameters.get(field))
+            if value is not None:
+                return field, value
+        raise RadwareModuleError(f'index auto requires {" or ".join(self._identity_fields)}')
+
+    def _occupied(self, cached):
+        """
+        {index: {identity field: identity}} of the configured objects
+        """
+        if cached:
+            return dict((index, {self._identity_fields[0]: _identity(name)})
+                        for index, name in self._object_index.ids(self._kind).items())
+        self.table_reads += 1
+        occupied = {}
+        for row in self._connection.rest.read_all(self._bean_class()):
+            identities = dict((field, _identity(getattr(row, self._attrs[field]))) for field in self._identity_fields)
+            if self._kind is None and not any(identities.values()):
+                continue
+            occupied[str(getattr(row, self._attrs[INDEX]))] = identities
+        return occupied
+
+    def _lookup(self, field, value):
+        """
+        index of the configured object with the identity, None when not configured, and the occupied indexes
+        objects missing from the cached index are looked up in the device table, they may have been created after
+        the index was gathered
+        """
+        cached = self._object_index is not None
+        while True:
+            occupied = self._occupied(cached)
+            for index, identities in occupied.items():
+                if identities.get(field) == value:
+                    return index, occupied
+            if not cached:
+                return None, occupied
+            cached = False
+
+    def find(self, parameters):
+        """
+        index of the configured object with the identity of the parameters, None when not configured
+        """
+        field, value = self.identity(parameters)
+        try:
+            index = self._lookup(field, value)[0]
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+        return None if index is None else self._index_value(index)
+
+    def allocate(self, parameters):
+        """
+        index of the configured object with the identity of the parameters, the lowest free index otherwise
+        """
+        field, value = self.identity(parameters)
+        try:
+            index, occupied = self._lookup(field, value)
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+        if index is None:
+            index = 1
+            while str(index) in occupied:
+                index += 1
+        return self._index_value(index)
+
+
+def prepare_index(key, configurator_class, parameters):
+    """
+    clear `index: auto` of the parameters before the object is read, indexes are converted to the parameters type
+    returns whether the index is allocated by the module
+    """
+    if key not in index_allocations() or not parameters or parameters.get(INDEX) is None:
+        return False
+    if is_index_auto(parameters):
+        parameters[INDEX] = None
+        return True
+    if get_type_hints(configurator_class.get_parameters_class()).get(INDEX) is int:
+        try:
+            parameters[INDEX] = int(parameters[INDEX])
+        except ValueError:
+            raise RadwareModuleError(f'index must be an integer or {INDEX_AUTO}, got {parameters[INDEX]}')
+    else:
+        # as converted by the former str option type
+        parameters[INDEX] = str(parameters[INDEX])
+    return False
@@ -0,0 +1,244 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+try:
+    from radware.sdk.exceptions import RadwareError
+    from radware.alteon.beans.SlbNewCfgEnhGroupTable import SlbNewCfgEnhGroupTable
+    from radware.alteon.beans.SlbNewCfgEnhRealServerTable import SlbNewCfgEnhRealServerTable
+    from radware.alteon.beans.SlbNewCfgEnhVirtServerTable import SlbNewCfgEnhVirtServerTable
+    from radware.alteon.beans.SlbNewSslCfgSSLPolTable import SlbNewSslCfgSSLPolTable
+    from radware.alteon.beans.SlbNewSslCfgCertsTable import SlbNewSslCfgCertsTable
+    from radware.alteon.beans.SlbNewSslCfgGroupsTable import SlbNewSslCfgGroupsTable
+    from radware.alteon.beans.Layer7NewCfgHttpmodListTable import Layer7NewCfgHttpmodListTable
+    from radware.alteon.beans.SlbNewNwclssCfgNetworkClassesTable import SlbNewNwclssCfgNetworkClassesTable
+    from radware.alteon.beans.SlbNewCfgAppShapeTable import SlbNewCfgAppShapeTable
+    from radware.alteon.beans.SlbAdvhcGeneralTable import SlbAdvhcGeneralTable
+    from radware.alteon.beans.SlbNewAdvhcTcpTable import SlbNewAdvhcTcpTable
+    from radware.alteon.beans.SlbNewAdvhcHttpTable import SlbNewAdvhcHttpTable
+    from radware.alteon.beans.SlbNewAdvhcLogexpTable import SlbNewAdvhcLogexpTable
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Alteon object name index module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+OBJECT_INDEX_FACTS = 'alteon_object_index'
+
+object_index_argument_spec = {
+    'object_index': {"required": False, "type": 'dict'}
+}
+
+
+def object_tables():
+    """
+    indexed object kinds, each kind is kept in one or more (bean class, index attribute, name attribute) tables
+    health checks pending creation are not part of the general table yet, their configuration tables are read too
+    """
+    return {
+        'server_group': ((SlbNewCfgEnhGroupTable, 'Index', 'Name'),),
+        'server': ((SlbNewCfgEnhRealServerTable, 'Index', 'Name'),),
+        'virtual_server': ((SlbNewCfgEnhVirtServerTable, 'VirtServerIndex', 'VirtServerVname'),),
+        'ssl_policy': ((SlbNewSslCfgSSLPolTable, 'NameIdIndex', 'Name'),),
+        'ssl_cert': ((SlbNewSslCfgCertsTable, 'ID', 'Name'),),
+        'ssl_cert_group': ((SlbNewSslCfgGroupsTable, 'ID', 'Name'),),
+        'http_mod_policy': ((Layer7NewCfgHttpmodListTable, 'NameIdIndex', 'Name'),),
+        'network_class': ((SlbNewNwclssCfgNetworkClassesTable, 'Id', 'Name'),),
+        'appshape': ((SlbNewCfgAppShapeTable, 'Index', 'Name'),),
+        'health_check': ((SlbAdvhcGeneralTable, 'ID', 'Name'), (SlbNewAdvhcTcpTable, 'ID', 'Name'),
+                         (SlbNewAdvhcHttpTable, 'ID', 'Name'), (SlbNewAdvhcLogexpTable, 'ID', 'Name'))
+    }
+
+
+OBJECT_KINDS = ['server_group', 'server', 'virtual_server', 'ssl_policy', 'ssl_cert', 'ssl_cert_group',
+                'http_mod_policy', 'network_class', 'appshape', 'health_check']
+
+# parameter fields referencing indexed objects per configurator name, `list_field.item_field` for list of structs
+CONFIGURATOR_REFERENCES = {
+    'virtual_service': {
+        'server_group_name': ('server_group',),
+        'ssl_policy_name': ('ssl_policy',),
+        'server_cert_name': ('ssl_cert', 'ssl_cert_group'),
+        'http_mod_policy_name': ('http_mod_policy',),
+        'nat_network_class_name': ('network_class',),
+        'appshapes.name': ('appshape',)
+    },
+    'server': {
+        'health_check_id': ('health_check',),
+        'nat_network_class_name': ('network_class',)
+    },
+    'server_group': {
+        'health_check_id': ('health_check',),
+        'backup_server_name': ('server',),
+        'backup_group_name': ('server_group',),
+        'secondary_backup_group_name': ('server_group',),
+        'server_names': ('server',)
+    },
+    'group_real_server': {
+        'group_index': ('server_group',),
+        'real_server_index': ('server',)
+    },
+    'fdn_server': {
+        'group_id': ('server_group',),
+        'template_server_name': ('server',)
+    },
+    'content_rule': {
+        'virtual_server_id': ('virtual_server',),
+        'group_id': ('server_group',)
+    },
+    'sideband_policy': {
+        'group_id': ('server_group',)
+    },
+    'gslb_network': {
+        'virtual_server_names': ('virtual_server',),
+        'server_names': ('server',),
+        'src_network_class_id': ('network_class',)
+    },
+    'ssl_cert_group': {
+        'certificate_names': ('ssl_cert',)
+    }
+}
+
+
+def _key(value):
+    return None if value is None else str(value)
+
+
+def _read_table(rest, bean_class):
+    # tables missing on the device platform or version leave their kind out of the index
+    try:
+        return rest.read_all(bean_class())
+    except RadwareError:
+        return None
+
+
+def read_objects(connection, kinds=None):
+    """
+    {kind: {index: name}} of the device objects, every referenced table is read once and concurrently
+    kinds with an unreadable table are not returned, their references are checked against the device
+    """
+    tables = object_tables()
+    kinds = list(kinds or OBJECT_KINDS)
+    calls = [(_read_table, connection.rest, bean_class) for kind in kinds for bean_class, _, _ in tables[kind]]
+    rows = iter(connection.engine.run_all(calls))
+    objects = {}
+    for kind in kinds:
+        results = [(next(rows), index_attr, name_attr) for _, index_attr, name_attr in tables[kind]]
+        if any(result is None for result, _, _ in results):
+            continue
+        objects[kind] = {}
+        for result, index_attr, name_attr in results:
+            for row in result:
+                objects[kind].setdefault(_key(getattr(row, index_attr)), getattr(row, name_attr) or None)
+    return objects
+
+
+class ObjectIndex(object):
+    """
+    name to index lookup of the device objects referenced by configurator parameters
+    built from `alteon_object_index` facts, a reference is either the object index or its name, both resolved with
+    a single dict lookup. references missing from the index are re-read from the device once per kind, objects
+    created after the facts were gathered are still resolved
+    """
+    def __init__(self, objects=None, connection=None):
+        self._connection = connection
+        self._ids = {}
+        self._names = {}
+        self._refreshed = set()
+        self.update(objects or {})
+
+    def update(self, objects):
+        for kind, kind_objects in objects.items():
+            ids = dict((_key(object_id), name) for object_id, name in (kind_objects or {}).items())
+            names = {}
+            for object_id, name in ids.items():
+                if name:
+                    names.setdefault(name, []).append(object_id)
+            self._ids[kind] = ids
+            self._names[kind] = names
+
+    def covers(self, kind):
+        return kind in self._ids
+
+    def ids(self, kind):
+        return self._ids.get(kind)
+
+    def table_ids(self, bean_class):
+        """
+        indexes of the objects kept in a table, None when the table is not indexed
+        """
+        for kind, tables in object_tables().items():
+            if self.covers(kind) and any(table_class is bean_class for table_class, _, _ in tables):
+                return self._ids[kind]
+        return None
+
+    def _lookup(self, kinds, value):
+        for kind in kinds:
+            if value in self._ids.get(kind, {}):
+                return value
+        matches = [object_id for kind in kinds for object_id in self._names.get(kind, {}).get(value, [])]
+        if len(matches) > 1:
+            raise RadwareModuleError(f'{value} is the name of several {"/".join(kinds)} objects: '
+                                     f'{", ".join(matches)}, reference it by index')
+        return matches[0] if matches else None
+
+    def _refresh(self, kinds):
+        kinds = [kind for kind in kinds if kind not in self._refreshed]
+        if self._connection is None or not kinds:
+            return False
+        self._refreshed.update(kinds)
+        self.update(read_objects(self._connection, kinds))
+        return True
+
+    def resolve(self, kinds, value):
+        """
+        index of the object referenced by value, None when no such object exists
+        references of kinds missing from the index are left to the device and returned as is
+        """
+        value = _key(value)
+        if not all(self.covers(kind) for kind in kinds):
+            return value
+        object_id = self._lookup(kinds, value)
+        if object_id is None and self._refresh(kinds):
+            object_id = self._lookup(kinds, value)
+        return object_id
+
+    def resolve_parameters(self, references, parameters):
+        """
+        replace the object names referenced by the parameters with their index
+        returns the resolved {field: {name: index}} and the unresolved `field=value` references
+        """
+        resolved = {}
+        missing = []
+
+        def resolve_value(field, value):
+            if value is None or value == '':
+                return value
+            object_id = self.resolve(references[field], value)
+            if object_id is None:
+                missing.append(f'{field}={value}')
+                return value
+            if object_id != _key(value):
+                resolved.setdefault(field, {})[value] = object_id
+            return object_id
+
+        for field in references:
+            if '.' in field:
+                list_field, item_field = field.split('.', 1)
+                for item in parameters.get(list_field) or []:
+                    if item:
+                        item[item_field] = resolve_value(field, item.get(item_field))
+            elif isinstance(parameters.get(field), list):
+                parameters[field] = [resolve_value(field, value) for value in parameters[field]]
+            elif field in parameters:
+                parameters[field] = resolve_value(field, parameters[field])
+        return resolved, missing
@@ -0,0 +1,327 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import shlex
+from ansible.module_utils.basic import AnsibleModule
+try:
+    from typing import get_type_hints
+    from radware.alteon.api.config import AlteonConfigurators
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Alteon offline configuration model module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+MENU_PREFIX = '/'
+SCRIPT_MARKERS = ['script start', 'script end']
+COMMENT_PREFIX = '/*'
+
+# configurators translated from a configuration dump, other menus are left unparsed
+OFFLINE_CONFIGURATORS = ['server', 'server_group', 'virtual_server', 'virtual_service', 'l2_vlan', 'l3_interface',
+                         'ssl_policy']
+
+IP_VER_CHOICES = {'v4': 'ipv4', 'v6': 'ipv6', 'mixed': 'mixed'}
+ENA_DIS_CHOICES = {'ena': 'enabled', 'dis': 'disabled', 'e': 'enabled', 'd': 'disabled'}
+GROUP_METRIC_CHOICES = {'roundrobin': 'roundRobin', 'leastconns': 'leastConnections', 'minmisses': 'minMisses',
+                        'hash': 'hash', 'response': 'response', 'bandwidth': 'bandwidth', 'phash': 'phash',
+                        'svcleast': 'svcLeast', 'hrw': 'hrw'}
+SERVICE_APPLICATION_CHOICES = {'basic-slb': 'basic_slb', 'ftp-data': 'ftp_data'}
+SERVICE_PROTOCOL_CHOICES = {'tcp': 'tcp', 'udp': 'udp', 'stateless': 'stateless', 'tcpudp': 'tcpAndUdp'}
+SERVICE_PBIND_CHOICES = {'clientip': 'clientip', 'disable': 'disabled', 'sslid': 'sslid', 'cookie': 'cookie'}
+
+
+def _token(args):
+    return args[0] if args else None
+
+
+def _set(field, cast=str, choices=None):
+    def handler(values, args):
+        value = _token(args)
+        if value is None:
+            return False
+        if choices is not None:
+            if value.lower() not in choices:
+                return False
+            value = choices[value.lower()]
+        values[field] = cast(value)
+        return True
+    return handler
+
+
+def _const(field, value):
+    def handler(values, args):
+        values[field] = value
+        return True
+    return handler
+
+
+def _append(field, cast=str):
+    def handler(values, args):
+        values.setdefault(field, []).extend(cast(arg) for arg in args)
+        return bool(args)
+    return handler
+
+
+def _address(field4, field6):
+    def handler(values, args):
+        value = _token(args)
+        if value is None:
+            return False
+        values[field6 if ':' in value else field4] = value
+        return True
+    return handler
+
+
+def _state_commands(field='state'):
+    return dict(ena=_const(field, 'enabled'), dis=_const(field, 'disabled'))
+
+
+class MenuTranslator(object):
+    """
+    translate one configuration menu, e.g. `/c/slb/real <index>`, into configurator parameters
+    menus sharing the same configurator and index arguments (e.g. a virtual service and its ssl sub menu)
+    are merged into a single entry
+    """
+    def __init__(self, configurator, indexes, commands):
+        self.configurator = configurator
+        self._indexes = indexes
+        self._commands = commands
+
+    def indexes(self, model, args):
+        return self._indexes(model, args)
+
+    def apply(self, values, command, args):
+        handler = self._commands.get(command)
+        if handler is None:
+            return False
+        return handler(values, args)
+
+
+def _single_index(field, cast=str):
+    return lambda model, args: {field: cast(args[0])}
+
+
+def _service_indexes(model, args):
+    # the dump does not carry the service index, services are numbered by their order of appearance under the
+    # virtual server. snapshots match virtual services by their port instead
+    virt, port = args[0], args[1]
+    ordinal = model.service_ordinal(virt, port)
+    result = dict(index=virt, service_index=ordinal, service_port=int(port))
+    if len(args) > 2:
+        application = args[2].lower()
+        result.update(application_type=SERVICE_APPLICATION_CHOICES.get(application, application))
+    return result
+
+
+def menu_translators():
+    virtual_service = MenuTranslator(
+        'virtual_service', _service_indexes,
+        dict(group=_set('server_group_name'),
+             rport=_set('server_port', int),
+             protocol=_set('protocol', choices=SERVICE_PROTOCOL_CHOICES),
+             dsr=_set('direct_server_return', choices=ENA_DIS_CHOICES),
+             pbind=_set('persistent_mode', choices=SERVICE_PBIND_CHOICES),
+             ptmout=_set('persistent_timeout_minutes', int),
+             tmout=_set('connection_idle_timeout_minutes', int),
+             name=_set('description'),
+             hname=_set('hostname'),
+             redirect=_set('redirect_location'),
+             sslpol=_set('ssl_policy_name'),
+             srvrcert=lambda values, args: _set('server_cert_name')(values, args[1:] if len(args) > 1 else args),
+             httpmod=_set('http_mod_policy_name'),
+             xforward=_set('x_fwd_for_inject', choices=ENA_DIS_CHOICES)))
+    return {
+        'c/slb/real': MenuTranslator(
+            'server', _single_index('index'),
+            dict(ipver=_set('ip_ver', choices=IP_VER_CHOICES),
+                 rip=_address('ip_address', 'ip6_address'),
+                 weight=_set('weight', int),
+                 maxcon=lambda values, args: _set('max_connections', int)(values, args) and
+                 (len(args) < 2 or _set('connection_mode')(values, args[1:])),
+                 name=_set('name'),
+                 health=_set('health_check_id'),
+                 type=lambda values, args: _set('server_type')(values, [f'{_token(args)}_server'] if args else args),
+                 addport=_append('server_ports', int),
+                 **_state_commands())),
+        'c/slb/group': MenuTranslator(
+            'server_group', _single_index('index'),
+            dict(ipver=_set('ip_ver', choices=IP_VER_CHOICES),
+                 metric=_set('slb_metric', choices=GROUP_METRIC_CHOICES),
+                 health=_set('health_check_id'),
+                 add=_append('server_names'),
+                 name=_set('name'),
+                 slowstr=_set('slow_start_time_second', int),
+                 backup=lambda values, args: _set('backup_server_name' if (_token(args) or '').startswith('r')
+                                                  else 'backup_group_name')(values, [_token(args)[1:]] if args else args))),
+        'c/slb/virt': MenuTranslator(
+            'virtual_server', _single_index('index'),
+            dict(ipver=_set('ip_ver', choices=IP_VER_CHOICES),
+                 vip=_address('ip_address', 'ip6_address'),
+                 vname=_set('virtual_server_name'),
+                 dname=_set('domain_name'),
+                 weight=_set('weight', int),
+                 avail=_set('availability', int),
+                 srcnet=_set('src_network_class_id'),
+                 **_state_commands())),
+        'c/slb/virt/service': virtual_service,
+        'c/slb/virt/service/ssl': virtual_service,
+        'c/slb/virt/service/http': virtual_service,
+        'c/l2/vlan': MenuTranslator(
+            'l2_vlan', _single_index('index', int),
+            dict(name=_set('name'),
+                 learn=_set('source_mac_learning', choices=ENA_DIS_CHOICES),
+                 jumbo=_set('jumbo_frame', choices=ENA_DIS_CHOICES),
+                 shared=_set('shared', choices=ENA_DIS_CHOICES),
+                 def_=_append('ports', int),
+                 **_state_commands())),
+        'c/l3/if': MenuTranslator(
+            'l3_interface', _single_index('index', int),
+            dict(ipver=_set('ip_ver', choices=IP_VER_CHOICES),
+                 addr=_address('ip4_address', 'ip6_address'),
+                 mask=lambda values, args: _set('ip6_prefix' if 'ip6_address' in values else 'ip4_subnet',
+                                                int if 'ip6_address' in values else str)(values, args),
+                 vlan=_set('vlan', int),
+                 descr=_set('description'),
+                 peer=_set('peer_ip'),
+                 relay=_set('bootp_relay', choices=ENA_DIS_CHOICES),
+                 **_state_commands())),
+        'c/slb/ssl/sslpol': MenuTranslator(
+            'ssl_policy', _single_index('index'),
+            dict(name=_set('description'),
+                 **_state_commands())),
+        'c/slb/ssl/sslpol/backend': MenuTranslator(
+            'ssl_policy', _single_index('index'),
+            dict(ssl=_set('be_ssl_encryption', choices=ENA_DIS_CHOICES))),
+    }
+
+
+def _split(text):
+    # shlex is only needed for quoted values, most configuration lines are plain tokens
+    if '"' not in text:
+        return text.split()
+    try:
+        return shlex.split(text)
+    except ValueError:
+        return text.split()
+
+
+def parse_menu(line):
+    """
+    split a menu line into its menu key and the arguments of every menu level
+    /c/slb/virt 1/service 80 http -> ('c/slb/virt/service', ['1', '80', 'http'])
+    """
+    names = []
+    args = []
+    for segment in line.strip()[len(MENU_PREFIX):].split('/'):
+        tokens = _split(segment)
+        if not tokens:
+            continue
+        names.append(tokens[0])
+        args.extend(tokens[1:])
+    return '/'.join(names), args
+
+
+def parse_command(line):
+    tokens = _split(line.strip())
+    if not tokens:
+        return None, []
+    command = tokens[0]
+    # python keywords cannot be used as handler names
+    if command in ['def']:
+        command = f'{command}_'
+    return command, tokens[1:]
+
+
+class OfflineConfig(object):
+    """
+    configuration model built from a configuration dump text, without any device connection
+    entries are kept as parameter dictionaries per configurator, as the alteon_config_* modules accept them
+    """
+    def __init__(self, text, translators=None):
+        self._translators = translators if translators is not None else menu_translators()
+        self._entries = {}
+        self._service_ordinals = {}
+        self.unparsed = []
+        self._parse(text)
+
+    def service_ordinal(self, virt, port):
+        services = self._service_ordinals.setdefault(virt, [])
+        if port not in services:
+            services.append(port)
+        return services.index(port) + 1
+
+    def _entry(self, translator, args):
+        indexes = translator.indexes(self, args)
+        key = tuple(sorted(indexes.items()))
+        configurator_entries = self._entries.setdefault(translator.configurator, {})
+        if key not in configurator_entries:
+            configurator_entries[key] = dict(indexes)
+        return configurator_entries[key]
+
+    def _parse(self, text):
+        translator = None
+        values = None
+        for line_number, line in enumerate(text.splitlines(), 1):
+            stripped = line.strip()
+            if not stripped or stripped.startswith(COMMENT_PREFIX) or \
+                    any(stripped.startswith(marker) for marker in SCRIPT_MARKERS):
+                continue
+            if stripped.startswith(MENU_PREFIX) and not line[0].isspace():
+                menu, args = parse_menu(stripped)
+                if not menu:
+                    translator = values = None
+                    continue
+                translator = self._translators.get(menu)
+                values = None
+                if translator is not None:
+                    try:
+                        values = self._entry(translator, args)
+                    except (IndexError, ValueError):
+                        translator = None
+                if translator is None:
+                    self.unparsed.append(line_number)
+                continue
+            if values is None:
+                continue
+            command, args = parse_command(stripped)
+            try:
+                if not translator.apply(values, command, args):
+                    self.unparsed.append(line_number)
+            except (IndexError, ValueError):
+                self.unparsed.append(line_number)
+
+    @property
+    def configurators(self):
+        return list(self._entries.keys())
+
+    def entries(self, configurator):
+        return list(self._entries.get(configurator, {}).values())
+
+    def find(self, configurator, **indexes):
+        for entry in self.entries(configurator):
+            if all(str(entry.get(k)) == str(v) for k, v in indexes.items()):
+                return entry
+        return None
+
+    def parameters(self, configurator):
+        """
+        entries of a configurator as the configurator parameters structs
+        """
+        params_class = get_type_hints(AlteonConfigurators)[configurator].get_parameters_class()
+        result = []
+        for entry in self.entries(configurator):
+            params = params_class()
+            params.set_attributes(**entry)
+            result.append(params)
+        return result
+
+    def to_dict(self):
+        return dict((configurator, self.entries(configurator)) for configurator in self.configurators)
@@ -0,0 +1,124 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import random
+import time
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import retry_server_spec
+try:
+    from radware.sdk.exceptions import RestRequestError
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The radware-sdk-common package is required")
+
+
+DOCUMENTATION = r'''
+module: Device REST retry policy module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+
+class RetryPolicy(object):
+    """
+    replay device REST operations failing on a transient error
+    a request without a response (connection error, timeout) or answered with one of the retryable statuses is
+    replayed after an exponential backoff with jitter, any other error is raised on first occurrence
+    """
+    def __init__(self, retries=3, backoff=0.5, max_backoff=10.0, retry_on_status=None):
+        self.retries = max(1, retries or 1)
+        self.backoff = backoff or 0
+        self.max_backoff = max_backoff or 0
+        self.retry_on_status = set(retry_on_status if retry_on_status is not None else
+                                   retry_server_spec['retry_on_status']['default'])
+        self.replays = 0
+
+    @classmethod
+    def from_provider(cls, provider):
+        provider = provider or {}
+        return cls(retries=provider.get('retries', retry_server_spec['retries']['default']),
+                   backoff=provider.get('retry_backoff', retry_server_spec['retry_backoff']['default']),
+                   max_backoff=provider.get('retry_max_backoff', retry_server_spec['retry_max_backoff']['default']),
+                   retry_on_status=provider.get('retry_on_status'))
+
+    def is_retryable(self, error):
+        if not isinstance(error, RestRequestError):
+            return False
+        status = getattr(error.response, 'status', None)
+        if not status:
+            return True
+        return int(status) in self.retry_on_status
+
+    def delay(self, attempt):
+        delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(delay / 2, delay)
+
+    def call(self, func, *args, **kwargs):
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except RestRequestError as e:
+                if attempt >= self.retries or not self.is_retryable(e):
+                    raise
+                time.sleep(self.delay(attempt))
+                self.replays += 1
+                attempt += 1
+
+
+class RetryDeviceAPI(object):
+    """
+    device REST API guarded by a retry policy
+    bean read, update and delete are idempotent on the device and are replayed as is, the SDK own immediate
+    retry loop is disabled so that every replay goes through the policy backoff
+    """
+    def __init__(self, rest, policy):
+        self._rest = rest
+        self._policy = policy
+
+    def read(self, bean, retries=3, timeout=None):
+        return self._policy.call(self._rest.read, bean, 1, timeout)
+
+    def read_all(self, bean, retries=3, timeout=None):
+        return self._policy.call(self._rest.read_all, bean, 1, timeout)
+
+    def read_all_no_translation(self, bean, retries=3):
+        return self._policy.call(self._rest.read_all_no_translation, bean, 1)
+
+    def update(self, bean, retries=3, dry_run=False, timeout=None):
+        return self._policy.call(self._rest.update, bean, 1, dry_run, timeout)
+
+    def delete(self, bean, retries=3, dry_run=False):
+        return self._policy.call(self._rest.delete, bean, 1, dry_run)
+
+    def __getattr__(self, item):
+        return getattr(self._rest, item)
+
+
+class RetryDeviceConnection(object):
+    """
+    device connection exposing its REST API through a retry policy
+    """
+    def __init__(self, connection, policy):
+        self._connection = connection
+        self._policy = policy
+        self._rest = None
+        self._retry_rest = None
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def rest(self):
+        # the SDK replaces the REST client when the connection details are updated
+        if self._rest is not self._connection.rest:
+            self._rest = self._connection.rest
+            self._retry_rest = RetryDeviceAPI(self._rest, self._policy)
+        return self._retry_rest
+
+    def __getattr__(self, item):
+        return getattr(self._connection, item)
@@ -0,0 +1,125 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.bulk import entry_fingerprint
+try:
+    from radware.sdk.exceptions import RadwareError
+    from radware.sdk.configurator import DeviceConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Configuration session module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+REVERT_SCOPE_DEVICE = 'device'
+REVERT_SCOPE_SESSION = 'session'
+
+session_argument_spec = {
+    'revert_scope': {"required": False, "type": 'str', "choices": [REVERT_SCOPE_DEVICE, REVERT_SCOPE_SESSION],
+                     "default": REVERT_SCOPE_DEVICE},
+    'expected_fingerprint': {"required": False, "type": 'str'}
+}
+
+
+def object_fingerprint(values):
+    """
+    fingerprint of an object read from the device (parameters dict), None when the object does not exist
+    """
+    if values is None:
+        return None
+    return entry_fingerprint(values)
+
+
+class ConfigurationSession(object):
+    """
+    objects touched by a configuration run, with their configuration recorded when the session begins
+    with an expected fingerprint (compare and swap), the run is refused when the object recorded at the beginning
+    no longer has the fingerprint returned by an earlier read task, i.e. another writer changed it in between.
+    revert restores the recorded configuration of the touched objects only, pending changes of other objects are kept
+    """
+    def __init__(self, configurator, expected_fingerprint=None):
+        self._configurator = configurator
+        self._expected_fingerprint = expected_fingerprint
+        self._index_fields = configurator.get_parameters_class()().get_required_fields()
+        self._base = {}
+        self.touched = []
+
+    def _key(self, parameters):
+        return tuple(str(getattr(parameters, field, None)) for field in self._index_fields)
+
+    def begin(self, parameters):
+        key = self._key(parameters)
+        if key in self._base:
+            return
+        base = self._configurator.read(parameters)
+        self._base[key] = base
+        if self._expected_fingerprint is None:
+            return
+        if object_fingerprint(None if base is None else base.translate_to_dict()) != self._expected_fingerprint:
+            raise RadwareModuleError(f'{type(self._configurator).__name__} {", ".join(key)}: changed by another writer '
+                                     f'since it was read, not writing')
+
+    def touch(self, parameters):
+        key = self._key(parameters)
+        if key not in self.touched:
+            self.touched.append(key)
+
+    def _index_parameters(self, key):
+        parameters = self._configurator.get_parameters_class()()
+        parameters.set_attributes(**dict(zip(self._index_fields, key)))
+        return parameters
+
+    def revert(self, config_manager):
+        """
+        restore the touched objects, returns the objects which could not be restored
+        """
+        failed = []
+        for key in reversed(self.touched):
+            base = self._base.get(key)
+            try:
+                if base is None:
+                    config_manager.execute(self._configurator, DeviceConfigurator.DELETE, self._index_parameters(key))
+                elif self._index_fields:
+                    config_manager.execute(self._configurator, DeviceConfigurator.DEPLOY, base)
+                else:
+                    config_manager.execute(self._configurator, DeviceConfigurator.UPDATE, base)
+            except RadwareError:
+                failed.append(key)
+        self.touched = []
+        return failed
+
+
+class SessionConfigurator(object):
+    """
+    configurator recording every object written through it in a `ConfigurationSession`
+    """
+    def __init__(self, configurator, session):
+        self._configurator = configurator
+        self._session = session
+
+    def _write(self, func, parameters, dry_run, **kw):
+        if not dry_run:
+            self._session.touch(parameters)
+        return func(parameters, dry_run=dry_run, **kw)
+
+    def update(self, parameters, dry_run=False, **kw):
+        return self._write(self._configurator.update, parameters, dry_run, **kw)
+
+    def delete(self, parameters, dry_run=False, **kw):
+        return self._write(self._configurator.delete, parameters, dry_run, **kw)
+
+    def deploy(self, parameters, dry_run=False, **kw):
+        return self._write(self._configurator.deploy, parameters, dry_run, **kw)
+
+    def __getattr__(self, item):
+        return getattr(self._configurator, item)
@@ -0,0 +1,134 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.offline_config import OfflineConfig, \
+    OFFLINE_CONFIGURATORS
+try:
+    from typing import get_type_hints
+    from radware.alteon.api.config import AlteonConfigurators
+    from radware.sdk.configurator import MSG_UPDATE, MSG_DELETE, MSG_DEPLOY
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        AnsibleModule(argument_spec={}, check_invalid_arguments=False).fail_json(msg="The alteon-sdk package is required")
+
+
+DOCUMENTATION = r'''
+module: Device configuration snapshot module
+author:
+  - Leon Meguira (@leonmeguira)
+'''
+
+snapshot_argument_spec = {
+    'snapshot': {"required": False, "type": 'dict'},
+    'snapshot_src': {"required": False, "type": 'path'}
+}
+
+# the dump does not carry the index of a virtual service, it is matched by its virtual server and port
+SNAPSHOT_MATCH_FIELDS = dict(virtual_service=['index', 'service_port'])
+
+
+def configurator_key(configurator_class):
+    for key, value in get_type_hints(AlteonConfigurators).items():
+        if value is configurator_class:
+            return key
+    return None
+
+
+def load_snapshot(snapshot=None, snapshot_src=None):
+    """
+    configurator entries keyed by configurator name, either provided as is (e.g. alteon_offline_config_facts
+    config_obj) or parsed from a configuration file saved by config_download
+    a configuration file covers the OFFLINE_CONFIGURATORS only, every one of them is present (possibly without
+    entries), other configurators are evaluated against the device
+    """
+    if snapshot is not None and snapshot_src is not None:
+        raise RadwareModuleError('parameters are mutually exclusive: snapshot|snapshot_src')
+    if snapshot is not None:
+        return snapshot
+    if snapshot_src is None:
+        return None
+    try:
+        with open(snapshot_src) as snapshot_file:
+            config = OfflineConfig(snapshot_file.read())
+    except IOError as e:
+        raise RadwareModuleError(f'unable to read snapshot file {snapshot_src}: {e}') from e
+    return dict((key, config.entries(key)) for key in OFFLINE_CONFIGURATORS)
+
+
+class SnapshotConfigurator(object):
+    """
+    configurator answering reads from a device configuration snapshot, for check mode evaluation
+    without device access
+    entries are indexed by their required (index) fields, and by their SNAPSHOT_MATCH_FIELDS when the dump
+    does not carry the index, a read is a single dictionary lookup
+    a configuration dump omits the fields left at their default value, the default is not known offline: fields
+    missing from an entry are left unset and requested values for them are reported as changes
+    write functions only run as dry run and never reach the device
+    """
+    def __init__(self, configurator, entries):
+        self._configurator = configurator
+        self._params_class = configurator.get_parameters_class()
+        self._index_fields = self._params_class().get_required_fields()
+        self._match_fields = SNAPSHOT_MATCH_FIELDS.get(configurator_key(type(configurator)))
+        self._entries = {}
+        self._matched_entries = {}
+        for entry in entries or []:
+            self._entries[self._key(entry, self._index_fields)] = entry
+            if self._match_fields:
+                self._matched_entries[self._key(entry, self._match_fields)] = entry
+
+    @staticmethod
+    def _key(values, fields):
+        return tuple(str(values.get(field)) for field in fields)
+
+    def _find(self, parameters):
+        values = vars(parameters)
+        # the requested index is only used when the match fields are not all provided
+        if self._match_fields and all(values.get(field) is not None for field in self._match_fields):
+            return self._matched_entries.get(self._key(values, self._match_fields))
+        return self._entries.get(self._key(values, self._index_fields))
+
+    def _object_id(self, parameters):
+        return ' ,'.join(str(getattr(parameters, field)) for field in self._index_fields
+                         if getattr(parameters, field, None) is not None)
+
+    @property
+    def id(self):
+        return self._configurator.id
+
+    def get_parameters_class(self):
+        return self._params_class
+
+    def dry_run_delete_procedure(self, diff):
+        return self._configurator.dry_run_delete_procedure(diff)
+
+    def read(self, parameters, validate_required=True, **kw):
+        entry = self._find(parameters)
+        if entry is None:
+            return None
+        result = self._params_class()
+        result.set_attributes(**entry)
+        # only the identity is taken from the request, a matched virtual service keeps the requested service index
+        result.copy_parameters_required_fields(parameters)
+        return result
+
+    def _dry_run_only(self, dry_run):
+        if not dry_run:
+            raise RadwareModuleError('configuration snapshot is used for check mode only')
+
+    def update(self, parameters, dry_run=False, remove_items=None, **kw):
+        self._dry_run_only(dry_run)
+        return self._object_id(parameters) + MSG_UPDATE
+
+    def delete(self, parameters, dry_run=False, **kw):
+        self._dry_run_only(dry_run)
+        return self._object_id(parameters) + MSG_DELETE
+
+    def deploy(self, parameters, dry_run=False, **kw):
+        self._dry_run_only(dry_run)
+        return self._object_id(parameters) + MSG_DEPLOY
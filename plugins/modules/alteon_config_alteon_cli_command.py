@@ -64,6 +64,96 @@ options:
           - Timeout for connection.
         required: true
         default: null
+      retries:
+        description:
+          - Maximum attempts of a device REST request failing on a transient error.
+        required: false
+        default: 3
+        type: int
+      retry_backoff:
+        description:
+          - Base delay in seconds between attempts, doubled on every attempt and randomized by a jitter.
+        required: false
+        default: 0.5
+        type: float
+      retry_max_backoff:
+        description:
+          - Maximum delay in seconds between attempts.
+        required: false
+        default: 10.0
+        type: float
+      retry_on_status:
+        description:
+          - HTTP statuses considered transient.
+          - Requests without a response, e.g. on timeout, are always retried.
+        required: false
+        default: [500, 502, 503, 504]
+        type: list
+        elements: int
+      lock:
+        description:
+          - Serialize configuration writes and apply, save and revert to the device among the tasks of this controller.
+          - Writers are served in arrival order through a queue directory per device.
+        required: false
+        default: false
+        type: bool
+      lock_section:
+        description:
+          - Configuration section guarded by the lock.
+          - Writers of different sections of one device run concurrently, C(device) waits for all sections.
+          - Apply, save and revert always lock the whole device.
+        required: false
+        default: device
+        type: str
+      lock_dir:
+        description:
+          - Directory holding the lock queues, shared by the writers of the controller.
+          - Defaults to a directory under the system temporary directory.
+        required: false
+        type: path
+      lock_timeout:
+        description:
+          - Maximum seconds waiting for the lock before failing.
+        required: false
+        default: 600
+        type: int
+      lock_lease:
+        description:
+          - Seconds after which a lock left by an interrupted writer is dropped.
+          - The lease applies to writers of other hosts sharing I(lock_dir), a writer of this host keeps its lock while
+            its process runs. The lock of a running writer is refreshed every third of the lease.
+        required: false
+        default: 900
+        type: int
+      ha_mode:
+        description:
+          - When C(primary), configuration is written to the HA master only. The master applies the changes and
+            syncs them to its peers, HA peers which are not the master are skipped.
+          - Devices which are not part of an HA pair are configured as with C(all).
+        required: false
+        default: all
+        type: str
+        choices:
+        - all
+        - primary
+      ha_peers:
+        description:
+          - Addresses of the HA peers of the master, sharing the master credentials.
+          - With I(ha_mode=primary), the objects written by the task are compared on every peer after the
+            config sync, by checksum of the object configuration.
+        required: false
+        type: list
+        elements: str
+      read_concurrency:
+        description:
+          - Maximum number of independent device reads run concurrently, e.g. the tables of the configured
+            object or the configurators and state tables gathered as facts.
+          - Reads share the keep-alive connections of the device, C(1) reads one table at a time.
+          - Concurrent reads need a keep-alive connection pool sized for them in the SDK REST client, reads run one
+            table at a time with a warning when the installed SDK does not allow it.
+        required: false
+        default: 1
+        type: int
   state:
     description:
       - When C(present), guarantees that the object exists with the provided attributes.
@@ -86,12 +176,89 @@ options:
     required: false
     default: false
     type: bool
+  capabilities:
+    description:
+      - Device capabilities gathered by M(radware.radware_alteon.alteon_device_capabilities).
+      - When provided, configuration not supported by the device platform is skipped without contacting the device.
+    required: false
+    type: dict
+  object_index:
+    description:
+      - Object index gathered by M(radware.radware_alteon.alteon_device_object_index).
+      - When provided, referenced objects such as server groups, real servers, health checks, SSL policies and
+        network classes are checked against the index before the device is written and referenced object names
+        are replaced with their index.
+      - References missing from the index are looked up on the device once, the task fails when the object does
+        not exist.
+    required: false
+    type: dict
+  snapshot:
+    description:
+      - Device configuration snapshot, configuration entries per configurator name as returned by
+        M(radware.radware_alteon.alteon_offline_config_facts) I(config_obj).
+      - In check mode, changes are evaluated against the snapshot without contacting the device.
+      - Mutually exclusive with I(snapshot_src).
+    required: false
+    type: dict
+  snapshot_src:
+    description:
+      - Path of a configuration file saved from the device, used as the check mode snapshot.
+      - Only the server, server_group, virtual_server, virtual_service, l2_vlan, l3_interface and ssl_policy
+        configurators are read from the file, other configurators are evaluated against the device.
+      - The file omits the fields left at their default value, requested fields missing from the file are reported
+        as changes.
+      - The file does not carry the index of a virtual service, virtual services are matched by their virtual
+        server and I(service_port) when provided.
+      - Mutually exclusive with I(snapshot).
+    required: false
+    type: path
+  revert_scope:
+    description:
+      - Scope of the revert performed when I(revert_on_error=true).
+      - When C(device), all the pending configuration of the device is reverted.
+      - When C(session), only the objects written by the task are restored to their configuration when the task
+        started, pending changes of other writers are kept.
+    required: false
+    default: device
+    type: str
+    choices:
+    - device
+    - session
+  expected_fingerprint:
+    description:
+      - Compare and swap, I(fingerprint) of the object returned by an earlier C(read) task.
+      - The task fails without writing when the object no longer has this fingerprint, i.e. another writer
+        changed or removed it since it was read.
+      - Enable the provider I(lock) so no other writer lands between the check and the write.
+    required: false
+    type: str
   write_on_change:
     description:
       - Executes Alteon write calls only when an actual change has been evaluated.
     required: false
     default: false
     type: bool
+  commands:
+    description:
+      - List of Alteon CLI commands in one-line format, executed in order over a single device connection.
+      - Execution stops on the first failing command, the error reports its position in the list.
+      - Mutually exclusive with I(src) and I(parameters).
+    required: false
+    type: list
+    elements: str
+  src:
+    description:
+      - Path to a script file of Alteon CLI commands in one-line format, one command per line.
+      - Empty lines and lines starting with C(#) are skipped, the error of a failing command reports its line number.
+      - Mutually exclusive with I(commands) and I(parameters).
+    required: false
+    type: path
+  apply:
+    description:
+      - Apply the configuration once after all I(commands) or I(src) commands were executed successfully.
+    required: false
+    default: false
+    type: bool
   parameters:
     description:
       - Allows to configure Alteon CLI command as free text.
@@ -120,6 +287,8 @@ notes:
       but the parameters after from the invalid one are not. The user will get indication that the command has failed
       (failed = 1), but in order to know on which parameter he will have to perform diff on the device.
   - When the command is successful (failed=0), the changed field is not set and it remains changed=0, even though the change was performed.
+  - When executing I(commands) or I(src), changed is set once commands were executed. In check mode the commands are
+      only listed and not sent to the device.
 requirements:
   - alteon-sdk
 '''
@@ -138,6 +307,37 @@ EXAMPLES = r'''
     state: present
     parameters:
       alteon_cli_command: /c/slb/real 1/ena/rip 1.2.3.4
+
+- name: alteon configuration commands batch
+  radware.radware_alteon.alteon_config_alteon_cli_command:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    apply: true
+    commands:
+      - /c/slb/real 1/ena/rip 1.2.3.4
+      - /c/slb/real 2/ena/rip 1.2.3.5
+      - /c/slb/group 1/add 1/add 2
+
+- name: alteon configuration commands script
+  radware.radware_alteon.alteon_config_alteon_cli_command:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    apply: true
+    src: /tmp/migration.cli
 '''
 
 RETURN = r'''
@@ -150,36 +350,131 @@ obj:
   description: parameters object type
   returned: changed, read
   type: dict
+fingerprint:
+  description: Fingerprint of the object read, passed as I(expected_fingerprint) to a later task
+  returned: read
+  type: str
+  sample: 9f2c41d7a0e6b5c3d2e1f0a9b8c7d6e5f4a3b2c1d0e9f8a7b6c5d4e3f2a1b0c9
+commands:
+  description: Executed commands with their line number and execution time in seconds
+  returned: when commands or src are provided
+  type: list
+  sample: [{"line": 1, "command": "/c/slb/real 1/ena/rip 1.2.3.4", "elapsed": 0.182}]
+elapsed:
+  description: Total execution time of the commands in seconds, apply excluded
+  returned: when commands or src are provided
+  type: float
+  sample: 12.4
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+import time
 import traceback
 
 from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
 from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonConfigurationModule, \
     AlteonConfigurationArgumentSpec as ArgumentSpec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.device_lock import LOCK_SECTION_DEVICE
+from ansible_collections.radware.radware_alteon.plugins.module_utils.ha import MSG_HA_SKIPPED
 try:
     from radware.alteon.sdk.configurators.alteon_cli_command import AlteonCliCommandConfigurator
+    from radware.sdk.exceptions import RadwareError
 except ModuleNotFoundError:
     if __name__ == '__main__':
         module_args = {'parameters': {'type': 'dict', 'required': False},
                        'provider': {'type': 'dict', 'required': True},
                        'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'capabilities': {'required': False, 'type': 'dict'},
+                       'snapshot': {'required': False, 'type': 'dict'},
+                       'snapshot_src': {'required': False, 'type': 'path'},
+                       'revert_scope': {'required': False, 'type': 'str', 'default': 'device'},
+                       'expected_fingerprint': {'required': False, 'type': 'str'},
                        'write_on_change': {'required': False, 'type': 'bool', 'default': False},
+                       'commands': {'required': False, 'type': 'list', 'elements': 'str'},
+                       'src': {'required': False, 'type': 'path'},
+                       'apply': {'required': False, 'type': 'bool', 'default': False},
                        'state': {'required': True, 'choices': ['present', 'absent', 'read', 'overwrite', 'append']}
                        }
         module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
         module.fail_json(msg="The alteon-sdk package is required")
 
 
+BATCH_STATES = ['present', 'append']
+
+
 class ModuleManager(AlteonConfigurationModule):
     def __init__(self, **kwargs):
         super(ModuleManager, self).__init__(AlteonCliCommandConfigurator, **kwargs)
 
+    def _batch_commands(self):
+        # (line number, command) pairs, script lines that are empty or comments keep their numbering
+        if self.params.get('commands'):
+            return [(idx, cmd.strip()) for idx, cmd in enumerate(self.params['commands'], 1) if cmd.strip()]
+        if self.params.get('src'):
+            try:
+                with open(self.params['src']) as script:
+                    lines = script.read().splitlines()
+            except IOError as e:
+                raise RadwareModuleError(f'unable to read commands file {self.params["src"]}: {e}') from e
+            return [(idx, line.strip()) for idx, line in enumerate(lines, 1)
+                    if line.strip() and not line.strip().startswith('#')]
+        return None
+
+    def exec_module(self):
+        commands = self._batch_commands()
+        if commands is None:
+            return super().exec_module()
+        if self._state not in BATCH_STATES:
+            raise RadwareModuleError(f'state {self._state} is not supported with commands, supported: {BATCH_STATES}')
+        role = self.ha_skipped()
+        if role is not None:
+            return dict(changed=False, status=MSG_HA_SKIPPED, commands=[], elapsed=0, ha=dict(role=role))
+
+        if self.module.check_mode:
+            executed = [dict(line=line, command=command, elapsed=0) for line, command in commands]
+            return dict(changed=bool(executed), status=f'{len(executed)} commands to execute', commands=executed,
+                        elapsed=0)
+        # CLI commands may touch any part of the configuration and apply commits it all, the whole device is locked
+        return self.exec_locked(lambda: self._exec_batch(commands), LOCK_SECTION_DEVICE)
+
+    def _exec_batch(self, commands):
+        executed = []
+        start = time.time()
+        for line, command in commands:
+            params = self._configurator.get_parameters_class()()
+            params.set_attributes(alteon_cli_command=command)
+            command_start = time.time()
+            try:
+                self._config_manager.execute(self._configurator, self.command, params)
+            except RadwareError as e:
+                self._on_error()
+                raise RadwareModuleError(f'command at line {line} failed: {command}\n{e}') from e
+            executed.append(dict(line=line, command=command, elapsed=round(time.time() - command_start, 3)))
+        elapsed = round(time.time() - start, 3)
+
+        result = dict(changed=bool(executed), status=f'{len(executed)} commands executed', commands=executed,
+                      elapsed=elapsed)
+        if executed and self.ha_commits:
+            # CLI commands do not map to configurator objects, the peers are synced without the checksum verification
+            if self.provider.get('ha_peers'):
+                self.module.warn('CLI commands are synced to the HA peers without verification')
+            result.update(ha=self.ha_commit([]))
+        elif executed and self.params.get('apply'):
+            try:
+                self._mng.config.apply()
+            except RadwareError as e:
+                self._on_error()
+                raise RadwareModuleError(e) from e
+        return result
+
 
 def main():
     spec = ArgumentSpec(AlteonCliCommandConfigurator)
-    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+    spec.argument_spec.update({"commands": {"required": False, "type": "list", "elements": "str"},
+                               "src": {"required": False, "type": "path"},
+                               "apply": {"required": False, "type": "bool", "default": False}})
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode,
+                           mutually_exclusive=[['commands', 'src', 'parameters']])
 
     try:
         mm = ModuleManager(module=module)
@@ -0,0 +1,551 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_config_bgp_peer_bulk
+short_description: Manage the BGP peers and aggregations of Radware Alteon
+description:
+  - Manage a set of BGP peers and aggregations in Radware Alteon in a single task.
+  - Peers are identified by their remote address and aggregations by their address and mask, device indexes are
+    resolved from the current configuration and free indexes are allocated to new entries.
+  - BGP peer and aggregation tables are read once, each entry is evaluated locally and only the changed entries are
+    written to the device.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  state:
+    description:
+      - When C(present), guarantees that the peers and aggregations exist with the provided attributes.
+      - When C(absent), removes the listed peers and aggregations. Entries not found on the device are ignored.
+      - When C(append), append peers and aggregations configuration with the provided parameters.
+    required: false
+    default: present
+    type: str
+    choices:
+    - present
+    - absent
+    - append
+  purge:
+    description:
+      - When C(true) and I(state=present), device peers and aggregations that are not listed are removed.
+    required: false
+    default: false
+    type: bool
+  peers:
+    description:
+      - BGP peers.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_bgp_peer).
+      - Peers are identified by I(remote_addr) or I(remote_ipv6_addr).
+      - When I(index) is not set, the index of the device peer with the same remote address is used, or the lowest free
+        index for a new peer.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - peer ID.
+          - Allocated automatically when not set.
+        required: false
+        default: null
+        type: int
+      remote_addr:
+        description:
+          - The remote IP address of the BGP peer.
+        required: false
+        default: null
+        type: str
+      remote_as_number:
+        description:
+          - Set the remote automonos system (AS) number of the BGP peer using plain notation. 0 means none.
+          - Use either this or remote_asdot_number (as asdot notation), but not both.
+        required: false
+        default: null
+        type: int
+      remote_asdot_number:
+        description:
+          - Set the remote automonos system (AS) number of the BGP peer, using asdot notation.
+          - Use either this or remote_as_number (as plain notation), but not both.
+          - This field is available from alteon versions 32.6.10.0, 33.0.5.0 and 33.5.1.0.
+          - It is recommended to wrap the text in " ".
+        required: false
+        default: null
+        type: str
+      ttl:
+        description:
+          - The time-to-live value in seconds of the BGP peer IP datagram.
+        required: false
+        default: 1
+        type: int
+      state:
+        description:
+          - Enable or disable the peer.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      advertised_route_metric:
+        description:
+          - Set default-metric of advertized routes.
+        required: false
+        default: null
+        type: int
+      default_route_action:
+        description:
+          - Set the value of default route action.
+        required: false
+        default: none
+        choices:
+        - none
+        - import_
+        - originate
+        - redistribute
+      advertising_ospf_routes:
+        description:
+          - Enable or disable advertising OSPF routes.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      advertising_fixed_routes:
+        description:
+          - Enable or disable advertising fixed routes.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      advertising_static_routes:
+        description:
+          - Enable or disable advertising static routes.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      advertising_vip_routes:
+        description:
+          - Enable or disable advertising VIP routes.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      hold_time:
+        description:
+          - Specifies the period of time in seconds that will elapse before the
+          - peer session is torn down because Alteon has not received a Keep-Alive
+          - message from the peer.
+        required: false
+        default: 180
+        type: int
+      keep_alive_time:
+        description:
+          - The keep-alive time value in seconds of the BGP peer IP datagram.
+        required: false
+        default: 60
+        type: int
+      min_adv_time:
+        description:
+          - Specifies the minimum time in seconds between advertisements of the BGP peer IP datagram.
+        required: false
+        default: 60
+        type: int
+      connect_retry_interval:
+        description:
+          - Specifies the connection retry interval in seconds of the BGP peer IP datagram.
+        required: false
+        default: 120
+        type: int
+      min_as_origination_interval:
+        description:
+          - Specifies the minimum time in seconds between route originations of the BGP peer IP datagram.
+        required: false
+        default: 30
+        type: int
+      advertising_rip_routes:
+        description:
+          - Enable or disable advertising RIP routes.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      advertising_deny_routes:
+        description:
+          - Enable or disable advertising deny routes.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      next_hop_addr:
+        description:
+          - The IP address that Alteon advertises to BGP peers.
+        required: false
+        default: null
+        type: str
+      bfd:
+        description:
+          - Enable or disable Bidirectional Forwarding Detection (BFD).
+        required: false
+        default: off
+        choices:
+        - on
+        - off
+      ip_version:
+        description:
+          - The IP address version of the BGP peer address.
+        required: false
+        default: ipv4
+        choices:
+        - ipv4
+        - ipv6
+      remote_ipv6_addr:
+        description:
+          - The remote IPv6 address of the BGP peer.
+        required: false
+        default: null
+        type: str
+      in_rmap_list:
+        description:
+          - Add or remove route map to the incoming route map list.
+        required: false
+        default: null
+        type: list
+        elements: int
+      out_rmap_list:
+        description:
+          - Add or remove route map to the outgoing route map list.
+        required: false
+        default: null
+        type: list
+        elements: int
+      graceful_restart_status:
+        description:
+          - Enable or disable graceful restart for the peer.
+          - This field is can be configured only when BGP global mode is FRR.
+          - This field is can not be configured on VADC instance.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      standard_community_advertisement_status:
+        description:
+          - Enable or disable advertising Standard community attribute.
+          - This field is can be configured only when BGP global mode is FRR.
+          - This field is can not be configured on VADC instance.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      large_community_advertisement_status:
+        description:
+          - Enable or disable advertising large community attribute.
+          - This field is can be configured only when BGP global mode is FRR.
+          - This field is can not be configured on VADC instance.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      extended_community_advertisement_status:
+        description:
+          - Enable or disable advertising extended community attribute.
+          - This field is can be configured only when BGP global mode is FRR.
+          - This field is can not be configured on VADC instance.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      ttl_security_hops:
+        description:
+          - Set ttl security hops count.
+          - This field is can be configured only when BGP global mode is FRR.
+          - This field is can not be configured on VADC instance.
+        required: false
+        default: 30
+        type: int
+      peer_password:
+        description:
+          - set authentication password.
+          - This field is can be configured only when BGP global mode is FRR.
+          - This field is can not be configured on VADC instance.
+        required: false
+        default: null
+        type: str
+      password_status:
+        description:
+          - Enable or disable using authentication password.
+          - This field is can be configured only when BGP global mode is FRR.
+          - This field is can not be configured on VADC instance.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+  aggregations:
+    description:
+      - BGP aggregations.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_bgp_aggregations).
+      - Aggregations are identified by I(aggr_addr) and I(mask).
+      - When I(index) is not set, the index of the device aggregation with the same address and mask is used, or the
+        lowest free index for a new aggregation.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - aggregation ID.
+          - Allocated automatically when not set.
+        required: false
+        default: null
+        type: int
+      aggr_addr:
+        description:
+          - The IP address of the BGP aggregation.
+        required: false
+        default: null
+        type: str
+      mask:
+        description:
+          - The subnet mask of the BGP aggregation.
+        required: false
+        default: null
+        type: str
+      status:
+        description:
+          - Enable or disable the aggregation entry.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+notes:
+  - Requires the Radware alteon-sdk Python package on the host. This is as easy as
+      C(pip3 install alteon-sdk)
+requirements:
+  - alteon-sdk
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+  - radware.radware_alteon.alteon_options_doc_fragment.bulk
+'''
+
+EXAMPLES = r'''
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_bgp_peer_bulk:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    purge: true
+    peers:
+      - remote_addr: 10.1.1.1
+        remote_as_number: 65001
+        state: enabled
+        out_rmap_list:
+          - 1
+      - remote_addr: 10.1.1.2
+        remote_as_number: 65002
+        state: enabled
+        out_rmap_list:
+          - 1
+    aggregations:
+      - aggr_addr: 192.0.2.0
+        mask: 255.255.255.0
+        status: enabled
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 1 of 3 entries changed
+changes:
+  description: Changed peers and aggregations, with the evaluated diff when running in diff mode
+  returned: success
+  type: list
+  sample: [{"section": "peers", "command": "update", "id": {"index": 2}}]
+indexes:
+  description: Device index of every listed peer and aggregation, by remote address and by address/mask
+  returned: success
+  type: dict
+  sample: {"peers": {"10.1.1.1": 1, "10.1.1.2": 2}, "aggregations": {"192.0.2.0/255.255.255.0": 1}}
+table_reads:
+  description: Number of device tables read during the run
+  returned: success
+  type: int
+  sample: 2
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonBulkConfigurationModule, \
+    AlteonBulkConfigurationArgumentSpec
+try:
+    from radware.sdk.configurator import DeviceConfigurator
+    from radware.alteon.sdk.configurators.bgp_peer import BgpPeerConfigurator
+    from radware.alteon.sdk.configurators.bgp_aggr import BgpAggrConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'peers': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'aggregations': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'provider': {'type': 'dict', 'required': True},
+                       'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'validate_references': {'required': False, 'type': 'bool', 'default': True},
+                       'purge': {'required': False, 'type': 'bool', 'default': False},
+                       'state': {'required': False, 'choices': ['present', 'absent', 'append'], 'default': 'present'}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+INDEX = 'index'
+UNSET_ADDRESSES = ('', '0.0.0.0', '::', '0:0:0:0:0:0:0:0')
+
+
+def _address(value):
+    if value is None or str(value).strip() in UNSET_ADDRESSES:
+        return None
+    return str(value).strip().lower()
+
+
+def peer_identity(values):
+    return _address(values.get('remote_addr')) or _address(values.get('remote_ipv6_addr'))
+
+
+def aggregation_identity(values):
+    address = _address(values.get('aggr_addr'))
+    if address is None:
+        return None
+    return f'{address}/{values.get("mask")}'
+
+
+def bgp_sections():
+    return [('peers', BgpPeerConfigurator),
+            ('aggregations', BgpAggrConfigurator)]
+
+
+def bgp_identities():
+    return {'peers': peer_identity, 'aggregations': aggregation_identity}
+
+
+def lowest_free_index(used):
+    index = 1
+    while index in used:
+        index += 1
+    return index
+
+
+class ArgumentSpec(AlteonBulkConfigurationArgumentSpec):
+    def __init__(self):
+        super().__init__(*bgp_sections())
+        for name, config_class in bgp_sections():
+            self.argument_spec[name]['options'][INDEX].update({"required": False})
+        self.argument_spec.update({"purge": {"required": False, "type": "bool", "default": False}})
+
+
+class ModuleManager(AlteonBulkConfigurationModule):
+    def __init__(self, **kwargs):
+        super().__init__(bgp_sections(), **kwargs)
+        self._identities = bgp_identities()
+        self._resolved = {}
+        self._indexes = {}
+
+    def _section_entries(self, name):
+        if name not in self._resolved:
+            self._resolved[name] = self._resolve_indexes(name, self._base.params.get(name) or [])
+        return self._resolved[name]
+
+    def _resolve_indexes(self, name, entries):
+        identity = self._identities[name]
+        configured = {}
+        for device_entry in self._device_entries(name):
+            key = identity(device_entry)
+            if key is not None:
+                configured[key] = int(device_entry[INDEX])
+        # rows without an address are unconfigured, their indexes are free
+        used = set(configured.values())
+        used.update(int(entry[INDEX]) for entry in entries if entry.get(INDEX) is not None)
+        seen = set()
+        resolved = []
+        indexes = {}
+        for position, entry in enumerate(entries):
+            key = identity(entry)
+            if key is None and entry.get(INDEX) is None:
+                raise RadwareModuleError(f'{name}[{position}]: index or address required')
+            if key is not None:
+                if key in seen:
+                    raise RadwareModuleError(f'{name}[{position}]: {key} listed more than once')
+                seen.add(key)
+            entry = dict(entry)
+            if entry.get(INDEX) is None:
+                if key in configured:
+                    entry[INDEX] = configured[key]
+                elif self._state == 'absent':
+                    continue
+                else:
+                    entry[INDEX] = lowest_free_index(used)
+                    used.add(entry[INDEX])
+            elif key in configured and configured[key] != entry[INDEX] and self._state != 'absent':
+                raise RadwareModuleError(f'{name}[{position}]: {key} is configured at index {configured[key]}, '
+                                         f'not {entry[INDEX]}')
+            if key is not None:
+                indexes[key] = entry[INDEX]
+            resolved.append(entry)
+        self._indexes[name] = indexes
+        return resolved
+
+    def _purge_section(self, name, configurator, matcher):
+        # device entries with an address which are not listed are removed
+        desired = set(entry[INDEX] for entry in self._section_entries(name))
+        for device_entry in self._device_entries(name):
+            if self._identities[name](device_entry) is None or int(device_entry[INDEX]) in desired:
+                continue
+            arguments = configurator.get_parameters_class().get_instance(**{INDEX: int(device_entry[INDEX])})
+            self._config_manager.execute(configurator, DeviceConfigurator.DELETE, arguments,
+                                         dry_run=self._base.module.check_mode)
+            self._add_change(name, DeviceConfigurator.DELETE, {INDEX: int(device_entry[INDEX])})
+
+    def exec_module(self):
+        result = super().exec_module()
+        result.update(indexes=dict((name, self._indexes.get(name, {})) for name, config_class in bgp_sections()))
+        return result
+
+
+def main():
+    spec = ArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
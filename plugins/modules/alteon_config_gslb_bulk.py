@@ -0,0 +1,602 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_config_gslb_bulk
+short_description: Manage the GSLB configuration in Radware Alteon
+description:
+  - Manage GSLB networks, GSLB rules, FQDN servers and DNS responders in Radware Alteon in a single task.
+  - Each table is read once, references between the entries are resolved locally against the task entries and the
+    device entries, and only the changed entries are written to the device.
+  - Networks are written before the rules using them, entries are deleted in reverse order.
+  - Run the module with M(radware.radware_alteon.alteon_fleet_config) to configure many GSLB sites concurrently.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  state:
+    description:
+      - When C(present), guarantees that the entries exist with the provided attributes.
+      - When C(absent), removes the listed networks, rules and FQDN servers. Networks still used by remaining rules
+        are not removed.
+      - When C(append), append entries configuration with the provided parameters.
+    required: false
+    default: present
+    type: str
+    choices:
+    - present
+    - absent
+    - append
+  purge:
+    description:
+      - When C(true) and I(state=present), device networks, rules and FQDN servers that are not listed are removed.
+    required: false
+    default: false
+    type: bool
+  object_index:
+    description:
+      - Object index gathered by M(radware.radware_alteon.alteon_device_object_index).
+      - When provided, references found in the index are validated without reading their tables, a table is read only
+        for references missing from the index.
+    required: false
+    type: dict
+  networks:
+    description:
+      - GSLB networks.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_gslb_network).
+      - Networks are written before the rules using them.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Network ID.
+        required: true
+        default: null
+      state:
+        description:
+          - Network state.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      ip_ver:
+        description:
+          - IP version.
+        required: false
+        default: null
+        choices:
+        - ipv4
+        - ipv6
+      src_address_type:
+        description:
+          - Source IP address type.
+        required: false
+        default: null
+        choices:
+        - address
+        - network
+      src_network_address:
+        description:
+          - Source IPv4 address.
+        required: false
+        default: null
+        type: str
+      src_network_subnet:
+        description:
+          - Source IPv4 subnet.
+        required: false
+        default: null
+        type: str
+      src6_network_address:
+        description:
+          - Source IPv6 address.
+        required: false
+        default: null
+        type: str
+      src6_network_prefix:
+        description:
+          - Source IPv6 prefix.
+        required: false
+        default: null
+        type: str
+      src_network_class_id:
+        description:
+          - Source network class ID.
+        required: false
+        default: null
+        type: str
+      src_lookup_mode:
+        description:
+          - Client address source.
+        required: false
+        default: null
+        choices:
+        - ldns
+        - ecs
+      nat_service_type:
+        description:
+          - Local service type for nat.
+        required: false
+        default: null
+        choices:
+        - group
+        - server
+      wan_group_name:
+        description:
+          - WAN group if nat_service_type=server.
+        required: false
+        default: null
+        type: str
+      virtual_server_names:
+        description:
+          - Add virtual servers to network.
+        required: false
+        default: null
+        type: list
+        elements: str
+      server_names:
+        description:
+          - Add remote real server to network.
+        required: false
+        default: null
+        type: list
+        elements: str
+  rules:
+    description:
+      - GSLB rules.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_gslb_rule).
+      - The I(network_ids) of I(rule_metrics) must be networks of the task or of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Rule ID.
+        required: true
+        default: null
+      state:
+        description:
+          - Rule state.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      dns_ttl:
+        description:
+          - Time To Live in seconds of DNS resource records.
+        required: false
+        default: null
+        type: int
+      max_dns_resource_records:
+        description:
+          - DNS resource records in DNS response.
+        required: false
+        default: null
+        type: int
+      domain_name:
+        description:
+          - Network preference domain name for rule.
+        required: false
+        default: null
+        type: str
+      src_dns_persist_mask:
+        description:
+          - Source IP subnet mask for DNS persistence cache.
+        required: false
+        default: null
+        type: str
+      dns_persist_timeout:
+        description:
+          - Timeout in minutes for DNS persistence cache.
+        required: false
+        default: null
+        type: int
+      src6_dns_persist_prefix:
+        description:
+          - Source IPv6 prefix for DNS persistence cache.
+        required: false
+        default: null
+        type: int
+      rule_type:
+        description:
+          - DNS redirection rule type.
+        required: false
+        default: null
+        choices:
+        - gslb
+        - inboundllb
+      description:
+        description:
+          - Descriptive rule name.
+        required: false
+        default: null
+        type: str
+      edns_persist_mode:
+        description:
+          - Enable/disable use of EDNS value for DNS persistency.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      rule_network_fallback:
+        description:
+          - Enable/disable network metric fallback.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      rule_metrics:
+        description:
+          - Rule metrics.
+        required: false
+        default: null
+        type: list
+        elements: dict
+        suboptions:
+          priority:
+            description:
+              - Rule metric priority.
+            required: true
+            type: int
+          metric:
+            description:
+              - GSLB rule metric.
+            required: true
+            type: str
+            choices:
+            - leastconns
+            - roundrobin
+            - response
+            - geographical
+            - network
+            - random
+            - availability
+            - qos
+            - minmisses
+            - hash
+            - local
+            - always
+            - remote
+            - none
+            - persistence
+            - phash
+            - proximity
+            - bandwidth
+            - absleastconn
+          network_ids:
+            description:
+              - network to metric=network.
+            required: false
+            default: null
+            type: list
+            elements: int
+  fqdn_servers:
+    description:
+      - FQDN servers.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_fqdn_server).
+      - I(group_id) must be a server group of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - FQDN Server ID.
+        required: true
+        default: null
+        type: str
+      fqdn:
+        description:
+          - Fully Qualified Domain Name.
+        required: false
+        default: null
+        type: str
+      ip_ver:
+        description:
+          - IP Version.
+        required: false
+        default: null
+        choices:
+        - ipv4
+        - ipv6
+      ttl:
+        description:
+          - Minimal TTL in minutes.
+        required: false
+        default: null
+        type: int
+      group_id:
+        description:
+          - Group ID.
+        required: false
+        default: null
+        type: str
+      template_server_name:
+        description:
+          - Template Real Server ID.
+        required: false
+        default: null
+        type: str
+      state:
+        description:
+          - FQDN server state.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+  dns_responders:
+    description:
+      - DNS responders.
+      - Same format as the C(parameters.dns_responders) of M(radware.radware_alteon.alteon_config_dns_responders).
+      - When I(state=present), device responders not listed are removed.
+      - Ignored when I(state=absent).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - The DNS Responder name.
+        required: false
+        default: null
+        type: str
+      ip_ver:
+        description:
+          - Specifies the type of IP address.
+        required: false
+        default: ipv4
+        choices:
+        - ipv4
+        - ipv6
+      ip4_address:
+        description:
+          - The IPv4 address of the dns responder.
+        required: false
+        default: null
+        type: str
+      ip6_address:
+        description:
+          - The IPv6 address of the dns responder.
+        required: false
+        default: null
+        type: str
+      return_to_src_mac:
+        description:
+          - Return response to source mac address.
+        required: false
+        default: disable
+        choices:
+        - enable
+        - disable
+notes:
+  - Requires the Radware alteon-sdk Python package on the host. This is as easy as
+      C(pip3 install alteon-sdk)
+requirements:
+  - alteon-sdk
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+  - radware.radware_alteon.alteon_options_doc_fragment.bulk
+'''
+
+EXAMPLES = r'''
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_gslb_bulk:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    purge: true
+    networks:
+      - index: 1
+        state: enabled
+        src_network_address: 10.0.0.0
+        src_network_subnet: 255.0.0.0
+        virtual_server_names:
+          - vs_dc1
+    rules:
+      - index: 1
+        state: enabled
+        domain_name: www.example.com
+        dns_ttl: 30
+        rule_metrics:
+          - priority: 1
+            metric: network
+            network_ids:
+              - 1
+          - priority: 2
+            metric: availability
+    dns_responders:
+      - ip_ver: ipv4
+        ip4_address: 192.0.2.53
+
+- name: sync the GSLB configuration to all sites
+  radware.radware_alteon.alteon_fleet_config:
+    module: alteon_config_gslb_bulk
+    provider:
+      user: admin
+      password: admin
+      validate_certs: false
+    devices: "{{ gslb_sites }}"
+    forks: 12
+    state: present
+    parameters:
+      purge: true
+      networks: "{{ gslb_networks }}"
+      rules: "{{ gslb_rules }}"
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 12 of 1004 entries changed
+changes:
+  description: Changed entries per section, with the evaluated diff when running in diff mode
+  returned: success
+  type: list
+  sample: [{"section": "rules", "command": "update", "id": {"index": 7}}]
+table_reads:
+  description: Number of device tables read during the run
+  returned: success
+  type: int
+  sample: 6
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, \
+    build_specs_from_annotation
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonBulkConfigurationModule, \
+    AlteonBulkConfigurationArgumentSpec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.object_index import object_index_argument_spec
+try:
+    from radware.alteon.sdk.configurators.gslb_network import GSLBNetworkConfigurator
+    from radware.alteon.sdk.configurators.gslb_rule import GSLBRuleConfigurator
+    from radware.alteon.sdk.configurators.fqdn_server import FQDNServerConfigurator
+    from radware.alteon.sdk.configurators.dns_responders import DNSRespondersConfigurator, ResponderEntry
+    from radware.alteon.beans.SlbNewCfgEnhGroupTable import SlbNewCfgEnhGroupTable
+    from radware.alteon.beans.GslbNewCfgMetricTable import GslbNewCfgMetricTable
+    from radware.sdk.beans_common import BeanUtils
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'networks': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'rules': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'fqdn_servers': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'dns_responders': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'provider': {'type': 'dict', 'required': True},
+                       'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'validate_references': {'required': False, 'type': 'bool', 'default': True},
+                       'object_index': {'required': False, 'type': 'dict'},
+                       'purge': {'required': False, 'type': 'bool', 'default': False},
+                       'state': {'required': False, 'choices': ['present', 'absent', 'append'], 'default': 'present'}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+RESPONDERS_SECTION = 'dns_responders'
+
+
+def gslb_sections():
+    # entries are written in this order and deleted in reverse order
+    return [('networks', GSLBNetworkConfigurator),
+            ('rules', GSLBRuleConfigurator),
+            ('fqdn_servers', FQDNServerConfigurator),
+            (RESPONDERS_SECTION, DNSRespondersConfigurator)]
+
+
+def references():
+    return {
+        'fqdn_servers': {
+            'group_id': ((SlbNewCfgEnhGroupTable, 'Index'),)
+        }
+    }
+
+
+class ArgumentSpec(AlteonBulkConfigurationArgumentSpec):
+    def __init__(self):
+        super().__init__(*gslb_sections())
+        self.argument_spec[RESPONDERS_SECTION]['options'] = build_specs_from_annotation(ResponderEntry)
+        self.argument_spec.update({"purge": {"required": False, "type": "bool", "default": False}})
+        self.argument_spec.update(object_index_argument_spec)
+
+
+class ModuleManager(AlteonBulkConfigurationModule):
+    def __init__(self, **kwargs):
+        super().__init__(gslb_sections(), references=references(), **kwargs)
+
+    def _section_entries(self, name):
+        if name == RESPONDERS_SECTION:
+            # responders are a single list object, deleting it removes every responder of the device
+            if self._state == 'absent' or not self.params.get(RESPONDERS_SECTION):
+                return []
+            return [{RESPONDERS_SECTION: self.params[RESPONDERS_SECTION]}]
+        return self.params.get(name) or []
+
+    def _purge_scope(self, name):
+        if name == RESPONDERS_SECTION:
+            return None
+        return {}
+
+    @staticmethod
+    def _ids(entries):
+        return set(str(entry.get('index')) for entry in entries if entry.get('index') is not None)
+
+    @staticmethod
+    def _network_ids(rule):
+        for metric in rule.get('rule_metrics') or []:
+            for network_id in metric.get('network_ids') or []:
+                yield str(network_id)
+
+    def validate_references(self):
+        errors = []
+        if self._state == 'absent':
+            removed = self._ids(self._section_entries('networks')) & self._ids(self._device_entries('networks'))
+            if removed:
+                rules = self._ids(self._section_entries('rules'))
+                # rule metrics are kept in their own table, networks as a bitmap
+                for metric in self._cache.table(GslbNewCfgMetricTable).values():
+                    if str(metric.RuleMetricIndx) in rules or not metric.NetworkBmap:
+                        continue
+                    used = set(str(network_id) for network_id in BeanUtils.decode_bmp(metric.NetworkBmap)) & removed
+                    errors.extend(f'networks {network_id} used by rules {metric.RuleMetricIndx}'
+                                  for network_id in sorted(used))
+        else:
+            super().validate_references()
+            networks = self._ids(self._section_entries('networks'))
+            if not self.params.get('purge'):
+                networks |= self._ids(self._device_entries('networks'))
+            for position, rule in enumerate(self._section_entries('rules')):
+                unresolved = [network_id for network_id in self._network_ids(rule) if network_id not in networks]
+                if unresolved:
+                    errors.append(f'rules[{position}]: unresolved network_ids={",".join(unresolved)}')
+        if errors:
+            raise RadwareModuleError('reference validation failed:\n' + '\n'.join(errors))
+
+    def exec_module(self):
+        if self._state == 'absent':
+            if self.params.get(RESPONDERS_SECTION):
+                self.module.warn(f'{RESPONDERS_SECTION} ignored with state absent')
+            if self._validate_references:
+                self.validate_references()
+        return super().exec_module()
+
+
+def main():
+    spec = ArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1001 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_config_health_check_bulk
+short_description: Manage multiple HTTP, TCP and logical expression health checks in Radware Alteon
+description:
+  - Manage multiple HTTP, TCP and logical expression health checks in Radware Alteon in a single task.
+  - HTTP and TCP health checks are expanded from a per type template, entry values override the template values.
+  - Health check tables are read once, every expanded health check is fingerprinted and compared to the device entry,
+    only the changed health checks are written to the device.
+  - Logical expression health checks are written after the health checks they reference and deleted before them.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  state:
+    description:
+      - When C(present), guarantees that the health checks exist with the provided attributes.
+      - When C(absent), removes the listed health checks. Health checks still referenced by a logical expression
+        health check of the device are not removed.
+      - When C(append), append health checks configuration with the provided parameters.
+    required: false
+    default: present
+    type: str
+    choices:
+    - present
+    - absent
+    - append
+  http_template:
+    description:
+      - Common parameters of the I(http) health checks.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_health_check_http), without C(index).
+    required: false
+    type: dict
+    suboptions:
+      description:
+        description:
+          - Descriptive health check name.
+        required: false
+        default: null
+        type: str
+      destination_port:
+        description:
+          - Application port.
+        required: false
+        default: null
+        type: int
+      ip_ver:
+        description:
+          - Destination IP address version.
+        required: false
+        default: null
+        choices:
+        - ipv4
+        - ipv6
+        - none
+      destination_ip_or_hostname:
+        description:
+          -Destination address or hostname.
+        required: false
+        default: null
+        type: str
+      transparent_health_check:
+        description:
+          - Enable/disable transparent health check.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      interval_second:
+        description:
+          - Interval between health checks in seconds.
+        required: false
+        default: null
+        type: int
+      retries_failure:
+        description:
+          - Number of failed attempts to declare server down.
+        required: false
+        default: null
+        type: int
+      retries_restore:
+        description:
+          - Number of successful attempts to declare server up.
+        required: false
+        default: null
+        type: int
+      response_timeout_second:
+        description:
+          - Max seconds to wait for response.
+        required: false
+        default: null
+        type: int
+      interval_downtime_second:
+        description:
+          - Interval between health checks when server is down.
+        required: false
+        default: null
+        type: int
+      invert_result:
+        description:
+          - Enable/disable invert of expected result.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      connection_termination:
+        description:
+          - Set connection termination.
+        required: false
+        default: null
+        choices:
+        - fin
+        - rst
+      standalone_real_hc_mode:
+        description:
+          - Enable/disable always performing the health check.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      https:
+        description:
+          - Enable/disable SSL for HTTPS Health check.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      http_hostname:
+        description:
+          - Set host header.
+        required: false
+        default: null
+        type: str
+      http_path:
+        description:
+          - Set request path.
+        required: false
+        default: null
+        type: str
+      http_method:
+        description:
+          - Set HTTP method.
+        required: false
+        default: null
+        choices:
+        - get
+        - post
+        - head
+      http_headers_raw:
+        description:
+          - Set request header.
+        required: false
+        default: null
+        type: str
+      http_body:
+        description:
+          - Set request body.
+        required: false
+        default: null
+        type: str
+      authentication:
+        description:
+          - Set authentication.
+        required: false
+        default: null
+        choices:
+        - none
+        - basic
+        - ntlm2
+        - ntlmssp
+      auth_username:
+        description:
+          - Set authentication username.
+        required: false
+        default: null
+        type: str
+      auth_password:
+        description:
+          - Set authentication password.
+        required: false
+        default: null
+        type: str
+      return_string_lookup_type:
+        description:
+          - Set response string lookup type.
+        required: false
+        default: null
+        choices:
+        - none
+        - incl
+        - excl
+      overload_string_lookup_type:
+        description:
+          - Set expected response for server overload.
+        required: false
+        default: null
+        choices:
+        - none
+        - incl
+      expected_return_codes:
+        description:
+          - Set expected response status code.
+        required: false
+        default: null
+        type: str
+      return_value:
+        description:
+          - Set expected response string.
+        required: false
+        default: null
+        type: str
+      overload_value:
+        description:
+          - Set expected response string for server overload.
+        required: false
+        default: null
+        type: str
+      proxy_request:
+        description:
+          - Enable/disable proxy request.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      https_cipher:
+        description:
+          - Set cipher-suite for HTTPS Health check.
+        required: false
+        default: null
+        choices:
+        - userDefined
+        - low
+        - medium
+        - high
+      https_user_defined_cipher:
+        description:
+          - Set user-defined cipher-suite for HTTPS Health check.
+        required: false
+        default: null
+        type: str
+      http2:
+        description:
+          - Enable/disable HTTP/2.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+  http:
+    description:
+      - HTTP health checks, expanded from I(http_template).
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_health_check_http).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Health check ID.
+        required: true
+        default: null
+        type: str
+      description:
+        description:
+          - Descriptive health check name.
+        required: false
+        default: null
+        type: str
+      destination_port:
+        description:
+          - Application port.
+        required: false
+        default: null
+        type: int
+      ip_ver:
+        description:
+          - Destination IP address version.
+        required: false
+        default: null
+        choices:
+        - ipv4
+        - ipv6
+        - none
+      destination_ip_or_hostname:
+        description:
+          -Destination address or hostname.
+        required: false
+        default: null
+        type: str
+      transparent_health_check:
+        description:
+          - Enable/disable transparent health check.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      interval_second:
+        description:
+          - Interval between health checks in seconds.
+        required: false
+        default: null
+        type: int
+      retries_failure:
+        description:
+          - Number of failed attempts to declare server down.
+        required: false
+        default: null
+        type: int
+      retries_restore:
+        description:
+          - Number of successful attempts to declare server up.
+        required: false
+        default: null
+        type: int
+      response_timeout_second:
+        description:
+          - Max seconds to wait for response.
+        required: false
+        default: null
+        type: int
+      interval_downtime_second:
+        description:
+          - Interval between health checks when server is down.
+        required: false
+        default: null
+        type: int
+      invert_result:
+        description:
+          - Enable/disable invert of expected result.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      connection_termination:
+        description:
+          - Set connection termination.
+        required: false
+        default: null
+        choices:
+        - fin
+        - rst
+      standalone_real_hc_mode:
+        description:
+          - Enable/disable always performing the health check.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      https:
+        description:
+          - Enable/disable SSL for HTTPS Health check.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      http_hostname:
+        description:
+          - Set host header.
+        required: false
+        default: null
+        type: str
+      http_path:
+        description:
+          - Set request path.
+        required: false
+        default: null
+        type: str
+      http_method:
+        description:
+          - Set HTTP method.
+        required: false
+        default: null
+        choices:
+        - get
+        - post
+        - head
+      http_headers_raw:
+        description:
+          - Set request header.
+        required: false
+        default: null
+        type: str
+      http_body:
+        description:
+          - Set request body.
+        required: false
+        default: null
+        type: str
+      authentication:
+        description:
+          - Set authentication.
+        required: false
+        default: null
+        choices:
+        - none
+        - basic
+        - ntlm2
+        - ntlmssp
+      auth_username:
+        description:
+          - Set authentication username.
+        required: false
+        default: null
+        type: str
+      auth_password:
+        description:
+          - Set authentication password.
+        required: false
+        default: null
+        type: str
+      return_string_lookup_type:
+        description:
+          - Set response string lookup type.
+        required: false
+        default: null
+        choices:
+        - none
+        - incl
+        - excl
+      overload_string_lookup_type:
+        description:
+          - Set expected response for server overload.
+        required: false
+        default: null
+        choices:
+        - none
+        - incl
+      expected_return_codes:
+        description:
+          - Set expected response status code.
+        required: false
+        default: null
+        type: str
+      return_value:
+        description:
+          - Set expected response string.
+        required: false
+        default: null
+        type: str
+      overload_value:
+        description:
+          - Set expected response string for server overload.
+        required: false
+        default: null
+        type: str
+      proxy_request:
+        description:
+          - Enable/disable proxy request.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      https_cipher:
+        description:
+          - Set cipher-suite for HTTPS Health check.
+        required: false
+        default: null
+        choices:
+        - userDefined
+        - low
+        - medium
+        - high
+      https_user_defined_cipher:
+        description:
+          - Set user-defined cipher-suite for HTTPS Health check.
+        required: false
+        default: null
+        type: str
+      http2:
+        description:
+          - Enable/disable HTTP/2.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+  tcp_template:
+    description:
+      - Common parameters of the I(tcp) health checks.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_health_check_tcp), without C(index).
+    required: false
+    type: dict
+    suboptions:
+      description:
+        description:
+          - Set descriptive health check name.
+        required: false
+        default: null
+        type: str
+      destination_port:
+        description:
+          - Set desination port.
+          - Set value to none in order to take this value from rport or the bound element.
+        required: false
+        default: null
+        type: str
+      ip_ver:
+        description:
+          - Set destination IP version.
+          - Choose none to inherit from real server.
+        required: false
+        default: none
+        choices:
+        - ipv4
+        - ipv6
+        - none
+      destination_ip_or_hostname:
+        description:
+          - Set destination IP address or hostname.
+          - This parameter required only when the IP Version is IPv4 or IPv6.
+        required: false
+        default: none
+        type: str
+      transparent_health_check:
+        description:
+          - Enable/disable transparent health check.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      interval_second:
+        description:
+          - Set time, in seconds, between keep-alive attempts.
+        required: false
+        default: 5
+        type: int
+      retries_failure:
+        description:
+          - Set the number of failed attempts to declare a server down.
+        required: false
+        default: 4
+        type: int
+      retries_restore:
+        description:
+          - Set the number of successful attempts to declare a server up.
+        required: false
+        default: 2
+        type: int
+      response_timeout_second:
+        description:
+          - Set the time, in seconds, to wait for response. This value must be lower or equal to the Interval parameter.
+        required: false
+        default: 5
+        type: int
+      interval_downtime_second:
+        description:
+          - Set the time, in seconds, between health checks when a server is down.
+        required: false
+        default: 0
+        type: int
+      invert_result:
+        description:
+          - Set whether to invert of expected result.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      connection_termination:
+        description:
+          - Set connection termination.
+          - "Value for the tcphalfopen out-of-the-box health check: RST."
+        required: false
+        default: fin
+        choices:
+        - fin
+        - rst
+      standalone_real_hc_mode:
+        description:
+          - Perform health check for real servers that are not attached to any virtual service or filter.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+  tcp:
+    description:
+      - TCP health checks, expanded from I(tcp_template).
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_health_check_tcp).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - TCP health check ID.
+        required: true
+        default: null
+        type: str
+      description:
+        description:
+          - Set descriptive health check name.
+        required: false
+        default: null
+        type: str
+      destination_port:
+        description:
+          - Set desination port.
+          - Set value to none in order to take this value from rport or the bound element.
+        required: false
+        default: null
+        type: str
+      ip_ver:
+        description:
+          - Set destination IP version.
+          - Choose none to inherit from real server.
+        required: false
+        default: none
+        choices:
+        - ipv4
+        - ipv6
+        - none
+      destination_ip_or_hostname:
+        description:
+          - Set destination IP address or hostname.
+          - This parameter required only when the IP Version is IPv4 or IPv6.
+        required: false
+        default: none
+        type: str
+      transparent_health_check:
+        description:
+          - Enable/disable transparent health check.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      interval_second:
+        description:
+          - Set time, in seconds, between keep-alive attempts.
+        required: false
+        default: 5
+        type: int
+      retries_failure:
+        description:
+          - Set the number of failed attempts to declare a server down.
+        required: false
+        default: 4
+        type: int
+      retries_restore:
+        description:
+          - Set the number of successful attempts to declare a server up.
+        required: false
+        default: 2
+        type: int
+      response_timeout_second:
+        description:
+          - Set the time, in seconds, to wait for response. This value must be lower or equal to the Interval parameter.
+        required: false
+        default: 5
+        type: int
+      interval_downtime_second:
+        description:
+          - Set the time, in seconds, between health checks when a server is down.
+        required: false
+        default: 0
+        type: int
+      invert_result:
+        description:
+          - Set whether to invert of expected result.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      connection_termination:
+        description:
+          - Set connection termination.
+          - "Value for the tcphalfopen out-of-the-box health check: RST."
+        required: false
+        default: fin
+        choices:
+        - fin
+        - rst
+      standalone_real_hc_mode:
+        description:
+          - Perform health check for real servers that are not attached to any virtual service or filter.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+  logexp:
+    description:
+      - Logical expression health checks.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_health_check_logexp).
+      - Expressions referencing other expressions of the task are ordered accordingly.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Logexp health check ID.
+        required: true
+        default: null
+        type: str
+      description:
+        description:
+          - Set descriptive logical expression name.
+        required: false
+        default: null
+        type: str
+      logical_expression:
+        description:
+          - Set logical expression between health checks.
+        required: false
+        default: null
+        type: str
+      standalone_real_hc_mode:
+        description:
+          - Enable/disable always performing the health check.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+notes:
+  - Requires the Radware alteon-sdk Python package on the host. This is as easy as
+      C(pip3 install alteon-sdk)
+  - Passwords cannot be read from the device, health checks with I(auth_password) are always evaluated by the device
+    configurator.
+requirements:
+  - alteon-sdk
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+  - radware.radware_alteon.alteon_options_doc_fragment.bulk
+'''
+
+EXAMPLES = r'''
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_health_check_bulk:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    http_template:
+      ip_ver: ipv4
+      interval_second: 5
+      retries_failure: 4
+      https: enabled
+      http_method: get
+      expected_return_codes: "200"
+    http:
+      - index: hc_shop
+        http_hostname: shop.example.com
+        http_path: /health
+      - index: hc_api
+        http_hostname: api.example.com
+        http_path: /v1/ping
+        destination_port: 8443
+    tcp_template:
+      interval_second: 10
+    tcp:
+      - index: hc_db
+        destination_port: 5432
+    logexp:
+      - index: hc_shop_all
+        logical_expression: hc_shop&&hc_db
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 1 of 4 entries changed
+changes:
+  description: Changed health checks per type, with the evaluated diff when running in diff mode
+  returned: success
+  type: list
+  sample: [{"section": "http", "command": "update", "id": {"index": "hc_api"}}]
+fingerprints:
+  description: Fingerprint of every expanded health check per type, identical fingerprints configure identical health checks
+  returned: success
+  type: dict
+  sample: {"http": {"hc_shop": "3f1a...", "hc_api": "9c0e..."}, "tcp": {"hc_db": "71be..."}}
+table_reads:
+  description: Number of device tables read during the run
+  returned: success
+  type: int
+  sample: 3
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import re
+import traceback
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, build_specs_from_annotation
+from ansible_collections.radware.radware_alteon.plugins.module_utils.bulk import entry_fingerprint
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonBulkConfigurationModule, \
+    AlteonBulkConfigurationArgumentSpec
+try:
+    from radware.sdk.common import PasswordArgument, get_annotation_class, get_type_hints
+    from radware.alteon.beans.SlbNewAdvhcHttpTable import SlbNewAdvhcHttpTable
+    from radware.alteon.beans.SlbNewAdvhcTcpTable import SlbNewAdvhcTcpTable
+    from radware.alteon.beans.SlbNewAdvhcLogexpTable import SlbNewAdvhcLogexpTable
+    from radware.alteon.sdk.configurators.health_check_http import HealthCheckHTTPConfigurator
+    from radware.alteon.sdk.configurators.health_check_tcp import HealthCheckTCPConfigurator
+    from radware.alteon.sdk.configurators.health_check_logexp import HealthCheckLogExpConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'http_template': {'type': 'dict', 'required': False},
+                       'http': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'tcp_template': {'type': 'dict', 'required': False},
+                       'tcp': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'logexp': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'provider': {'type': 'dict', 'required': True},
+                       'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'validate_references': {'required': False, 'type': 'bool', 'default': True},
+                       'state': {'required': False, 'choices': ['present', 'absent', 'append'], 'default': 'present'}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+HC_INDEX = 'index'
+LOGEXP_SECTION = 'logexp'
+LOGEXP_EXPRESSION = 'logical_expression'
+LOGEXP_OPERAND = re.compile(r'[^&|!()\s]+')
+TEMPLATE_SUFFIX = '_template'
+
+
+def hc_sections():
+    # referenced health checks first, logical expressions are written last and deleted first
+    return [('http', HealthCheckHTTPConfigurator),
+            ('tcp', HealthCheckTCPConfigurator),
+            (LOGEXP_SECTION, HealthCheckLogExpConfigurator)]
+
+
+def hc_tables():
+    return [SlbNewAdvhcHttpTable, SlbNewAdvhcTcpTable, SlbNewAdvhcLogexpTable]
+
+
+def template_sections():
+    return [(name, config_class) for name, config_class in hc_sections() if name != LOGEXP_SECTION]
+
+
+def expression_operands(expression):
+    return LOGEXP_OPERAND.findall(expression or '')
+
+
+def expand_template(template, entry):
+    expanded = dict((k, v) for k, v in (template or {}).items() if v is not None)
+    expanded.update((k, v) for k, v in entry.items() if v is not None)
+    return expanded
+
+
+def password_fields(config_class):
+    return set(k for k, v in get_type_hints(config_class.get_parameters_class()).items()
+               if get_annotation_class(v) == PasswordArgument)
+
+
+class ArgumentSpec(AlteonBulkConfigurationArgumentSpec):
+    def __init__(self):
+        super().__init__(*hc_sections())
+        for name, config_class in template_sections():
+            template_spec = build_specs_from_annotation(config_class.get_parameters_class())
+            template_spec.pop(HC_INDEX)
+            self.argument_spec.update({f'{name}{TEMPLATE_SUFFIX}': {"required": False, "type": "dict",
+                                                                    "options": template_spec}})
+
+
+class ModuleManager(AlteonBulkConfigurationModule):
+    def __init__(self, **kwargs):
+        super().__init__(hc_sections(), **kwargs)
+        self._password_fields = dict((name, password_fields(config_class)) for name, config_class in hc_sections())
+        self._fingerprints = dict((name, {}) for name, config_class in hc_sections())
+        self._expanded = {}
+
+    def _section_entries(self, name):
+        if name not in self._expanded:
+            template = self.params.get(f'{name}{TEMPLATE_SUFFIX}')
+            entries = [expand_template(template, entry) for entry in self.params.get(name) or []]
+            if name == LOGEXP_SECTION:
+                entries = self._dependency_order(entries)
+            self._expanded[name] = entries
+        return self._expanded[name]
+
+    def _dependency_order(self, entries):
+        # expressions referencing other expressions of the task are written after them and deleted before them
+        by_index = dict((str(entry[HC_INDEX]), entry) for entry in entries)
+        ordered = []
+        visiting = set()
+        done = set()
+
+        def visit(index):
+            if index in done:
+                return
+            if index in visiting:
+                raise RadwareModuleError(f'logical expression health check {index}: circular reference')
+            visiting.add(index)
+            for operand in expression_operands(by_index[index].get(LOGEXP_EXPRESSION)):
+                if operand in by_index:
+                    visit(operand)
+            visiting.discard(index)
+            done.add(index)
+            ordered.append(by_index[index])
+
+        for index in by_index:
+            visit(index)
+        if self._state == 'absent':
+            ordered.reverse()
+        return ordered
+
+    def _device_fingerprint(self, configurator, entry):
+        # device entry projected on the provided fields, read from the table cache
+        query = configurator.get_parameters_class()()
+        query.set_attributes(**{HC_INDEX: entry[HC_INDEX]})
+        current = configurator.read(query)
+        if current is None:
+            return None
+        current = current.translate_to_dict()
+        return entry_fingerprint(dict((k, current.get(k)) for k in entry))
+
+    def _exec_entry(self, name, configurator, matcher, entry):
+        fingerprint = entry_fingerprint(entry)
+        self._fingerprints[name][str(entry[HC_INDEX])] = fingerprint
+        # passwords cannot be read back from the device, such entries are always evaluated
+        if self._state != 'absent' and not self._password_fields[name].intersection(entry) and \
+                fingerprint == self._device_fingerprint(configurator, entry):
+            return
+        super()._exec_entry(name, configurator, matcher, entry)
+
+    def _device_expressions(self):
+        deleted = set(str(entry[HC_INDEX]) for entry in self._section_entries(LOGEXP_SECTION))
+        for row in self._cache.table(SlbNewAdvhcLogexpTable).values():
+            if str(row.ID) not in deleted:
+                yield str(row.ID), row.Text
+
+    def validate_references(self):
+        if self._state == 'absent':
+            # health checks still used by remaining logical expressions on the device are not deleted
+            deleted = set(str(entry[HC_INDEX]) for name, config_class in hc_sections()
+                          for entry in self._section_entries(name))
+            errors = []
+            for index, expression in self._device_expressions():
+                used = deleted.intersection(expression_operands(expression))
+                if used:
+                    errors.append(f'{", ".join(sorted(used))} referenced by logical expression health check {index}')
+            if errors:
+                raise RadwareModuleError('reference validation failed:\n' + '\n'.join(errors))
+            return
+        known = set(str(entry[HC_INDEX]) for name, config_class in hc_sections() for entry in self._section_entries(name))
+        for bean_class in hc_tables():
+            known.update(str(row.ID) for row in self._cache.table(bean_class).values())
+        for entry in self._section_entries(LOGEXP_SECTION):
+            missing = [operand for operand in expression_operands(entry.get(LOGEXP_EXPRESSION)) if operand not in known]
+            if missing:
+                # other health check types are not read, unresolved operands are reported only
+                self.module.warn(f'logical expression health check {entry[HC_INDEX]}: {", ".join(missing)} not found '
+                                 f'among HTTP, TCP and logical expression health checks')
+
+    def exec_module(self):
+        if self._validate_references and self._state == 'absent':
+            self.validate_references()
+        result = super().exec_module()
+        result.update(fingerprints=dict((name, fingerprints) for name, fingerprints in self._fingerprints.items()
+                                        if fingerprints))
+        return result
+
+
+def main():
+    spec = ArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,698 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_config_l2_l3_bulk
+short_description: Manage the L2/L3 network layout in Radware Alteon
+description:
+  - Manage physical ports, LACP aggregation, VLANs, IP interfaces and default gateways in Radware Alteon in a single
+    task.
+  - Each table is read once, references between the entries are resolved locally against the task entries and the
+    device entries, and only the changed entries are written to the device.
+  - Entries are written in dependency order, ports and LACP aggregation first, then the VLANs, the port VLAN IDs,
+    the interfaces and the gateways. Entries are deleted in reverse order.
+  - The configuration is applied once after all the sections were written.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  state:
+    description:
+      - When C(present), guarantees that the entries exist with the provided attributes.
+      - When C(absent), removes the listed VLANs, interfaces and gateways. VLANs still used by remaining interfaces or
+        gateways are not removed.
+      - When C(append), append entries configuration with the provided parameters.
+    required: false
+    default: present
+    type: str
+    choices:
+    - present
+    - absent
+    - append
+  apply:
+    description:
+      - Apply the configuration once after all the sections were written, when any entry changed.
+    required: false
+    default: true
+    type: bool
+  physical_port:
+    description:
+      - Physical ports.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_physical_port).
+      - Ports are configured before the VLANs, the I(pvid) is set once the VLANs are written.
+      - I(index) must be a port of the device, I(pvid) a VLAN of the task or of the device.
+      - Ignored when I(state=absent).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Port ID.
+        required: true
+        default: null
+        type: int
+      state:
+        description:
+          - Port state.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      vlan_tag_mode:
+        description:
+          - VLAN tag state of the port.
+        required: false
+        default: null
+        choices:
+        - tagged
+        - untagged
+      rmon_state:
+        description:
+          - Specifies whether to enable RMON on the port.
+        required: false
+        default: off
+        choices:
+        - on
+        - off
+      pvid:
+        description:
+          - The default VLAN ID for the port.
+        required: false
+        default: 1
+        type: int
+      name:
+        description:
+          - The switch port name.
+        required: false
+        default: null
+        type: str
+      traffic_contract_id:
+        description:
+          - The switch port Bandwidth Management contract number.
+        required: false
+        default: 1024
+        type: int
+      discard_non_ip_traffic:
+        description:
+          - Discard non-IP traffic on port.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      link_state_trap:
+        description:
+          - Specifies whether linkUp/linkDown traps are generated for this interface.
+        required: false
+        default: enabled
+        choices:
+        - enabled
+        - disabled
+      port_alias:
+        description:
+          - The switch port alias.
+        required: false
+        default: null
+        type: str
+      spanning_tree_state:
+        description:
+          - Specifies whether to enable the spanning tree.
+        required: false
+        default: null
+        choices:
+        - on
+        - off
+      ip_forwarding:
+        description:
+          - IP forwarding is enabled by default and is used for VLAN-to-VLAN (non-BGP) routing.
+          - Make sure IP forwarding is enabled if the default gateways are on different subnets or if Alteon is
+            connected to different subnets and those subnets need to communicate through Alteon.
+          - Specifies whether to enable IP forwarding.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+  lacp_aggregation:
+    description:
+      - LACP aggregation.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_lacp_aggregation).
+      - The ports of I(groups) must be ports of the device.
+      - Ignored when I(state=absent).
+    required: false
+    type: dict
+    suboptions:
+      lacp_system_name:
+        description:
+          - The name of the LACP group.
+        required: false
+        default: null
+        type: str
+      timeout_mode:
+        description:
+          - The size of the timeout. If a port does not receive LACPDUs before the timeout expires, Alteon invalidates
+            LACP information pertaining to the port.
+          - Choose short for 3 seconds or long for 90 seconds.
+        required: false
+        default: null
+        choices:
+        - short
+        - long
+      block_port_outside_of_aggr:
+        description:
+          - Specifies what to do with traffic on a port (whether to block or to forward) that is not in a Link
+            Aggregation Group..
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      system_priority:
+        description:
+          -  A read-write value indicating the priority value associated with the Actor's System ID.
+        required: false
+        default: null
+        type: int
+      groups:
+        description:
+          - LACP group.
+        required: false
+        default: null
+        type: list
+        elements: dict
+        suboptions:
+          id:
+            description:
+              - The LACP port ID.
+            required: true
+            default: null
+            type: int
+          state:
+            description:
+              - LACP State.
+              - Choose off to turn off LACP on port.
+              - Choose active to initiate LACPDU updates on port.
+              - Choose passive to not initiate LACPDU updates but responds to peer.
+            required: true
+            default: null
+            choices:
+            - off
+            - active
+            - passive
+          ports:
+            description:
+              - Port IDs.
+            required: true
+            default: null
+            type: list
+            elements: int
+  l2_vlan:
+    description:
+      - VLANs.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l2_vlan).
+      - VLANs are written before the interfaces and gateways using them.
+      - The I(ports) must be ports of the device.
+      - When I(state=absent), VLANs still used by remaining interfaces or gateways are not removed.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - VLAN ID.
+        required: true
+        default: null
+      name:
+        description:
+          - VLAN name.
+        required: false
+        default: null
+      state:
+        description:
+          - VLAN state.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      shared:
+        description:
+          - Enable/disable VLAN sharing between vADCs.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      source_mac_learning:
+        description:
+          - Enable/disable source mac learning.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      jumbo_frame:
+        description:
+          - Enable/disable Jumbo Frame support.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      traffic_contract:
+        description:
+          - Assign BWM contract.
+        required: false
+        default: null
+        type: int
+      ports:
+        description:
+          - Alteon ports for VLAN.
+        required: false
+        default: null
+        type: list
+        elements: int
+  l3_interface:
+    description:
+      - IP interfaces.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l3_interface).
+      - I(vlan) must be a VLAN of the task or of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Interface ID.
+        required: true
+        default: null
+        type: int
+      description:
+        description:
+          - Interface description.
+        required: false
+        default: null
+        type: str
+      ip4_address:
+        description:
+          - IPv4 address.
+        required: false
+        default: null
+        type: str
+      ip4_subnet:
+        description:
+          - IPv4 subnet mask.
+        required: false
+        default: null
+        type: str
+      vlan:
+        description:
+          - VLAN ID.
+        required: false
+        default: null
+        type: int
+      state:
+        description:
+          - Gateway state.
+        required: false
+        default: enabled
+        choices:
+        - enabled
+        - disabled
+      bootp_relay:
+        description:
+          - Specifies whether to enable BOOTP relay.
+          - In the DHCP environment, Alteon acts as a relay agent.
+          - This BOOTP relay feature enables Alteon to forward a client request for an IP address to two BOOTP servers with configured IP addresses.
+        required: false
+        default: enabled
+        choices:
+        - enabled
+        - disabled
+      ip_ver:
+        description:
+          - IP version.
+        required: false
+        default: ipv4
+        choices:
+        - ipv4
+        - ipv6
+      ip6_address:
+        description:
+          - IPv6 address.
+        required: false
+        default: null
+        type: str
+      ip6_prefix:
+        description:
+          - IPv6 prefix.
+        required: false
+        default: null
+        type: str
+      peer_ip:
+        description:
+          - The peer interface IP address used in high availability unicast session failover.
+          - Radware recommends that you configure a peer IP address for all IP interfaces participating in session failover.
+        required: false
+        default: null
+        type: str
+  l3_gateway:
+    description:
+      - Default gateways.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l3_gateway).
+      - I(vlan) must be a VLAN of the task or of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Gateway index.
+        required: true
+        default: null
+        type: int
+      state:
+        description:
+          - Gateway state.
+        required: true
+        default: null
+        choices:
+        - enabled
+        - disabled
+      ip_ver:
+        description:
+          - IP version.
+        required: false
+        default: null
+        choices:
+        - ipv4
+        - ipv6
+      ip4_address:
+        description:
+          - IPv4 address.
+        required: false
+        default: null
+        type: str
+      ip6_address:
+        description:
+          - IPv6 address.
+        required: false
+        default: null
+        type: str
+      vlan:
+        description:
+          - VLAN ID.
+        required: false
+        default: null
+        type: int
+      health_check_type:
+        description:
+          - Gateway health check type.
+        required: false
+        default: icmp
+        choices:
+        - arp
+        - icmp
+      health_check_interval_second:
+        description:
+          - The interval, in seconds, between heakth check attempts.
+        required: false
+        default: 2
+        type: int
+      health_check_retries:
+        description:
+          - The number of failed attempts to declare the default gateway DOWN.
+        required: false
+        default: 8
+        type: int
+      route_priority:
+        description:
+          - The priority of the default route for this gateway.
+          - High priority means that the default gateway route will have higher priority over learned default routes.
+          - Low priority means that the default gateway route will have lower priority than learned default routes.
+        required: false
+        default: null
+        choices:
+        - low
+        - high
+      global_gateway_metric:
+        description:
+          - Set gateway metric
+          - In strict the gateway number determines its level of preference. Gateway 1 acts as the preferred default IP gateway until it fails
+            or is disabled, at which, point the next in line takes over as the default IP gateway.
+          - roundrobin is basic gateway load balancing. Alteon sends each new gateway request to the next healthy, enabled gateway in line. All
+            gateway requests to the same destination IP address are resolved to the same gateway.
+        required: false
+        default: null
+        choices:
+        - strict
+        - roundrobin
+notes:
+  - Requires the Radware alteon-sdk Python package on the host. This is as easy as
+      C(pip3 install alteon-sdk)
+requirements:
+  - alteon-sdk
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+  - radware.radware_alteon.alteon_options_doc_fragment.bulk
+'''
+
+EXAMPLES = r'''
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_l2_l3_bulk:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    physical_port:
+      - index: 1
+        vlan_tag_mode: tagged
+        pvid: 10
+      - index: 2
+        vlan_tag_mode: tagged
+        pvid: 10
+    l2_vlan:
+      - index: 10
+        name: servers
+        state: enabled
+        ports:
+          - 1
+          - 2
+      - index: 20
+        name: uplink
+        state: enabled
+        ports:
+          - 1
+    l3_interface:
+      - index: 1
+        ip4_address: 10.10.10.1
+        ip4_subnet: 255.255.255.0
+        vlan: 10
+        state: enabled
+      - index: 2
+        ip4_address: 192.0.2.2
+        ip4_subnet: 255.255.255.0
+        vlan: 20
+        state: enabled
+    l3_gateway:
+      - index: 1
+        ip4_address: 192.0.2.1
+        vlan: 20
+        state: enabled
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 3 of 9 entries changed
+changes:
+  description: Changed entries per section, with the evaluated diff when running in diff mode
+  returned: success
+  type: list
+  sample: [{"section": "l2_vlan", "command": "update", "id": {"index": 10}}]
+applied:
+  description: Whether the configuration was applied
+  returned: when the configuration was applied
+  type: bool
+  sample: true
+table_reads:
+  description: Number of device tables read during the run
+  returned: success
+  type: int
+  sample: 6
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, \
+    build_specs_from_annotation
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonBulkConfigurationModule, \
+    AlteonBulkConfigurationArgumentSpec
+try:
+    from radware.alteon.sdk.configurators.physical_port import PhysicalPortConfigurator
+    from radware.alteon.sdk.configurators.lacp_aggregation import LACPAggregationConfigurator
+    from radware.alteon.sdk.configurators.l2_vlan import VLANConfigurator
+    from radware.alteon.sdk.configurators.l3_interface import L3InterfaceConfigurator
+    from radware.alteon.sdk.configurators.l3_gateway import GatewayConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'physical_port': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'lacp_aggregation': {'type': 'dict', 'required': False},
+                       'l2_vlan': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'l3_interface': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'l3_gateway': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'provider': {'type': 'dict', 'required': True},
+                       'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'validate_references': {'required': False, 'type': 'bool', 'default': True},
+                       'apply': {'required': False, 'type': 'bool', 'default': True},
+                       'state': {'required': False, 'choices': ['present', 'absent', 'append'], 'default': 'present'}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+LACP_SECTION = 'lacp_aggregation'
+PORT_SECTION = 'physical_port'
+# port VLAN IDs are written once the VLANs exist
+PORT_PVID_SECTION = 'physical_port_pvid'
+# sections left untouched when removing entries, ports and aggregation cannot be deleted
+PORT_SECTIONS = (PORT_SECTION, LACP_SECTION, PORT_PVID_SECTION)
+
+
+def l2_l3_sections():
+    return [(PORT_SECTION, PhysicalPortConfigurator),
+            (LACP_SECTION, LACPAggregationConfigurator),
+            ('l2_vlan', VLANConfigurator),
+            ('l3_interface', L3InterfaceConfigurator),
+            ('l3_gateway', GatewayConfigurator)]
+
+
+def l2_l3_write_order():
+    # entries are written in this order and deleted in reverse order
+    return [(PORT_SECTION, PhysicalPortConfigurator),
+            (LACP_SECTION, LACPAggregationConfigurator),
+            ('l2_vlan', VLANConfigurator),
+            (PORT_PVID_SECTION, PhysicalPortConfigurator),
+            ('l3_interface', L3InterfaceConfigurator),
+            ('l3_gateway', GatewayConfigurator)]
+
+
+class ArgumentSpec(AlteonBulkConfigurationArgumentSpec):
+    def __init__(self):
+        super().__init__(*l2_l3_sections())
+        self.argument_spec.update({LACP_SECTION: {"required": False, "type": "dict", "options": build_specs_from_annotation(
+            LACPAggregationConfigurator.get_parameters_class())}})
+        self.argument_spec.update({"apply": {"required": False, "type": "bool", "default": True}})
+
+
+class ModuleManager(AlteonBulkConfigurationModule):
+    def __init__(self, **kwargs):
+        super().__init__(l2_l3_write_order(), **kwargs)
+
+    def _section_entries(self, name):
+        if self._state == 'absent' and name in PORT_SECTIONS:
+            return []
+        if name == LACP_SECTION:
+            return [self.params[LACP_SECTION]] if self.params.get(LACP_SECTION) else []
+        if name == PORT_SECTION:
+            return [dict(entry, pvid=None) for entry in self.params.get(PORT_SECTION) or []]
+        if name == PORT_PVID_SECTION:
+            return [dict(index=entry['index'], pvid=entry['pvid']) for entry in self.params.get(PORT_SECTION) or []
+                    if entry.get('pvid') is not None]
+        return self.params.get(name) or []
+
+    def _add_change(self, name, command, entry_id, diff=None):
+        if name == PORT_PVID_SECTION:
+            name = PORT_SECTION
+        super()._add_change(name, command, entry_id, diff)
+
+    @staticmethod
+    def _ids(entries, field='index'):
+        return set(str(entry.get(field)) for entry in entries if entry.get(field) is not None)
+
+    @staticmethod
+    def _vlan_set(value):
+        # zero leaves the interface or gateway without VLAN
+        return value is not None and str(value) != '0'
+
+    def _remaining(self, name):
+        # device entries kept when the listed entries are removed
+        removed = self._ids(self._section_entries(name))
+        return [entry for entry in self._device_entries(name) if str(entry.get('index')) not in removed]
+
+    def validate_references(self):
+        errors = []
+        if self._state == 'absent':
+            removed = self._ids(self._section_entries('l2_vlan')) & self._ids(self._device_entries('l2_vlan'))
+            for name in ('l3_interface', 'l3_gateway'):
+                for entry in self._remaining(name):
+                    if self._vlan_set(entry.get('vlan')) and str(entry.get('vlan')) in removed:
+                        errors.append(f'l2_vlan {entry["vlan"]} used by {name} {entry["index"]}')
+        else:
+            vlans = self._ids(self._device_entries('l2_vlan')) | self._ids(self._section_entries('l2_vlan'))
+            # ports are not checked when the device reports no port table, e.g. vADC
+            ports = self._ids(self._device_entries(PORT_SECTION))
+            for position, entry in enumerate(self.params.get(PORT_SECTION) or []):
+                if ports and str(entry['index']) not in ports:
+                    errors.append(f'{PORT_SECTION}[{position}]: unknown port index={entry["index"]}')
+                if self._vlan_set(entry.get('pvid')) and str(entry['pvid']) not in vlans:
+                    errors.append(f'{PORT_SECTION}[{position}]: unresolved pvid={entry["pvid"]}')
+            port_lists = [(f'l2_vlan[{position}]', entry.get('ports'))
+                          for position, entry in enumerate(self._section_entries('l2_vlan'))]
+            for entry in self._section_entries(LACP_SECTION):
+                port_lists.extend((f'{LACP_SECTION}.groups[{position}]', group.get('ports'))
+                                  for position, group in enumerate(entry.get('groups') or []))
+            for location, values in port_lists:
+                unknown = [str(port) for port in values or [] if ports and str(port) not in ports]
+                if unknown:
+                    errors.append(f'{location}: unknown ports={",".join(unknown)}')
+            for name in ('l3_interface', 'l3_gateway'):
+                for position, entry in enumerate(self._section_entries(name)):
+                    if self._vlan_set(entry.get('vlan')) and str(entry['vlan']) not in vlans:
+                        errors.append(f'{name}[{position}]: unresolved vlan={entry["vlan"]}')
+        if errors:
+            raise RadwareModuleError('reference validation failed:\n' + '\n'.join(errors))
+
+    def exec_module(self):
+        if self._state == 'absent':
+            ignored = [name for name in (PORT_SECTION, LACP_SECTION) if self.params.get(name)]
+            if ignored:
+                self.module.warn(f'{", ".join(ignored)} ignored with state absent')
+            if self._validate_references:
+                self.validate_references()
+        return super().exec_module()
+
+
+def main():
+    spec = ArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
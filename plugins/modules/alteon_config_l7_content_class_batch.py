@@ -0,0 +1,582 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_config_l7_content_class_batch
+author:
+  - Michal Greenberg (@michalg)
+short_description: create and manage layer7 content class with all its match entries in Radware Alteon
+description:
+  - create and manage layer7 content class together with its host name, path, file name, file type, header and cookie
+    match entries in Radware Alteon.
+  - The content class and every match table are read once, entries are compared per type by their index and only
+    changed entries are written to the device.
+version_added: '1.2.0'
+options:
+  state:
+    description:
+      - When C(present), guarantees that the content class and match entries exist with the provided attributes.
+      - When C(absent), removes the listed match entries. When no match entries are listed the content class itself
+        is removed.
+      - When C(append), append content class and match entries configuration with the provided parameters.
+    required: false
+    default: present
+    type: str
+    choices:
+    - present
+    - absent
+    - append
+  purge:
+    description:
+      - When C(true) and I(state=present), match entries of the content class that are not listed are removed,
+        for every match type.
+    required: false
+    default: false
+    type: bool
+  content_class:
+    description:
+      - Parameters for layer7 content class configuration.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l7_content_class).
+    required: true
+    type: dict
+    suboptions:
+      content_class_id:
+        description:
+          - content class index.
+        required: true
+        default: null
+        type: str
+      name:
+        description:
+          - Set Descriptive name for the content class.
+        required: false
+        default: null
+        type: str
+      content_class_type:
+        description:
+          - The content class type. This field can be set only for new entry.
+        required: false
+        default: null
+        type: str
+        choices:
+        - http
+        - http2
+        - ssl
+      logical_expression:
+        description:
+          - Set logical expression between classes.
+        required: false
+        default: null
+        type: str
+      host_name:
+        description:
+          - Read only field to indicate if URL host name table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+      path:
+        description:
+          - Read only field to indicate if URL path table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+      file_name:
+        description:
+          - Read only field to indicate if URL file name table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+      file_type:
+        description:
+          - Read only field to indicate if URL file_type table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+      header:
+        description:
+          - Read only field to indicate if header table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+      cookie:
+        description:
+          - Read only field to indicate if cookie table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+      text:
+        description:
+          - Read only field to indicate if text table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+      xml_tag:
+        description:
+          - Read only field to indicate if xml_tag table is not empty for current content class.
+        required: false
+        default: null
+        type: str
+        choices:
+        - "yes"
+        - "no"
+  hostnames:
+    description:
+      - Host names to match in the content class.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l7_content_class_hostname),
+        C(content_class_id) is taken from I(content_class).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      host_name_id:
+        description:
+          - host name index.
+        required: true
+        default: null
+        type: str
+      host_name:
+        description:
+          - Set hostname to match.
+        required: false
+        default: null
+        type: str
+      match_type:
+        description:
+          - Set match type for content class host name.
+        required: false
+        default: null
+        type: str
+        choices:
+        - sufx
+        - prefx
+        - equal
+        - include
+        - regex
+        - unsupported
+      data_class_id:
+        description:
+          - Set data class for hostname matching.
+        required: false
+        default: null
+        type: str
+  paths:
+    description:
+      - URL paths to match in the content class.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l7_content_class_path),
+        C(content_class_id) is taken from I(content_class).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      url_path_id:
+        description:
+          - url path index.
+        required: true
+        default: null
+        type: str
+      url_path:
+        description:
+          - The URL path to match.
+        required: false
+        default: null
+        type: str
+      match_type:
+        description:
+          - Set match type for content class URL path.
+        required: false
+        default: null
+        type: str
+        choices:
+        - sufx
+        - prefx
+        - equal
+        - include
+        - regex
+        - unsupported
+      case_sensitive:
+        description:
+          - Specifies whether to enable case-sensitivity for string matching.
+        required: false
+        default: null
+        type: str
+        choices:
+        - enabled
+        - disabled
+        - unsupported
+      data_class_id:
+        description:
+          - Set data class for URL path matching.
+        required: false
+        default: null
+        type: str
+  filenames:
+    description:
+      - File names to match in the content class.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l7_content_class_filename),
+        C(content_class_id) is taken from I(content_class).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      file_name_id:
+        description:
+          - file name entry index.
+        required: true
+        default: null
+        type: str
+      file_name_to_match:
+        description:
+          - The URL filename to match.
+        required: false
+        default: null
+        type: str
+      match_type:
+        description:
+          - Set match type.
+        required: false
+        default: include
+        choices:
+        - sufx
+        - prefx
+        - equal
+        - include
+        - regex
+      case_sensitive:
+        description:
+          - Specifies whether to enable case-sensitivity for string matching.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+  filetypes:
+    description:
+      - File types to match in the content class.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l7_content_class_filetype),
+        C(content_class_id) is taken from I(content_class).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      file_type_id:
+        description:
+          - file type entry index.
+        required: true
+        default: null
+        type: str
+      file_type_to_match:
+        description:
+          - The URL filetype to match.
+        required: false
+        default: null
+        type: str
+      match_type:
+        description:
+          - Set match type.
+        required: false
+        default: include
+        choices:
+        - sufx
+        - prefx
+        - equal
+        - include
+        - regex
+      case_sensitive:
+        description:
+          - Specifies whether to enable case-sensitivity for string matching.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+  headers:
+    description:
+      - Headers to match in the content class.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l7_content_class_header),
+        C(content_class_id) is taken from I(content_class).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      header_id:
+        description:
+          - header entry index.
+        required: true
+        default: null
+        type: str
+      header_name:
+        description:
+          - The HTTP header name to match.
+        required: false
+        default: null
+        type: str
+      header_value:
+        description:
+          - The HTTP header value to match.
+        required: false
+        default: null
+        type: str
+      header_name_match_type:
+        description:
+          - Set match type for HTTP header name.
+        required: false
+        default: include
+        choices:
+        - equal
+        - include
+        - regex
+      header_value_match_type:
+        description:
+          - Set match type for HTTP header value.
+        required: false
+        default: include
+        choices:
+        - equal
+        - include
+        - regex
+      case_sensitive:
+        description:
+          - Specifies whether to enable case-sensitivity for string matching.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+  cookies:
+    description:
+      - Cookies to match in the content class.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_l7_content_class_cookie),
+        C(content_class_id) is taken from I(content_class).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      cookie_id:
+        description:
+          - cookie entry index.
+        required: true
+        default: null
+        type: str
+      cookie_key:
+        description:
+          - the cookie key to match.
+        required: false
+        default: null
+        type: str
+      cookie_value:
+        description:
+          - the cookie value to match.
+        required: false
+        default: null
+        type: str
+      cookie_key_match_type:
+        description:
+          - Set match type for the cookie key.
+        required: false
+        default: include
+        choices:
+        - equal
+        - include
+        - regex
+      cookie_value_match_type:
+        description:
+          - Set match type for the cookie value.
+        required: false
+        default: include
+        choices:
+        - equal
+        - include
+        - regex
+      case_sensitive:
+        description:
+          - Specifies whether to enable case-sensitivity for string matching.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+  - radware.radware_alteon.alteon_options_doc_fragment.bulk
+'''
+
+EXAMPLES = r'''
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_l7_content_class_batch:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    purge: true
+    content_class:
+      content_class_id: 3
+      name: web_routing
+      content_class_type: http
+    hostnames:
+      - host_name_id: 1
+        host_name: www.example.com
+        match_type: equal
+    paths:
+      - url_path_id: 1
+        url_path: /api
+        match_type: prefx
+      - url_path_id: 2
+        url_path: /static
+        match_type: prefx
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 2 of 4 entries changed
+changes:
+  description: Changed entries per match type, with the evaluated diff when running in diff mode
+  returned: success
+  type: list
+  sample: [{"section": "paths", "command": "update", "id": {"content_class_id": "3", "url_path_id": "2"}}]
+table_reads:
+  description: Number of device tables read during the run
+  returned: success
+  type: int
+  sample: 3
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, build_specs_from_annotation
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonBulkConfigurationModule, \
+    AlteonBulkConfigurationArgumentSpec
+try:
+    from radware.alteon.sdk.configurators.l7_content_class import L7ContentClassConfigurator
+    from radware.alteon.sdk.configurators.l7_content_class_hostname import L7ContentClassHostNameConfigurator
+    from radware.alteon.sdk.configurators.l7_content_class_path import L7ContentClassPathConfigurator
+    from radware.alteon.sdk.configurators.l7_content_class_filename import L7ContentClassFileNameConfigurator
+    from radware.alteon.sdk.configurators.l7_content_class_filetype import L7ContentClassFileTypeConfigurator
+    from radware.alteon.sdk.configurators.l7_content_class_header import L7ContentClassHeaderConfigurator
+    from radware.alteon.sdk.configurators.l7_content_class_cookie import L7ContentClassCookieConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'content_class': {'type': 'dict', 'required': True},
+                       'hostnames': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'paths': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'filenames': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'filetypes': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'headers': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'cookies': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'provider': {'type': 'dict', 'required': True},
+                       'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'validate_references': {'required': False, 'type': 'bool', 'default': True},
+                       'purge': {'required': False, 'type': 'bool', 'default': False},
+                       'state': {'required': False, 'choices': ['present', 'absent', 'append'], 'default': 'present'}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+CONTENT_CLASS_ID = 'content_class_id'
+CONTENT_CLASS_SECTION = 'content_class'
+
+
+def match_sections():
+    return [('hostnames', L7ContentClassHostNameConfigurator),
+            ('paths', L7ContentClassPathConfigurator),
+            ('filenames', L7ContentClassFileNameConfigurator),
+            ('filetypes', L7ContentClassFileTypeConfigurator),
+            ('headers', L7ContentClassHeaderConfigurator),
+            ('cookies', L7ContentClassCookieConfigurator)]
+
+
+class ArgumentSpec(AlteonBulkConfigurationArgumentSpec):
+    def __init__(self):
+        super().__init__(*match_sections())
+        for name, config_class in match_sections():
+            self.argument_spec[name]['options'].pop(CONTENT_CLASS_ID)
+        self.argument_spec.update({CONTENT_CLASS_SECTION: {"required": True, "type": "dict", "options": build_specs_from_annotation(
+            L7ContentClassConfigurator.get_parameters_class())}})
+        self.argument_spec.update({"purge": {"required": False, "type": "bool", "default": False}})
+
+
+class ModuleManager(AlteonBulkConfigurationModule):
+    def __init__(self, **kwargs):
+        sections = [(CONTENT_CLASS_SECTION, L7ContentClassConfigurator)]
+        sections.extend(match_sections())
+        super().__init__(sections, **kwargs)
+
+    @property
+    def _content_class_id(self):
+        return self.params[CONTENT_CLASS_SECTION][CONTENT_CLASS_ID]
+
+    def _has_match_entries(self):
+        return any(self.params.get(name) for name, config_class in match_sections())
+
+    def _section_entries(self, name):
+        if name == CONTENT_CLASS_SECTION:
+            if self._state == 'absent' and self._has_match_entries():
+                return []
+            return [self.params[CONTENT_CLASS_SECTION]]
+        entries = []
+        for entry in self.params.get(name) or []:
+            entry = dict(entry)
+            entry.update({CONTENT_CLASS_ID: self._content_class_id})
+            entries.append(entry)
+        return entries
+
+    def _purge_scope(self, name):
+        if name == CONTENT_CLASS_SECTION:
+            return None
+        return {CONTENT_CLASS_ID: self._content_class_id}
+
+
+def main():
+    spec = ArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
@@ -64,6 +64,96 @@ options:
                     - Timeout for connection.
                 required: true
                 default: null
+            retries:
+                description:
+                    - Maximum attempts of a device REST request failing on a transient error.
+                required: false
+                default: 3
+                type: int
+            retry_backoff:
+                description:
+                    - Base delay in seconds between attempts, doubled on every attempt and randomized by a jitter.
+                required: false
+                default: 0.5
+                type: float
+            retry_max_backoff:
+                description:
+                    - Maximum delay in seconds between attempts.
+                required: false
+                default: 10.0
+                type: float
+            retry_on_status:
+                description:
+                    - HTTP statuses considered transient.
+                    - Requests without a response, e.g. on timeout, are always retried.
+                required: false
+                default: [500, 502, 503, 504]
+                type: list
+                elements: int
+            lock:
+                description:
+                    - Serialize configuration writes and apply, save and revert to the device among the tasks of this controller.
+                    - Writers are served in arrival order through a queue directory per device.
+                required: false
+                default: false
+                type: bool
+            lock_section:
+                description:
+                    - Configuration section guarded by the lock.
+                    - Writers of different sections of one device run concurrently, C(device) waits for all sections.
+                    - Apply, save and revert always lock the whole device.
+                required: false
+                default: device
+                type: str
+            lock_dir:
+                description:
+                    - Directory holding the lock queues, shared by the writers of the controller.
+                    - Defaults to a directory under the system temporary directory.
+                required: false
+                type: path
+            lock_timeout:
+                description:
+                    - Maximum seconds waiting for the lock before failing.
+                required: false
+                default: 600
+                type: int
+            lock_lease:
+                description:
+                    - Seconds after which a lock left by an interrupted writer is dropped.
+                    - The lease applies to writers of other hosts sharing I(lock_dir), a writer of this host keeps its lock while
+                      its process runs. The lock of a running writer is refreshed every third of the lease.
+                required: false
+                default: 900
+                type: int
+            ha_mode:
+                description:
+                    - When C(primary), configuration is written to the HA master only. The master applies the changes and
+                      syncs them to its peers, HA peers which are not the master are skipped.
+                    - Devices which are not part of an HA pair are configured as with C(all).
+                required: false
+                default: all
+                type: str
+                choices:
+                - all
+                - primary
+            ha_peers:
+                description:
+                    - Addresses of the HA peers of the master, sharing the master credentials.
+                    - With I(ha_mode=primary), the objects written by the task are compared on every peer after the
+                      config sync, by checksum of the object configuration.
+                required: false
+                type: list
+                elements: str
+            read_concurrency:
+                description:
+                    - Maximum number of independent device reads run concurrently, e.g. the tables of the configured
+                      object or the configurators and state tables gathered as facts.
+                    - Reads share the keep-alive connections of the device, C(1) reads one table at a time.
+                    - Concurrent reads need a keep-alive connection pool sized for them in the SDK REST client, reads run one
+                      table at a time with a warning when the installed SDK does not allow it.
+                required: false
+                default: 1
+                type: int
     state:
       description:
         - When C(present), guarantees that the object exists with the provided attributes.
@@ -86,6 +176,62 @@ options:
       required: false
       default: false
       type: bool
+    capabilities:
+      description:
+        - Device capabilities gathered by M(radware.radware_alteon.alteon_device_capabilities).
+        - When provided, configuration not supported by the device platform is skipped without contacting the device.
+      required: false
+      type: dict
+    object_index:
+      description:
+        - Object index gathered by M(radware.radware_alteon.alteon_device_object_index).
+        - When provided, referenced objects such as server groups, real servers, health checks, SSL policies and
+          network classes are checked against the index before the device is written and referenced object names
+          are replaced with their index.
+        - References missing from the index are looked up on the device once, the task fails when the object does
+          not exist.
+      required: false
+      type: dict
+    snapshot:
+      description:
+        - Device configuration snapshot, configuration entries per configurator name as returned by
+          M(radware.radware_alteon.alteon_offline_config_facts) I(config_obj).
+        - In check mode, changes are evaluated against the snapshot without contacting the device.
+        - Mutually exclusive with I(snapshot_src).
+      required: false
+      type: dict
+    snapshot_src:
+      description:
+        - Path of a configuration file saved from the device, used as the check mode snapshot.
+        - Only the server, server_group, virtual_server, virtual_service, l2_vlan, l3_interface and ssl_policy
+          configurators are read from the file, other configurators are evaluated against the device.
+        - The file omits the fields left at their default value, requested fields missing from the file are reported
+          as changes.
+        - The file does not carry the index of a virtual service, virtual services are matched by their virtual
+          server and I(service_port) when provided.
+        - Mutually exclusive with I(snapshot).
+      required: false
+      type: path
+    revert_scope:
+      description:
+        - Scope of the revert performed when I(revert_on_error=true).
+        - When C(device), all the pending configuration of the device is reverted.
+        - When C(session), only the objects written by the task are restored to their configuration when the task
+          started, pending changes of other writers are kept.
+      required: false
+      default: device
+      type: str
+      choices:
+      - device
+      - session
+    expected_fingerprint:
+      description:
+        - Compare and swap, I(fingerprint) of the object returned by an earlier C(read) task.
+        - The task fails without writing when the object no longer has this fingerprint, i.e. another writer
+          changed or removed it since it was read.
+        - Enable the provider I(lock) so no other writer lands between the check and the write.
+      required: false
+      type: str
     write_on_change:
       description:
         - Executes Alteon write calls only when an actual change has been evaluated.
@@ -165,6 +311,11 @@ obj:
   description: parameters object type
   returned: changed, read
   type: dict
+fingerprint:
+  description: Fingerprint of the object read, passed as I(expected_fingerprint) to a later task
+  returned: read
+  type: str
+  sample: 9f2c41d7a0e6b5c3d2e1f0a9b8c7d6e5f4a3b2c1d0e9f8a7b6c5d4e3f2a1b0c9
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -180,6 +331,11 @@ except ModuleNotFoundError:
         module_args = {'parameters': {'type': 'dict', 'required': False},
                        'provider': {'type': 'dict', 'required': True},
                        'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'capabilities': {'required': False, 'type': 'dict'},
+                       'snapshot': {'required': False, 'type': 'dict'},
+                       'snapshot_src': {'required': False, 'type': 'path'},
+                       'revert_scope': {'required': False, 'type': 'str', 'default': 'device'},
+                       'expected_fingerprint': {'required': False, 'type': 'str'},
                        'write_on_change': {'required': False, 'type': 'bool', 'default': False},
                        'state': {'required': True, 'choices': ['present', 'absent', 'read', 'overwrite', 'append']}
                        }
@@ -0,0 +1,602 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_config_snmpv3_bulk
+short_description: Manage an SNMPv3 profile in Radware Alteon
+description:
+  - Manage SNMPv3 users, groups, access entries, views, target parameters, target addresses, notifications and
+    communities in Radware Alteon in a single task.
+  - SNMPv3 tables are read once, references between the entries are resolved locally against the task entries and the
+    device entries, and only the changed entries are written to the device.
+  - Entries are written in dependency order, views and users before the groups, access entries and targets using
+    them, and deleted in reverse order.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  state:
+    description:
+      - When C(present), guarantees that the entries exist with the provided attributes.
+      - When C(absent), removes the listed entries. Users, groups, views and target parameters still referenced by
+        remaining device entries are not removed.
+      - When C(append), append entries configuration with the provided parameters.
+    required: false
+    default: present
+    type: str
+    choices:
+    - present
+    - absent
+    - append
+  view_tree_family:
+    description:
+      - SNMPv3 views.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_view_tree_family).
+      - MIB views, written before the access entries using them.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - Set view tree family name.
+        required: true
+        default: null
+        type: str
+      tree:
+        description:
+          - Set MIB subtree(OID) which defines a family of view subtrees.
+        required: true
+        default: null
+        type: str
+      mask:
+        description:
+          - Set view mask <bitmask, max size 32 characters>.
+        required: false
+        default: null
+        type: str
+      type:
+        description:
+          - Set view type.
+        required: false
+        default: null
+        choices:
+        - Included
+        - Excluded
+  usm_user:
+    description:
+      - SNMPv3 USM users.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_usm_user).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      usm_user_name:
+        description:
+          - Set USM user name.
+        required: true
+        default: null
+        type: str
+      authentication_protocol:
+        description:
+          - Specifies whether messages sent on behalf of this user to/from the SNMP engine can be authenticated,
+          - and if so, the type of authentication protocol that is used.
+        required: false
+        default: null
+        choices:
+        - NONE
+        - MD5
+        - SHA
+        - SHA256
+      authentication_password:
+        description:
+          - Set authentication password. If you selected an authentication algorithm you must provide password.
+        required: false
+        default: null
+        type: str
+      privacy_protocol:
+        description:
+          - Specifies whether messages sent on behalf of this user to and from the SNMP engine
+          - can be protected from disclosure, and if so, the type of privacy protocol that is used.
+        required: false
+        default: null
+        choices:
+        - NONE
+        - DES
+        - AES128
+        - AES256
+      privacy_password:
+        description:
+          - set the privacy password. If you selected an privacy protocol you must provide password.
+        required: false
+        default: null
+        type: str
+  group:
+    description:
+      - SNMPv3 security name to group mappings.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_group).
+      - I(usm_user_name) must be a USM user of the task or of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      security_model:
+        description:
+          - Set the security model.
+        required: true
+        default: null
+        choices:
+        - USM
+        - SNMPV1
+        - SNMPV2
+      usm_user_name:
+        description:
+          - Set USM user name.
+        required: true
+        default: null
+        type: str
+      group_name:
+        description:
+          - Set the group name.
+        required: false
+        default: null
+        type: str
+  access:
+    description:
+      - SNMPv3 group access entries.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_access).
+      - I(group_name) must be a group of the task or of the device, the view names views of the task or of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      group_name:
+        description:
+          - The name of the group to which this entry belongs.
+        required: true
+        default: null
+        type: str
+      context_prefix:
+        description:
+          - The value that must match to gain the access rights allowed by this row.
+          - This field is a key and must be set. If you want it to be empty, you should set " ".
+        required: true
+        default: null
+        type: str
+      security_model:
+        description:
+          - Set the security model.
+        required: true
+        default: null
+        choices:
+        - SNMPV1
+        - SNMPV2c
+        - UserBased
+      security_level:
+        description:
+          - The minimum level of security required to gain the access rights allowed by this row.
+        required: true
+        default: null
+        choices:
+        - NoAuthNoPriv
+        - AuthNoPriv
+        - AuthAndPriv
+      match_type:
+        description:
+          - Set access match.
+        required: false
+        default: null
+        choices:
+        - Exact
+        - Prefix
+      read_view_name:
+        description:
+          - The MIB view of the SNMP context to which this row authorizes read access.
+        required: false
+        default: null
+        type: str
+      write_view_name:
+        description:
+          - The MIB view of the SNMP context to which this row authorizes write access.
+        required: false
+        default: null
+        type: str
+      notify_view_name:
+        description:
+          - The MIB view of the SNMP context to which this row authorizes access for notifications.
+        required: false
+        default: null
+        type: str
+  target_params:
+    description:
+      - SNMPv3 target parameters.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_target_params).
+      - I(usm_user_name) must be a USM user of the task or of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - Set targetParams name.
+        required: true
+        default: null
+        type: str
+      message_procces_model:
+        description:
+          - Set message processing model to be used when generating SNMP messages using this entry.
+        required: false
+        default: null
+        choices:
+        - SNMPv1
+        - SNMPv2c
+        - SNMPv3
+      security_model:
+        description:
+          - Set the Security Model to be used when generating SNMP messages using this entry.
+        required: false
+        default: null
+        choices:
+        - SNMPv1
+        - SNMPv2c
+        - UserBased
+      usm_user_name:
+        description:
+          - set the USM user.
+        required: false
+        default: null
+        type: str
+      security_level:
+        description:
+          - Set the Level of Security to be used when generating SNMP messages using this entry.
+        required: false
+        default: null
+        choices:
+        - NoAuthNoPriv
+        - AuthNoPriv
+        - AuthPriv
+  target_addr_new_cfg:
+    description:
+      - SNMPv3 target addresses.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_target_addr_new_cfg).
+      - I(params_name) must be target parameters of the task or of the device.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - Set target addr name.
+        required: true
+        default: null
+        type: str
+      trans_ip:
+        description:
+          - Set target transport address IP.
+        required: false
+        default: null
+        choices:
+        - ipv4
+        - ipv6
+      port:
+        description:
+          - Set target transport address port.
+        required: false
+        default: null
+        choices:
+        - 1-65535
+      tag_list:
+        description:
+          - set tag list.
+        required: false
+        default: null
+        type: str
+      params_name:
+        description:
+          - Set targetParams name.
+        required: true
+        default: null
+        type: str
+      ena_trap:
+        description:
+          - set enable Trap to a particular target address.
+        required: false
+        default: null
+        type: str
+      dis_trap:
+        description:
+          - set disable Trap to a particular target address.
+        required: false
+        default: null
+        type: str
+      trans_ipv6:
+        description:
+          - set Target transport Ipv6 address.
+        required: false
+        default: null
+        type: str
+      ip_ver:
+        description:
+          - set Version of the target Ip Address.
+        required: false
+        default: null
+        type: str
+  notify:
+    description:
+      - SNMPv3 notifications.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_notify).
+      - Tags not found in the I(tag_list) of any target address are reported.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - Set notify name.
+        required: true
+        default: null
+        type: str
+      tag:
+        description:
+          - Set notify tag.
+        required: false
+        default: null
+        type: str
+  community:
+    description:
+      - SNMPv3 communities.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_snmpv3_community).
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Set community index.
+        required: true
+        default: null
+        type: str
+      community_name:
+        description:
+          - Set community string.
+        required: false
+        default: null
+        type: str
+      security_name:
+        description:
+          - Set security name.
+        required: false
+        default: null
+        type: str
+      transport_tag:
+        description:
+          - Set transport tag.
+        required: false
+        default: null
+        type: str
+notes:
+  - Requires the Radware alteon-sdk Python package on the host. This is as easy as
+      C(pip3 install alteon-sdk)
+requirements:
+  - alteon-sdk
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+  - radware.radware_alteon.alteon_options_doc_fragment.bulk
+'''
+
+EXAMPLES = r'''
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_snmpv3_bulk:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    view_tree_family:
+      - name: monitor
+        tree: 1.3.6.1.2.1
+        type: Included
+    usm_user:
+      - usm_user_name: nms
+        authentication_protocol: SHA256
+        authentication_password: "{{ snmp_auth_secret }}"
+        privacy_protocol: AES128
+        privacy_password: "{{ snmp_priv_secret }}"
+    group:
+      - security_model: USM
+        usm_user_name: nms
+        group_name: nms_ro
+    access:
+      - group_name: nms_ro
+        context_prefix: ""
+        security_model: UserBased
+        security_level: AuthAndPriv
+        read_view_name: monitor
+        notify_view_name: monitor
+    target_params:
+      - name: nms_params
+        usm_user_name: nms
+        message_procces_model: SNMPv3
+        security_model: UserBased
+        security_level: AuthPriv
+    target_addr_new_cfg:
+      - index: 1
+        name: nms1
+        trans_ip: 10.10.10.5
+        port: 162
+        tag_list: nms_traps
+        params_name: nms_params
+    notify:
+      - name: nms_notify
+        tag: nms_traps
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 2 of 7 entries changed
+changes:
+  description: Changed SNMPv3 entries per type, with the evaluated diff when running in diff mode
+  returned: success
+  type: list
+  sample: [{"section": "usm_user", "command": "update", "id": {"usm_user_name": "nms"}}]
+table_reads:
+  description: Number of device tables read during the run
+  returned: success
+  type: int
+  sample: 8
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonBulkConfigurationModule, \
+    AlteonBulkConfigurationArgumentSpec
+try:
+    from radware.alteon.sdk.configurators.snmpv3_view_tree_family import SNMPv3ViewTreeFamilyConfigurator
+    from radware.alteon.sdk.configurators.snmpv3_usm_user import SNMPv3UsmUserConfigurator
+    from radware.alteon.sdk.configurators.snmpv3_group import SNMPv3GroupConfigurator
+    from radware.alteon.sdk.configurators.snmpv3_access import SNMPv3AcessConfigurator
+    from radware.alteon.sdk.configurators.snmpv3_target_params import SNMPv3TargetParamsConfigurator
+    from radware.alteon.sdk.configurators.snmpv3_target_addr_new_cfg import SNMPv3TargetAddrNewCfgConfigurator
+    from radware.alteon.sdk.configurators.snmpv3_notify import SNMPv3NotifyConfigurator
+    from radware.alteon.sdk.configurators.snmpv3_community import SNMPv3CommunityConfigurator
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'view_tree_family': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'usm_user': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'group': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'access': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'target_params': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'target_addr_new_cfg': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'notify': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'community': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'provider': {'type': 'dict', 'required': True},
+                       'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'validate_references': {'required': False, 'type': 'bool', 'default': True},
+                       'state': {'required': False, 'choices': ['present', 'absent', 'append'], 'default': 'present'}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+
+def snmpv3_sections():
+    # referenced entries first, entries are written in this order and deleted in reverse order
+    return [('view_tree_family', SNMPv3ViewTreeFamilyConfigurator),
+            ('usm_user', SNMPv3UsmUserConfigurator),
+            ('group', SNMPv3GroupConfigurator),
+            ('access', SNMPv3AcessConfigurator),
+            ('target_params', SNMPv3TargetParamsConfigurator),
+            ('target_addr_new_cfg', SNMPv3TargetAddrNewCfgConfigurator),
+            ('notify', SNMPv3NotifyConfigurator),
+            ('community', SNMPv3CommunityConfigurator)]
+
+
+def snmpv3_references():
+    # (section, field) referencing the names of (section, field)
+    return [(('group', 'usm_user_name'), ('usm_user', 'usm_user_name')),
+            (('access', 'group_name'), ('group', 'group_name')),
+            (('access', 'read_view_name'), ('view_tree_family', 'name')),
+            (('access', 'write_view_name'), ('view_tree_family', 'name')),
+            (('access', 'notify_view_name'), ('view_tree_family', 'name')),
+            (('target_params', 'usm_user_name'), ('usm_user', 'usm_user_name')),
+            (('target_addr_new_cfg', 'params_name'), ('target_params', 'name'))]
+
+
+class ArgumentSpec(AlteonBulkConfigurationArgumentSpec):
+    def __init__(self):
+        super().__init__(*snmpv3_sections())
+
+
+class ModuleManager(AlteonBulkConfigurationModule):
+    def __init__(self, **kwargs):
+        super().__init__(snmpv3_sections(), **kwargs)
+        self._config_classes = dict(snmpv3_sections())
+        self._final_entries = {}
+
+    def _entry_key(self, name, entry):
+        required = self._config_classes[name].get_parameters_class()().get_required_fields()
+        return tuple(str(entry.get(field)) for field in required)
+
+    def _final_section(self, name):
+        # section entries once the task is applied
+        if name not in self._final_entries:
+            task_keys = set(self._entry_key(name, entry) for entry in self._section_entries(name))
+            entries = [entry for entry in self._device_entries(name) if self._entry_key(name, entry) not in task_keys]
+            if self._state != 'absent':
+                entries.extend(self._section_entries(name))
+            self._final_entries[name] = entries
+        return self._final_entries[name]
+
+    @staticmethod
+    def _names(entries, field):
+        return set(str(entry.get(field)) for entry in entries if entry.get(field) is not None)
+
+    def validate_references(self):
+        errors = []
+        for (name, field), (target, target_field) in snmpv3_references():
+            names = self._names(self._final_section(target), target_field)
+            if self._state == 'absent':
+                # remaining device entries must not lose a name they use
+                removed = self._names(self._device_entries(target), target_field) - names
+                for entry in self._final_section(name):
+                    if str(entry.get(field)) in removed:
+                        errors.append(f'{target} {entry.get(field)} referenced by {name} '
+                                      f'{", ".join(self._entry_key(name, entry))}')
+                continue
+            for position, entry in enumerate(self._section_entries(name)):
+                value = entry.get(field)
+                if value is not None and value != '' and str(value) not in names:
+                    errors.append(f'{name}[{position}]: unresolved {field}={value}')
+        if errors:
+            raise RadwareModuleError('reference validation failed:\n' + '\n'.join(errors))
+        if self._state != 'absent':
+            tags = set()
+            for entry in self._final_section('target_addr_new_cfg'):
+                tags.update((entry.get('tag_list') or '').split())
+            for entry in self._section_entries('notify'):
+                if entry.get('tag') and entry['tag'] not in tags:
+                    # notifications without target are valid, they send nothing
+                    self.module.warn(f'notify {entry["name"]}: tag {entry["tag"]} not found in any target address')
+
+    def exec_module(self):
+        if self._validate_references and self._state == 'absent':
+            self.validate_references()
+        return super().exec_module()
+
+
+def main():
+    spec = ArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,677 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_config_vadc_bulk
+short_description: Manage the vADC instances of a Radware Alteon VX
+description:
+  - Create, resize and remove the vADC instances of a Radware Alteon VX in a single task.
+  - The vADC tables are read once and only the changed instances are written to the VX, the configuration is then
+    applied once so the VX starts all the changed instances together.
+  - The instance status table is polled until every changed instance is ready, one read covers all the instances.
+    The write and ready time of each instance is reported.
+  - Follow with M(radware.radware_alteon.alteon_software_install_vadc) and
+    M(radware.radware_alteon.alteon_software_vadc_default) to set the software of the new instances.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  state:
+    description:
+      - When C(present), guarantees that the instances exist with the provided attributes.
+      - When C(absent), removes the listed instances.
+      - When C(append), append instances configuration with the provided parameters.
+    required: false
+    default: present
+    type: str
+    choices:
+    - present
+    - absent
+    - append
+  apply:
+    description:
+      - Apply the configuration once after all the instances were written, when any instance changed.
+      - Instances are started by the apply, readiness is not awaited when C(false).
+    required: false
+    default: true
+    type: bool
+  wait:
+    description:
+      - Wait until every changed instance is ready.
+      - An instance is ready when it is running with the requested capacity units, disabled when its I(state) is
+        C(disabled) and gone from the VX when removed.
+    required: false
+    default: true
+    type: bool
+  wait_timeout:
+    description:
+      - Maximum time in seconds to wait for the instances to be ready.
+    required: false
+    default: 600
+    type: int
+  poll_interval:
+    description:
+      - Time in seconds between two reads of the instance status table.
+    required: false
+    default: 5
+    type: int
+  vadcs:
+    description:
+      - vADC instances.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_vadc_instance).
+      - Instances are written in the listed order and started together by the apply.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - The vADC ID.
+        required: true
+        default: null
+        type: int
+      vadc_system_name:
+        description:
+          - The vADC name.
+        required: false
+        default: null
+        type: str
+      state:
+        description:
+          - Enable/Disable the vADC capacity unit.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      capacity_units:
+        description:
+          - The number of CUs allocated for traffic processing.
+        required: false
+        default: null
+        type: int
+      throughput_limit_mbps:
+        description:
+          - The maximum available throughput, in Mbit/s, for vADC allocation, which is determined by the device
+            throughput license.
+        required: false
+        default: null
+        type: int
+      appwall_capacity_units:
+        description:
+          - The number of CUs allocated for the AppWall component on the vADC.
+        required: false
+        default: null
+        type: int
+      fastview_capacity_units:
+        description:
+          - The maximum pages per second (PgPS) that the FastView component on the vADC can process.
+        required: false
+        default: 0
+        type: int
+      ssl_cps_limit:
+        description:
+          - The maximum SSL CPS for vADC allocation.
+        required: false
+        default: 0
+        type: int
+      compression_limit_mbps:
+        description:
+          - The maximum compression, in Mbit/s, for vADC allocation.
+        required: false
+        default: 0
+        type: int
+      apm_pages_per_minute_limit:
+        description:
+          -The maximum APM pages per minute that the vADC sends to APM.
+        required: false
+        default: 0
+        type: int
+      waf_limit_mbps:
+        description:
+          - The maximum Mbit/s that the AppWall component on the vADC can process.
+        required: false
+        default: null
+        type: int
+      authentication_user_limit:
+        description:
+          - The maximum users that the AppWall component on the vADC can process.
+        required: false
+        default: null
+        type: int
+      feature_global:
+        description:
+          - Specifies whether to enable Global Server Load Balancing.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      feature_bwm:
+        description:
+          - Specifies whether to enable Bandwidth Management.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      feature_ados:
+        description:
+          - Specifies whether to enable Advanced Denial of Service.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      fastview_pages_per_minute_limit:
+        description:
+          - The maximum pages per second (PgPS) that the FastView component on the vADC can process.
+        required: false
+        default: 0
+        type: int
+      feature_linkproof:
+        description:
+          - Specifies whether to enable Inbound Link Load Balancing.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      feature_ip_reputation:
+        description:
+          - Specifies whether to enable or disable the IP reputation feature for this vADC.
+          - IP reputation is a security feature that protects Alteon from known malicious IP addresses.
+          - Using a dynamic list of IP addresses list, the Alteon security administrator can easily and effectively
+            stop network-based IP threats that are targeting the network.
+          - The administrator can define whether to allow, block, or alert malicious IP addresses based on region,
+            category (SPAM or MALWARE), or risk severity level.
+          - An IP reputation license is required for IP reputation functionality.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      feature_url_filtering:
+        description:
+          - Specifies whether to enable the URL Filtering license for the vADC.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      vadc_ha_id:
+        description:
+          - The peer switch assigned to the vADC.
+        required: false
+        default: null
+        type: int
+      management_ip4_address:
+        description:
+          - The IPv4 address.
+        required: false
+        default: null
+        type: str
+      management_ip4_mask:
+        description:
+          - The IPv4 mask.
+        required: false
+        default: null
+        type: str
+      management_ip4_gateway:
+        description:
+          - The IPv4 default gateway.
+        required: false
+        default: null
+        type: str
+      management_ip6_address:
+        description:
+          - The IPv6 address.
+        required: false
+        default: null
+        type: str
+      management_ip6_prefix:
+        description:
+          - The IPv6 prefix.
+        required: false
+        default: null
+        type: int
+      management_ip6_gateway:
+        description:
+          - The IPv6 default gateway.
+        required: false
+        default: null
+        type: str
+      vadc_https_access:
+        description:
+          - Specifies whether HTTPS is enabled.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      vadc_ssh_access:
+        description:
+          - Specifies whether SSH is enabled.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      vadc_snmp_access:
+        description:
+          - Specifies whether SNMP is enabled.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      delegation_vx_management:
+        description:
+          - Specifies whether Delegate Settings are enabled.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      delegation_vx_syslog:
+        description:
+          - Specifies whether syslog is enabled in the vADC.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      delegation_vx_radius:
+        description:
+          - Specifies whether RADIUS is enabled in the vADC.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      delegation_vx_tacacs:
+        description:
+          - Specifies whether TACACS is enabled in the vADC.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      delegation_vx_smtp:
+        description:
+          - Specifies whether SMTP is enabled in the vADC.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      lock_vadc_management:
+        description:
+          - Specifies whether Delegate Services Locking is locked.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      lock_vadc_syslog:
+        description:
+          - Specifies whether the syslog servers are locked.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      lock_vadc_radius:
+        description:
+          - Specifies whether the RADIUS servers are locked.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      lock_vadc_tacacs:
+        description:
+          - Specifies whether the TACACS servers are locked.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      lock_vadc_smtp:
+        description:
+          - Specifies whether the SMTP servers are locked.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      vx_admin_password:
+        description:
+          - VX admin user password.
+        required: false
+        default: null
+        type: str
+      vadc_admin_password:
+        description:
+          - vADC admin user password.
+        required: false
+        default: null
+        type: str
+      vlans:
+        description:
+          - VLANs to add to the vADC.
+        required: false
+        default: null
+        type: list
+        elements: int
+      vadc_peer_id:
+        description:
+          - The peer ID.
+        required: false
+        default: null
+        type: int
+      vadc_peer_name:
+        description:
+          - The peer name.
+        required: false
+        default: null
+        type: str
+      vadc_peer_ip4:
+        description:
+          - The IPv4 address.
+        required: false
+        default: null
+        type: str
+      vadc_peer_ip4_gateway:
+        description:
+          - The IPv4 default gateway.
+        required: false
+        default: null
+        type: str
+      vadc_peer_subnet:
+        description:
+          - The IPv4 mask.
+        required: false
+        default: null
+        type: str
+      vadc_peer_ip6:
+        description:
+          - The IPv6 address.
+        required: false
+        default: null
+        type: str
+      vadc_peer_prefix:
+        description:
+          - The IPv6 prefix.
+        required: false
+        default: null
+        type: int
+      vadc_peer_ip6_gateway:
+        description:
+          - The IPv6 default gateway.
+        required: false
+        default: null
+        type: str
+      management_nets:
+        description:
+          - Allowed Networks for vADCs.
+        required: false
+        default: null
+        type: list
+        elements: dict
+        suboptions:
+          vlan:
+            description:
+              - The VLAN ID of the allowed network.
+            required: true
+            default: null
+            type: int
+          ip_ver:
+            description:
+              - Specifies the type of IP address.
+            required: false
+            default: ipv4
+            choices:
+            - ipv4
+            - ipv6
+          ip4_net_address:
+            description:
+              - The IP network address.
+            required: false
+            default: null
+            type: str
+          ip4_subnet:
+            description:
+              - The IP network mask.
+            required: false
+            default: null
+            type: str
+          ip6_net_address:
+            description:
+              - The IP network address.
+            required: false
+            default: null
+            type: str
+          ip6_prefix:
+            description:
+              - The IP network prefix.
+            required: false
+            default: null
+            type: int
+notes:
+  - Requires the Radware alteon-sdk Python package on the host. This is as easy as
+      C(pip3 install alteon-sdk)
+requirements:
+  - alteon-sdk
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+  - radware.radware_alteon.alteon_options_doc_fragment.bulk
+'''
+
+EXAMPLES = r'''
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_vadc_bulk:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    wait_timeout: 900
+    vadcs:
+      - index: 6
+        state: enabled
+        capacity_units: 4
+        throughput_limit_mbps: 200
+        management_ip4_address: 172.16.1.6
+        management_ip4_mask: 255.255.255.0
+        management_ip4_gateway: 172.16.1.254
+        vadc_https_access: enabled
+        vadc_ssh_access: enabled
+        vlans:
+          - 45
+      - index: 7
+        state: enabled
+        capacity_units: 2
+        management_ip4_address: 172.16.1.7
+        management_ip4_mask: 255.255.255.0
+        management_ip4_gateway: 172.16.1.254
+        vadc_https_access: enabled
+        vadc_ssh_access: enabled
+        vlans:
+          - 47
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 2 of 50 entries changed
+changes:
+  description: Changed entries per section, with the evaluated diff when running in diff mode
+  returned: success
+  type: list
+  sample: [{"section": "vadcs", "command": "update", "id": {"index": 6}}]
+applied:
+  description: Whether the configuration was applied
+  returned: when the configuration was applied
+  type: bool
+  sample: true
+instances:
+  description:
+    - Changed instances with the time in seconds since the start of the run at which each instance was written and
+      became ready, and its last reported status.
+  returned: when the instances were awaited
+  type: list
+  sample: [{"index": 6, "command": "update", "written": 0.84, "ready": 95.2, "status": "running"}]
+polls:
+  description: Number of instance status table reads while waiting
+  returned: when the instances were awaited
+  type: int
+  sample: 19
+table_reads:
+  description: Number of device tables read during the run
+  returned: success
+  type: int
+  sample: 3
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import time
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonBulkConfigurationModule, \
+    AlteonBulkConfigurationArgumentSpec
+try:
+    from radware.sdk.exceptions import RadwareError
+    from radware.sdk.configurator import DeviceConfigurator
+    from radware.alteon.sdk.configurators.vadc_instance import VADCInstanceConfigurator
+    from radware.alteon.beans.VADCInfoTable import VADCInfoTable, EnumVADCInfoStatus
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'vadcs': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'provider': {'type': 'dict', 'required': True},
+                       'revert_on_error': {'required': False, 'type': 'bool', 'default': False},
+                       'validate_references': {'required': False, 'type': 'bool', 'default': True},
+                       'apply': {'required': False, 'type': 'bool', 'default': True},
+                       'wait': {'required': False, 'type': 'bool', 'default': True},
+                       'wait_timeout': {'required': False, 'type': 'int', 'default': 600},
+                       'poll_interval': {'required': False, 'type': 'int', 'default': 5},
+                       'state': {'required': False, 'choices': ['present', 'absent', 'append'], 'default': 'present'}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+VADC_SECTION = 'vadcs'
+STATUS_ABSENT = 'absent'
+
+
+def vadc_sections():
+    return [(VADC_SECTION, VADCInstanceConfigurator)]
+
+
+class ArgumentSpec(AlteonBulkConfigurationArgumentSpec):
+    def __init__(self):
+        super().__init__(*vadc_sections())
+        self.argument_spec.update({"apply": {"required": False, "type": "bool", "default": True},
+                                   "wait": {"required": False, "type": "bool", "default": True},
+                                   "wait_timeout": {"required": False, "type": "int", "default": 600},
+                                   "poll_interval": {"required": False, "type": "int", "default": 5}})
+
+
+class ModuleManager(AlteonBulkConfigurationModule):
+    def __init__(self, **kwargs):
+        super().__init__(vadc_sections(), **kwargs)
+        self._started = time.monotonic()
+        # changed instances by vADC ID: command and write time
+        self._written = {}
+
+    def _elapsed(self):
+        return round(time.monotonic() - self._started, 3)
+
+    def _add_change(self, name, command, entry_id, diff=None):
+        super()._add_change(name, command, entry_id, diff)
+        self._written[str(entry_id['index'])] = dict(index=entry_id['index'], command=command,
+                                                     written=self._elapsed(), ready=None, status=None)
+
+    @staticmethod
+    def _is_ready(command, entry, status):
+        if command == DeviceConfigurator.DELETE:
+            return status is None
+        if status is None:
+            return False
+        if entry.get('state') == 'disabled':
+            return status.Status == EnumVADCInfoStatus.disabled
+        if status.Status != EnumVADCInfoStatus.running:
+            return False
+        return entry.get('capacity_units') is None or str(status.CU) == str(entry['capacity_units'])
+
+    def _read_status(self):
+        # the status of every instance in a single read, not cached across polls
+        try:
+            return {str(row.Id): row for row in self._connection.rest.read_all(VADCInfoTable()) or []}
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+
+    def wait_ready(self):
+        """
+        poll the VX instance status table until every changed instance is ready
+        instances boot concurrently after the apply, each one is marked ready on the first poll reporting it
+        """
+        entries = {str(entry['index']): entry for entry in self.params.get(VADC_SECTION) or []}
+        pending = dict(self._written)
+        deadline = time.monotonic() + self.params['wait_timeout']
+        polls = 0
+        while True:
+            statuses = self._read_status()
+            polls += 1
+            for index, instance in list(pending.items()):
+                status = statuses.get(index)
+                instance.update(status=status.Status.name if status is not None and status.Status else STATUS_ABSENT)
+                if self._is_ready(instance['command'], entries.get(index, {}), status):
+                    instance.update(ready=self._elapsed())
+                    del pending[index]
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RadwareModuleError(f'vADC instances not ready after {self.params["wait_timeout"]}s: ' +
+                                         ', '.join(f'{i["index"]} ({i["status"]})' for i in pending.values()))
+            time.sleep(min(self.params['poll_interval'], remaining))
+        return list(self._written.values()), polls
+
+    def exec_module(self):
+        result = super().exec_module()
+        # instances are awaited once the device lock is released
+        if result.get('applied') and self.params['wait']:
+            instances, polls = self.wait_ready()
+            result.update(instances=instances, polls=polls)
+        return result
+
+
+def main():
+    spec = ArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_device_capabilities
+short_description: Probe Alteon device capabilities
+description:
+  - Probe the Alteon device platform type and software version and evaluate the configurators supported by it.
+  - The result is set as the C(alteon_capabilities) host fact, so the probe runs once per host and play.
+  - Pass the fact to the C(capabilities) option of configuration modules to skip configuration not supported by the
+    device platform without contacting the device.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+'''
+
+EXAMPLES = r'''
+- name: alteon device capabilities
+  radware.radware_alteon.alteon_device_capabilities:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+  when: alteon_capabilities is not defined
+
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_spanning_tree:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    capabilities: "{{ alteon_capabilities }}"
+    state: present
+    parameters:
+      state: true
+      mstp: enabled
+'''
+
+RETURN = r'''
+ansible_facts:
+  description: Alteon device capabilities
+  returned: success
+  type: complex
+  contains:
+    alteon_capabilities:
+      description: Device platform, version and unsupported configurators
+      returned: success
+      type: dict
+      sample:
+        form_factor: Standalone
+        is_vx: false
+        is_container: true
+        is_standalone: true
+        is_vadc: false
+        software_version: 32.6.3.50
+        minimum_supported_version: ["31.0.10.0", "32.2.2.0"]
+        version_supported: true
+        unsupported_configurators: ["sys_vx_peer_sync", "vadc_instance"]
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, radware_server_argument_spec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonAnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.capabilities import probe_capabilities, CAPABILITIES_FACTS
+try:
+    from radware.sdk.exceptions import RadwareError
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'provider': {'type': 'dict', 'required': True}}
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False, supports_check_mode=True)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+
+class ArgumentSpecs(object):
+    def __init__(self):
+        self.supports_check_mode = True
+        self.argument_spec = {}
+        self.argument_spec.update(radware_server_argument_spec)
+
+
+class ModuleManager(AlteonAnsibleModule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def exec_module(self):
+        try:
+            capabilities = probe_capabilities(self._mng)
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+
+        if not capabilities['version_supported']:
+            self.module_warn_alteon_version()
+        return dict(changed=False, ansible_facts={CAPABILITIES_FACTS: capabilities})
+
+
+def main():
+    spec = ArgumentSpecs()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
@@ -24,7 +24,8 @@ options:
       - this module execute read command over all alteon configurators and output objects
       - for some configurators *_stats & *_state bean are available
       - for more details about certain choice , please refer to the approriate module
-    required: True
+      - added to the facts of C(profile) when both are provided.
+    required: false
     default: null
     elements: str
     type: list
@@ -209,6 +210,47 @@ options:
     - "!sideband_policy"
     - security_global
     - "!security_global"
+  profile:
+    description:
+      - Named facts profile to collect, one of the built-in profiles or of the C(profiles) option.
+      - C(inventory) collects the system information, times and software images only.
+      - C(slb) collects the real servers, groups, virtual servers and services, health checks and SSL objects.
+      - C(security) collects the local users, management access, authentication, SNMP and security settings.
+      - C(full) collects all the facts, as C(gather_facts=all).
+      - Only the configurators and beans of the profile facts are read, the most expensive reads start first.
+      - One of C(gather_facts) or C(profile) is required.
+    required: false
+    type: str
+  profiles:
+    description:
+      - User defined profiles, profile name to a list of C(gather_facts) values.
+      - A user defined profile overrides the built-in profile with the same name.
+      - Every user defined profile is validated, a profile must be a list of known C(gather_facts) values.
+    required: false
+    type: dict
+  format:
+    description:
+      - Output format of facts that are lists of objects, e.g. configuration entries or state bean entries.
+      - When C(records), every object is returned as a dictionary.
+      - When C(columnar), a list of objects is returned as one list of field names in C(fields) and a parallel list
+        of value arrays in C(values), one array per field, with the number of objects in C(count) and
+        C(alteon_facts_format=columnar) marking the table.
+      - Objects missing a field get C(null) in its array, their positions are listed per field in C(missing), only
+        returned when an object misses a field.
+      - Use the C(radware.radware_alteon.alteon_facts_records) filter to restore C(columnar) facts to records.
+    required: false
+    default: records
+    type: str
+    choices:
+    - records
+    - columnar
+  compress:
+    description:
+      - Return C(facts_obj) compressed, as a dictionary with the C(encoding) and the encoded C(data).
+      - Use the C(radware.radware_alteon.alteon_facts_decompress) filter to restore the facts.
+    required: false
+    default: false
+    type: bool
 extends_documentation_fragment: radware.radware_alteon.alteon_options_doc_fragment
 '''
 
@@ -232,6 +274,57 @@ EXAMPLES = r'''
       - ssl_cert
       - ssl_key
       - "!sys_time_date"
+
+- name: alteon device inventory
+  radware.radware_alteon.alteon_device_facts:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    profile: inventory
+
+- name: alteon device user defined profile
+  radware.radware_alteon.alteon_device_facts:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    profile: servers
+    profiles:
+      servers:
+        - server
+        - server_state
+        - server_group
+    gather_facts:
+      - system_info
+
+- name: alteon device compact facts
+  radware.radware_alteon.alteon_device_facts:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    gather_facts:
+      - server_state
+    format: columnar
+    compress: true
+  register: alteon_facts
+
+- name: alteon device facts records
+  ansible.builtin.set_fact:
+    server_state: "{{ (alteon_facts.facts_obj | radware.radware_alteon.alteon_facts_records).server_state }}"
 '''
 
 RETURN = r'''
@@ -459,28 +552,23 @@ from ansible.module_utils.basic import AnsibleModule
 import traceback
 from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, radware_server_argument_spec
 from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonAnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.capabilities import probe_capabilities, \
+    platform_unsupported_configurators
+from ansible_collections.radware.radware_alteon.plugins.module_utils.facts import to_columnar, compress_facts, \
+    FACTS_FORMATS, FACTS_FORMAT_RECORDS, FACTS_FORMAT_COLUMNAR
+from ansible_collections.radware.radware_alteon.plugins.module_utils.facts_plan import compile_plan, profile_facts, \
+    fact_choices, state, stats, STATE_BEANS_VAR_NAME, STATS_BEANS_VAR_NAME, SYS_INFO_FACTS, SYS_CAPACITY_FACTS, \
+    SYS_TIMES_FACTS, ADC_SOFTWARE_FACTS, VX_SOFTWARE_FACTS, READ_CONFIG, READ_STATE
 try:
-    from typing import get_type_hints
     from radware.sdk.exceptions import RadwareError
     from radware.alteon.api.mgmt import AlteonManagement
     from radware.alteon.api.config import AlteonConfigurators
     from radware.sdk.configurator import DeviceConfigurator, DeviceConfigurationManager
     from radware.alteon.sdk.configurators.ssl_key import SSLKeyConfigurator
     from radware.alteon.sdk.configurators.ssl_cert import SSLCertConfigurator
-    from radware.alteon.sdk.configurators.system_vx_peer_syncronization import VXPeerSyncConfigurator
-    from radware.alteon.sdk.configurators.vadc_instance import VADCInstanceConfigurator
-    from radware.alteon.sdk.configurators.spanning_tree import SpanningTreeConfigurator
-    from radware.alteon.sdk.configurators.l2_lldp import LLDPConfigurator
-    from radware.alteon.sdk.configurators.system_time_date import SystemTimeDateConfigurator
-    from radware.alteon.sdk.configurators.lacp_aggregation import LACPAggregationConfigurator
-    from radware.alteon.sdk.configurators.system_dns_client import SystemDNSClientConfigurator
-    from radware.alteon.sdk.configurators.l3_bootp_relay import BOOTPRelayConfigurator
-    from radware.alteon.sdk.configurators.ha_configuration_sync import ConfigurationSyncConfigurator
-    from radware.alteon.sdk.configurators.high_availability import HighAvailabilityConfigurator
-    from radware.alteon.sdk.configurators.global_traffic_redirection import GlobalRedirectionConfigurator
 except ModuleNotFoundError:
     if __name__ == '__main__':
-        module_args = {"gather_facts": {"required": True, "type": "list", "elements": "str", "choices": [
+        module_args = {"gather_facts": {"required": False, "type": "list", "elements": "str", "choices": [
                                                                                                         ['all'],
                                                                                                         ['!all'],
                                                                                                         ['system_info'],
@@ -662,126 +750,91 @@ except ModuleNotFoundError:
                                                                                                         ['security_global'],
                                                                                                         ['!security_global']]
                                         },
+                       'profile': {'type': 'str', 'required': False},
+                       'profiles': {'type': 'dict', 'required': False},
+                       'format': {'type': 'str', 'required': False, 'default': 'records', 'choices': ['records', 'columnar']},
+                       'compress': {'type': 'bool', 'required': False, 'default': False},
                        'provider': {'type': 'dict', 'required': True}
                        }
         module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False, supports_check_mode=True)
         module.fail_json(msg="The alteon-sdk package is required")
 
-STATE_BEANS_VAR_NAME = 'state_beans'
-STATS_BEANS_VAR_NAME = 'stats_beans'
 MNG_TIME_PROPS = ['last_boot_time',
                   'last_apply_time',
                   'last_save_time',
                   'switch_uptime',
                   'system_time',
                   'system_date']
-SYS_INFO_FACTS = 'system_info'
-SYS_CAPACITY_FACTS = 'system_capacity'
-SYS_TIMES_FACTS = 'system_times'
-ADC_SOFTWARE_FACTS = 'adc_software_images'
-VX_SOFTWARE_FACTS = 'vx_software_images'
 
 
 class ArgumentSpecs(object):
     def __init__(self):
         self.supports_check_mode = False
-        self.argument_spec = {"gather_facts": {"required": True, "type": "list", "elements": "str", "choices": self._subset()}}
+        self.argument_spec = {"gather_facts": {"required": False, "type": "list", "elements": "str", "choices": self._subset()},
+                              "profile": {"required": False, "type": "str"},
+                              "profiles": {"required": False, "type": "dict"},
+                              "format": {"required": False, "type": "str", "default": FACTS_FORMAT_RECORDS,
+                                         "choices": FACTS_FORMATS},
+                              "compress": {"required": False, "type": "bool", "default": False}}
         self.argument_spec.update(radware_server_argument_spec)
-
-    def _subset(self):
-        subset = []
-        subset.extend(['all', '!all', SYS_INFO_FACTS, self._exclude(SYS_INFO_FACTS), SYS_TIMES_FACTS,
-                       self._exclude(SYS_TIMES_FACTS), SYS_CAPACITY_FACTS, self._exclude(SYS_CAPACITY_FACTS),
-                       ADC_SOFTWARE_FACTS, self._exclude(ADC_SOFTWARE_FACTS), VX_SOFTWARE_FACTS,
-                       self._exclude(VX_SOFTWARE_FACTS)])
-        subset.extend(self._mng_subset)
-        subset.extend(self._config_subset)
-        return subset
-
-    @property
-    def _mng_subset(self):
-        cfg_subset = []
-        return cfg_subset
-
-    @property
-    def _config_subset(self):
-        def _add_state_stats(config_class):
-            if config_class:
-                config_class_meta = get_type_hints(config_class)
-                if config_class_meta and STATE_BEANS_VAR_NAME in config_class_meta:
-                    cfg_subset.append(self.state(k))
-                    cfg_subset.append(self._exclude(self.state(k)))
-                if config_class_meta and STATS_BEANS_VAR_NAME in config_class_meta:
-                    cfg_subset.append(self.stats(k))
-                    cfg_subset.append(self._exclude(self.stats(k)))
-
-        cfg_subset = []
-        meta = get_type_hints(AlteonConfigurators)
-        for k, v in meta.items():
-            cfg_subset.append(k)
-            cfg_subset.append(self._exclude(k))
-            _add_state_stats(v)
-        return cfg_subset
+        self.required_one_of = [['gather_facts', 'profile']]
 
     @staticmethod
-    def _exclude(k):
-        # return "!{0}".format(k)
-        return f"!{k}"
-
-    @staticmethod
-    def state(k):
-        # return "{0}_state".format(k)
-        return f"{k}_state"
-
-    @staticmethod
-    def stats(k):
-        # return "{0}_stats".format(k)
-        return f"{k}_stats"
+    def _subset():
+        return list(fact_choices())
 
 
 class ModuleManager(AlteonAnsibleModule):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._facts = self.params['gather_facts']
+        self._facts = profile_facts(self.params.get('profile'), self.params.get('profiles'),
+                                    self.params.get('gather_facts'))
+        self._format = self.params.get('format') or FACTS_FORMAT_RECORDS
+        self._compress = self.params.get('compress')
         self._device_mng = AlteonManagement(self._connection)
         self._configurators = AlteonConfigurators(self._connection)
 
     def exec_module(self):
-        facts_to_collect, exclude_facts = self.filter_excluded_facts()
+        plan = compile_plan(self._facts)
         result = {}
 
         try:
             # self._device_mng.verify_device_accessible(retries=2)
-            result.update(self.collect_config_facts(facts_to_collect, exclude_facts))
-            result.update(self.collect_mng_facts(facts_to_collect, exclude_facts))
+            result.update(self.collect_config_facts(plan))
+            result.update(self.collect_mng_facts(plan))
         except RadwareError as e:
             raise RadwareModuleError(e) from e
 
+        if self._format == FACTS_FORMAT_COLUMNAR:
+            result = to_columnar(result)
+        if self._compress:
+            result = compress_facts(result)
         return {"facts_obj": result}
 
-    def collect_mng_facts(self, facts_list, exclude_list):
+    def collect_mng_facts(self, plan):
         result = {}
         system_info = {}
         system_times = {}
 
-        for k, v in self._device_mng.info.device_sys_info().items():
-            if k in MNG_TIME_PROPS:
-                system_times.update({k: v})
-            else:
-                system_info.update({k: v})
-        if ('all' in facts_list and SYS_INFO_FACTS not in exclude_list) or SYS_INFO_FACTS in facts_list:
+        if plan.needs_sys_info:
+            for k, v in self._device_mng.info.device_sys_info().items():
+                if k in MNG_TIME_PROPS:
+                    system_times.update({k: v})
+                else:
+                    system_info.update({k: v})
+        if SYS_INFO_FACTS in plan.mng_facts:
             result.update({SYS_INFO_FACTS: system_info})
-        if ('all' in facts_list and SYS_TIMES_FACTS not in exclude_list) or SYS_TIMES_FACTS in facts_list:
+        if SYS_TIMES_FACTS in plan.mng_facts:
             result.update({SYS_TIMES_FACTS: system_times})
-        if ('all' in facts_list and SYS_CAPACITY_FACTS not in exclude_list) or SYS_CAPACITY_FACTS in facts_list:
+        if SYS_CAPACITY_FACTS in plan.mng_facts:
             result.update({SYS_CAPACITY_FACTS: self._device_mng.info.device_sys_capacity()})
-        if ('all' in facts_list and ADC_SOFTWARE_FACTS not in exclude_list) or ADC_SOFTWARE_FACTS in facts_list:
+        if ADC_SOFTWARE_FACTS in plan.mng_facts:
             result.update({ADC_SOFTWARE_FACTS: self._device_mng.info.adc_images})
-        if ('all' in facts_list and VX_SOFTWARE_FACTS not in exclude_list) or VX_SOFTWARE_FACTS in facts_list:
+        if VX_SOFTWARE_FACTS in plan.mng_facts:
             result.update({VX_SOFTWARE_FACTS: self._device_mng.info.vx_images})
         return result
 
-    def collect_config_facts(self, facts_list, exclude_list):
+    def collect_config_facts(self, plan):
         def _translate_filter_bean(beans, bean_filter):
             translated_beans = [b.obj_to_dict() for b in beans]
             if bean_filter and 'exclude' in bean_filter:
@@ -796,67 +849,70 @@ class ModuleManager(AlteonAnsibleModule):
                             b.pop(k)
             return translated_beans
 
-        def _read_beans(b_classes):
-            beans_res = {}
-            if b_classes:
-                for bean_class, bean_filter in b_classes.items():
-                    beans = self._connection.rest.read_all(bean_class())
-                    if beans:
-                        beans_res.update({bean_class.__name__: _translate_filter_bean(beans, bean_filter)})
-            return beans_res
-
-        def _collect_state_stats():
-            state_fact_key = ArgumentSpecs.state(key)
-            stats_fact_key = ArgumentSpecs.stats(key)
-            if ('all' in facts_list and state_fact_key not in exclude_list) or state_fact_key in facts_list:
-                if hasattr(configurator, STATE_BEANS_VAR_NAME):
-                    cfg_beans = _read_beans(getattr(configurator, STATE_BEANS_VAR_NAME))
-                    result.update({state_fact_key: cfg_beans})
-            if ('all' in facts_list and stats_fact_key not in exclude_list) or stats_fact_key in facts_list:
-                if hasattr(configurator, STATS_BEANS_VAR_NAME):
-                    cfg_beans = _read_beans(getattr(configurator, STATS_BEANS_VAR_NAME))
-                    result.update({stats_fact_key: cfg_beans})
-
         result = {}
+        # the plan lists the reads most expensive first, they run concurrently by the engine
+        reads = []
+        calls = []
         cfg_mng = DeviceConfigurationManager()
-        vx_device = self._device_mng.info.is_vx
-        container_device = self._device_mng.info.is_container
-
-        for key in get_type_hints(AlteonConfigurators):
+        vx_device = False
+        unsupported = ()
+        if plan.needs_capabilities:
+            capabilities = probe_capabilities(self._device_mng)
+            vx_device = capabilities['is_vx']
+            unsupported = tuple(platform_unsupported_configurators(vx_device, capabilities['is_container']))
+
+        def _platform_unsupported(configurator):
+            if isinstance(configurator, (SSLCertConfigurator, SSLKeyConfigurator)) and not vx_device:
+                return False
+            return isinstance(configurator, unsupported)
+
+        # the state and stats of configurators unsupported by the platform are not collected with them
+        skipped = set()
+        for fact_key, key, read_kind in plan.reads:
+            if read_kind == READ_CONFIG and _platform_unsupported(getattr(self._configurators, key)):
+                skipped.update((fact_key, state(key), stats(key)))
+
+        for fact_key, key, read_kind in plan.reads:
             configurator = getattr(self._configurators, key)
-            if ('all' in facts_list and key not in exclude_list) or key in facts_list:
-                # check if configurator type is SSLCertConfigurator
-                if isinstance(configurator, SSLCertConfigurator) and not vx_device:
-                    result.update({key: cfg_mng.execute(configurator,
-                                                        'read_all_cert_info', None).content_translate})
-                elif isinstance(configurator, SSLKeyConfigurator) and not vx_device:  # check if configurator type is SSLKeyConfigurator
-                    result.update({key: cfg_mng.execute(configurator,
-                                                        'read_all_key_info', None).content_translate})
-                elif isinstance(configurator, (VADCInstanceConfigurator, VXPeerSyncConfigurator)) and not vx_device:
-                    continue
-                elif isinstance(configurator, (SystemTimeDateConfigurator, SpanningTreeConfigurator, LLDPConfigurator,
-                                               LACPAggregationConfigurator)) and not container_device:
-                    continue
-                elif isinstance(configurator, (SystemDNSClientConfigurator, BOOTPRelayConfigurator,
-                                               ConfigurationSyncConfigurator, HighAvailabilityConfigurator,
-                                               GlobalRedirectionConfigurator)) and vx_device:
+            if fact_key in skipped:
+                continue
+            if read_kind != READ_CONFIG:
+                beans_var_name = STATE_BEANS_VAR_NAME if read_kind == READ_STATE else STATS_BEANS_VAR_NAME
+                if not hasattr(configurator, beans_var_name):
+                    skipped.add(fact_key)
                     continue
-                else:
-                    result.update({key: cfg_mng.execute(configurator,
-                                                        DeviceConfigurator.READ_ALL, None).content_translate})
-            _collect_state_stats()
+                for bean_class, bean_filter in (getattr(configurator, beans_var_name) or {}).items():
+                    reads.append((fact_key, bean_class, bean_filter))
+                    calls.append((self._connection.rest.read_all, bean_class()))
+            # check if configurator type is SSLCertConfigurator
+            elif isinstance(configurator, SSLCertConfigurator) and not vx_device:
+                reads.append((fact_key, None, None))
+                calls.append((cfg_mng.execute, configurator, 'read_all_cert_info', None))
+            elif isinstance(configurator, SSLKeyConfigurator) and not vx_device:  # check if configurator type is SSLKeyConfigurator
+                reads.append((fact_key, None, None))
+                calls.append((cfg_mng.execute, configurator, 'read_all_key_info', None))
+            else:
+                reads.append((fact_key, None, None))
+                calls.append((cfg_mng.execute, configurator, DeviceConfigurator.READ_ALL, None))
+
+        # facts are returned in the configurators order whatever the order they were read in
+        read_kinds = dict((fact_key, read_kind) for fact_key, _, read_kind in plan.reads)
+        for fact_key in plan.facts:
+            if fact_key in read_kinds and fact_key not in skipped:
+                result.update({fact_key: None if read_kinds[fact_key] == READ_CONFIG else {}})
+
+        for (fact_key, bean_class, bean_filter), read_result in zip(reads, self._connection.engine.run_all(calls)):
+            if bean_class is None:
+                result.update({fact_key: read_result.content_translate})
+            elif read_result:
+                result[fact_key].update({bean_class.__name__: _translate_filter_bean(read_result, bean_filter)})
         return result
 
-    def filter_excluded_facts(self):
-        exclude = [x[1:] for x in self._facts if x[0] == '!']
-        include = [x for x in self._facts if x[0] != '!']
-        fact_to_collect = [x for x in include if x not in exclude]
-        return fact_to_collect, exclude
-
 
 def main():
     spec = ArgumentSpecs()
-    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode,
+                           required_one_of=spec.required_one_of)
 
     mm = None
     try:
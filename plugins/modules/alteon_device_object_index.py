@@ -0,0 +1,150 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_device_object_index
+short_description: Gather the Alteon object name index
+description:
+  - Read the index and name of the Alteon objects referenced by other objects, such as server groups, real servers,
+    health checks, SSL policies and certificates, HTTP modification policies, network classes and AppShape++ scripts.
+  - All the tables are read once and concurrently, the result is set as the C(alteon_object_index) host fact so the
+    index is built once per host and play.
+  - Pass the fact to the C(object_index) option of configuration modules to check references and resolve object names
+    to their index locally, or to the M(radware.radware_alteon.alteon_object_index) lookup.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  kinds:
+    description:
+      - Object kinds to index, all kinds when not provided.
+    required: false
+    type: list
+    elements: str
+    choices:
+    - server_group
+    - server
+    - virtual_server
+    - ssl_policy
+    - ssl_cert
+    - ssl_cert_group
+    - http_mod_policy
+    - network_class
+    - appshape
+    - health_check
+extends_documentation_fragment:
+  - radware.radware_alteon.alteon_options_doc_fragment
+'''
+
+EXAMPLES = r'''
+- name: alteon object index
+  radware.radware_alteon.alteon_device_object_index:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+  when: alteon_object_index is not defined
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_virtual_service:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    object_index: "{{ alteon_object_index }}"
+    state: present
+    parameters:
+      index: virt_test
+      service_index: 1
+      service_port: 443
+      server_group_name: web_servers
+      ssl_policy_name: ssl_pol
+'''
+
+RETURN = r'''
+ansible_facts:
+  description: Alteon object name index
+  returned: success
+  type: complex
+  contains:
+    alteon_object_index:
+      description: Object name per object index, per object kind. Kinds not supported by the device are omitted.
+      returned: success
+      type: dict
+      sample:
+        server_group: {"10": "web_servers", "11": null}
+        server: {"1": "web1", "2": "web2"}
+        health_check: {"icmp": "ICMP", "tcp": "TCP", "hc_web": "web"}
+table_reads:
+  description: Number of device tables read
+  returned: success
+  type: int
+  sample: 13
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, radware_server_argument_spec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonAnsibleModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.object_index import read_objects, object_tables, \
+    OBJECT_INDEX_FACTS, OBJECT_KINDS
+try:
+    from radware.sdk.exceptions import RadwareError
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'provider': {'type': 'dict', 'required': True},
+                       'kinds': {'required': False, 'type': 'list', 'elements': 'str'}}
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False, supports_check_mode=True)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+
+class ArgumentSpecs(object):
+    def __init__(self):
+        self.supports_check_mode = True
+        self.argument_spec = {'kinds': {"required": False, "type": 'list', "elements": 'str', "choices": OBJECT_KINDS}}
+        self.argument_spec.update(radware_server_argument_spec)
+
+
+class ModuleManager(AlteonAnsibleModule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def exec_module(self):
+        kinds = self.params.get('kinds') or OBJECT_KINDS
+        tables = object_tables()
+        try:
+            objects = read_objects(self._connection, kinds)
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+        return dict(changed=False, ansible_facts={OBJECT_INDEX_FACTS: objects},
+                    table_reads=sum(len(tables[kind]) for kind in kinds))
+
+
+def main():
+    spec = ArgumentSpecs()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
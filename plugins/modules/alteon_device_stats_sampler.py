@@ -0,0 +1,283 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_device_stats_sampler
+short_description: Sample statistics counters from Alteon device
+description:
+  - Read the selected statistics tables of Alteon device at a fixed interval, over a single device connection.
+  - For every numeric counter of every table entry, per second rates between samples and min/avg/max of the
+    sampled values are computed on the managed side.
+  - Samples are returned as compact value arrays, or written as NDJSON lines to I(dest).
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  stats:
+    description:
+      - Statistics subsets to sample.
+    required: true
+    type: list
+    elements: str
+    choices:
+    - real_server
+    - server_group
+    - virtual_server
+    - virtual_service
+    - physical_port
+  samples:
+    description:
+      - Number of samples to read.
+    required: false
+    default: 2
+    type: int
+  interval:
+    description:
+      - Seconds between the start of consecutive samples.
+    required: false
+    default: 10
+    type: int
+  counters:
+    description:
+      - Counters to sample, all counters of the selected tables are sampled when not provided.
+    required: false
+    type: list
+    elements: str
+  dest:
+    description:
+      - Path of a file to append the samples to, one NDJSON line per sample and table.
+      - When provided, the returned result contains the computed rates and min/avg/max only.
+    required: false
+    type: path
+extends_documentation_fragment: radware.radware_alteon.alteon_options_doc_fragment
+'''
+
+EXAMPLES = r'''
+- name: alteon stats sampling
+  radware.radware_alteon.alteon_device_stats_sampler:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    stats:
+      - real_server
+      - virtual_service
+    counters:
+      - CurrSessions
+      - TotalSessions
+      - HCOctets
+    samples: 6
+    interval: 10
+'''
+
+RETURN = r'''
+stats_obj:
+  description: Sampled statistics per subset, table and table entry index
+  returned: success
+  type: dict
+  sample:
+    timestamps: [1700000000.0, 1700000010.0, 1700000020.0]
+    real_server:
+      SlbStatEnhRServerTable:
+        "1":
+          CurrSessions:
+            values: [120, 131, 118]
+            rate: [1.1, -1.3]
+            min: 118
+            avg: 123.0
+            max: 131
+          TotalSessions:
+            values: [5000, 5180, 5330]
+            rate: [18.0, 15.0]
+            min: 5000
+            avg: 5170.0
+            max: 5330
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import json
+import time
+import traceback
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError, radware_server_argument_spec
+from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonAnsibleModule
+try:
+    from radware.sdk.exceptions import RadwareError
+    from radware.alteon.beans.SlbStatEnhRServerTable import SlbStatEnhRServerTable
+    from radware.alteon.beans.SlbStatEnhGroupTable import SlbStatEnhGroupTable
+    from radware.alteon.beans.SlbStatEnhVServerTable import SlbStatEnhVServerTable
+    from radware.alteon.beans.SlbEnhStatVirtServiceTable import SlbEnhStatVirtServiceTable
+    from radware.alteon.beans.PortStatsTable import PortStatsTable
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'stats': {'type': 'list', 'elements': 'str', 'required': True},
+                       'samples': {'type': 'int', 'required': False, 'default': 2},
+                       'interval': {'type': 'int', 'required': False, 'default': 10},
+                       'counters': {'type': 'list', 'elements': 'str', 'required': False},
+                       'dest': {'type': 'path', 'required': False},
+                       'provider': {'type': 'dict', 'required': True}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False, supports_check_mode=True)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+STATS_SUBSETS = ['real_server', 'server_group', 'virtual_server', 'virtual_service', 'physical_port']
+TIMESTAMPS_KEY = 'timestamps'
+
+
+def stats_beans():
+    return dict(real_server=SlbStatEnhRServerTable,
+                server_group=SlbStatEnhGroupTable,
+                virtual_server=SlbStatEnhVServerTable,
+                virtual_service=SlbEnhStatVirtServiceTable,
+                physical_port=PortStatsTable)
+
+
+class ArgumentSpecs(object):
+    def __init__(self):
+        self.supports_check_mode = True
+        self.argument_spec = {"stats": {"required": True, "type": "list", "elements": "str", "choices": STATS_SUBSETS},
+                              "samples": {"required": False, "type": "int", "default": 2},
+                              "interval": {"required": False, "type": "int", "default": 10},
+                              "counters": {"required": False, "type": "list", "elements": "str"},
+                              "dest": {"required": False, "type": "path"}}
+        self.argument_spec.update(radware_server_argument_spec)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class StatsSeries(object):
+    """
+    sampled values of one table, kept as per entry / per counter arrays so a sample costs one table read
+    and one append per counter
+    """
+    def __init__(self, index_names, counters=None):
+        self._index_names = index_names
+        self._counters = set(counters) if counters else None
+        self.entries = {}
+
+    def _entry_key(self, row):
+        return '.'.join(str(row.get(idx)) for idx in self._index_names)
+
+    def rows(self, rows):
+        result = {}
+        for row in rows or []:
+            result[self._entry_key(row)] = dict((k, v) for k, v in row.items() if k not in self._index_names and
+                                                (self._counters is None or k in self._counters))
+        return result
+
+    def add(self, sample_idx, rows):
+        for key, counters in rows.items():
+            entry = self.entries.setdefault(key, {})
+            for counter, value in counters.items():
+                values = entry.get(counter)
+                if values is None:
+                    # entries created after the first sample are padded to keep arrays aligned with timestamps
+                    values = entry[counter] = [None] * sample_idx
+                values.append(value)
+        for entry in self.entries.values():
+            for values in entry.values():
+                if len(values) <= sample_idx:
+                    values.append(None)
+
+    def summary(self, timestamps, with_values=True):
+        result = {}
+        for key, entry in self.entries.items():
+            entry_result = result[key] = {}
+            for counter, values in entry.items():
+                numbers = [v for v in values if _is_number(v)]
+                if not numbers:
+                    if with_values:
+                        entry_result[counter] = dict(values=values)
+                    continue
+                rate = []
+                for idx in range(1, len(values)):
+                    prev, curr = values[idx - 1], values[idx]
+                    elapsed = timestamps[idx] - timestamps[idx - 1]
+                    if _is_number(prev) and _is_number(curr) and elapsed > 0:
+                        rate.append(round((curr - prev) / elapsed, 3))
+                    else:
+                        rate.append(None)
+                counter_result = dict(rate=rate, min=min(numbers), avg=round(sum(numbers) / len(numbers), 3),
+                                      max=max(numbers))
+                if with_values:
+                    counter_result.update(values=values)
+                entry_result[counter] = counter_result
+        return result
+
+
+class ModuleManager(AlteonAnsibleModule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._stats = self.params['stats']
+        self._samples = max(1, self.params['samples'])
+        self._interval = max(0, self.params['interval'])
+        self._counters = self.params.get('counters')
+        self._dest = self.params.get('dest')
+
+    def _read_rows(self, bean_class):
+        return self._connection.rest.read_all_no_translation(bean_class()) or []
+
+    def exec_module(self):
+        beans = stats_beans()
+        series = {}
+        for key in self._stats:
+            bean_class = beans[key]
+            series[key] = (bean_class, StatsSeries(bean_class.get_index_names(), self._counters))
+
+        timestamps = []
+        dest_file = None
+        try:
+            if self._dest:
+                dest_file = open(self._dest, 'a')
+            start = time.time()
+            for sample_idx in range(self._samples):
+                if sample_idx:
+                    # fixed rate schedule, a slow sample shortens the next wait instead of shifting all samples
+                    time.sleep(max(0, start + sample_idx * self._interval - time.time()))
+                timestamp = round(time.time(), 3)
+                timestamps.append(timestamp)
+                for key, (bean_class, bean_series) in series.items():
+                    rows = bean_series.rows(self._read_rows(bean_class))
+                    bean_series.add(sample_idx, rows)
+                    if dest_file:
+                        dest_file.write(json.dumps(dict(timestamp=timestamp, server=self._connection.id, stats=key,
+                                                        table=bean_class.__name__, entries=rows)) + '\n')
+        except RadwareError as e:
+            raise RadwareModuleError(e) from e
+        except IOError as e:
+            raise RadwareModuleError(f'unable to write samples to {self._dest}: {e}') from e
+        finally:
+            if dest_file:
+                dest_file.close()
+
+        result = {TIMESTAMPS_KEY: timestamps}
+        for key, (bean_class, bean_series) in series.items():
+            result[key] = {bean_class.__name__: bean_series.summary(timestamps, with_values=not self._dest)}
+        return dict(changed=False, stats_obj=result)
+
+
+def main():
+    spec = ArgumentSpecs()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
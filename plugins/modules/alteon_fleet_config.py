@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_fleet_config
+author:
+  - Leon Meguira (@leonmeguira)
+short_description: apply an alteon_config module configuration to many Radware Alteon devices
+description:
+  - Run the configurator of a single C(alteon_config_*) module, or a bulk module such as
+    M(radware.radware_alteon.alteon_config_gslb_bulk), against a list of Radware Alteon devices.
+  - The task runs in the controller process through an action plugin. Devices are configured concurrently by a
+    thread pool, each device over its own REST connection.
+  - Results are reported per device. A failure on one device does not stop the others, the task fails when any
+    device failed.
+version_added: '1.2.0'
+options:
+  module:
+    description:
+      - Name of the C(alteon_config_*) module to run, e.g. C(alteon_config_system_alerts).
+      - Modules driven by a single configurator and bulk modules are supported.
+    required: true
+    type: str
+  devices:
+    description:
+      - Radware Alteon devices connection details, one entry per device.
+      - Every entry accepts the I(provider) suboptions and overrides the shared I(provider) values.
+      - An entry may also set I(snapshot) or I(snapshot_src), as accepted by the C(alteon_config_*) modules,
+        to evaluate check mode against the device configuration snapshot instead of the device. Not supported
+        with bulk modules.
+      - An entry may also set I(expected_fingerprint), the fingerprint of the object returned by an earlier C(read)
+        task on the device, the device is not written when the object changed since it was read. Not supported with
+        bulk modules.
+    required: true
+    type: list
+    elements: dict
+  provider:
+    description:
+      - Connection details shared by all devices, e.g. I(user), I(password) and I(validate_certs).
+    required: false
+    default: {}
+    type: dict
+  parameters:
+    description:
+      - Parameters of the C(alteon_config_*) module, validated against its arguments.
+      - For bulk modules, the module options other than I(provider), I(state) and I(revert_on_error), e.g. the
+        sections of M(radware.radware_alteon.alteon_config_gslb_bulk).
+    required: false
+    type: dict
+  state:
+    description:
+      - State of the C(alteon_config_*) module, see the module documentation for the supported states.
+    required: true
+    type: str
+  write_on_change:
+    description:
+      - Executes Alteon write calls only when an actual change has been evaluated.
+      - Ignored with bulk modules.
+    required: false
+    default: false
+    type: bool
+  revert_on_error:
+    description:
+      - If an error occurs, perform revert on the failed device.
+    required: false
+    default: false
+    type: bool
+  revert_scope:
+    description:
+      - Scope of the revert performed when I(revert_on_error=true).
+      - When C(device), all the pending configuration of the failed device is reverted.
+      - When C(session), only the objects written by the task are restored on the failed device.
+      - Ignored with bulk modules.
+    required: false
+    default: device
+    type: str
+    choices:
+    - device
+    - session
+  forks:
+    description:
+      - Maximum number of devices configured concurrently.
+    required: false
+    default: 10
+    type: int
+notes:
+  - Requires the Radware alteon-sdk Python package on the controller. This is as easy as
+      C(pip3 install alteon-sdk)
+requirements:
+  - alteon-sdk
+'''
+
+EXAMPLES = r'''
+- name: alteon fleet configuration
+  radware.radware_alteon.alteon_fleet_config:
+    module: alteon_config_snmp_general
+    provider:
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    devices:
+      - server: 192.168.1.1
+      - server: 192.168.1.2
+      - server: 192.168.1.3
+    forks: 20
+    state: present
+    parameters:
+      snmp_access: enabled
+      sys_location: DC1
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 3 of 3 devices changed
+devices:
+  description: Per device result, as returned by the C(alteon_config_*) module
+  returned: always
+  type: list
+  sample: [{"server": "192.168.1.1", "changed": true, "status": "Configuration Updated", "obj": {}}]
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.fleet import FleetConfigurationRunner, \
+    fleet_argument_spec
+try:
+    import radware.alteon  # noqa: F401
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module = AnsibleModule(argument_spec=fleet_argument_spec, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+
+def main():
+    module = AnsibleModule(argument_spec=fleet_argument_spec, supports_check_mode=True)
+
+    try:
+        runner = FleetConfigurationRunner(module.params, check_mode=module.check_mode, diff=module._diff)
+        result = runner.run()
+        if result.get('failed'):
+            module.fail_json(**result)
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
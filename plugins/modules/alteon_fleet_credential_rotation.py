@@ -0,0 +1,604 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_fleet_credential_rotation
+author:
+  - Leon Meguira (@leonmeguira)
+short_description: rotate local user, TACACS+ and RADIUS secrets of many Radware Alteon devices
+description:
+  - Rotate the local users, predefined local users, TACACS+ and RADIUS secrets of a list of Radware Alteon devices.
+  - Secrets cannot be read back from the device. A salted fingerprint of every secret pushed to a device is kept on
+    the controller, secrets matching the fingerprint of the last pushed secret are skipped.
+  - The task runs in the controller process through an action plugin. Devices are rotated concurrently by a
+    thread pool, each device over its own REST connection.
+  - Rotated secrets are applied and verified by logging in with the new credential. Fingerprints are recorded only
+    for verified devices, a failed device is rotated again by the next run.
+version_added: '1.2.0'
+options:
+  devices:
+    description:
+      - Radware Alteon devices connection details, one entry per device.
+      - Every entry accepts the I(provider) suboptions and overrides the shared I(provider) values.
+    required: true
+    type: list
+    elements: dict
+  provider:
+    description:
+      - Connection details shared by all devices, e.g. I(user), I(password) and I(validate_certs).
+    required: false
+    default: {}
+    type: dict
+  forks:
+    description:
+      - Maximum number of devices rotated concurrently.
+    required: false
+    default: 10
+    type: int
+  fingerprint_store:
+    description:
+      - Controller file holding the fingerprints of the secrets last pushed to every device.
+      - Only PBKDF2 digests with a random salt per secret are stored.
+    required: false
+    default: ~/.ansible/radware_alteon/credential_fingerprints.json
+    type: path
+  force:
+    description:
+      - Push all provided secrets, ignoring the stored fingerprints, e.g. after a secret was changed on the device
+        outside of this module.
+    required: false
+    default: false
+    type: bool
+  apply:
+    description:
+      - Apply the device configuration once the secrets are written.
+      - Rotated secrets are verified only when applied.
+      - Fingerprints are recorded only for applied secrets. With C(false), the secrets stay in the pending
+        configuration and are written again by the next run, until a run applies them.
+    required: false
+    default: true
+    type: bool
+  save:
+    description:
+      - Save the applied device configuration.
+    required: false
+    default: false
+    type: bool
+  verify:
+    description:
+      - Verify the rotated local user and administrator passwords by logging in with them.
+    required: false
+    default: true
+    type: bool
+  auth_probe:
+    description:
+      - Credential of a TACACS+ or RADIUS user, logged in to verify rotated TACACS+ and RADIUS secrets.
+    required: false
+    type: dict
+    suboptions:
+      user:
+        description:
+          - User name.
+        required: true
+        type: str
+      password:
+        description:
+          - User password.
+        required: true
+        type: str
+  tacacs_auth:
+    description:
+      - TACACS+ authentication secrets and the parameters written with them.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_system_tacacs_auth).
+      - I(primary_secret) and I(secondary_secret) are rotated.
+      - Other parameters are written only when a secret of the object is rotated.
+    required: false
+    type: dict
+    suboptions:
+      state:
+        description:
+          - Specifies whether to enable TACACS+ authentication.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      port:
+        description:
+          - The TACACS+ port number.
+        required: false
+        default: 49
+        type: int
+      primary_ip4_address:
+        description:
+          - The IP address of the primary TACACS+ server.
+        required: false
+        default: null
+        type: str
+      secondary_ip4_address:
+        description:
+          - The IP address of the secondary TACACS+ server.
+        required: false
+        default: null
+        type: str
+      primary_ip6_address:
+        description:
+          - The IP address of the primary TACACS+ server.
+        required: false
+        default: null
+        type: str
+      secondary_ip6_address:
+        description:
+          - The IP address of the secondary TACACS+ server.
+        required: false
+        default: null
+        type: str
+      timeout_second:
+        description:
+          - The time, in seconds, before re-sending an authentication to the TACACS+ server after receiving no answer.
+        required: false
+        default: null
+        type: int
+      retries:
+        description:
+          - Number of retries to the TACACS+ server.
+        required: false
+        default: null
+        type: int
+      primary_secret:
+        description:
+          - The TACACS+ authentication string.
+        required: false
+        default: null
+        type: str
+      secondary_secret:
+        description:
+          - The secondary TACACS+ authentication string.
+        required: false
+        default: null
+        type: str
+      local_user_priority:
+        description:
+          - Specifies that Alteon should first search for the user in the Local User Table, and only if not
+            found/authenticated there to connect to the remote authentication server.
+        required: false
+        default: disabled
+        choices:
+        - localFirst
+        - disabled
+      local_user_fallback:
+        description:
+          - Specifies whether to enable TACACS+ secure backdoor for Telnet.
+        required: false
+        default: disabled
+        choices:
+        - localFirst
+        - disabled
+      command_authorization:
+        description:
+          - Specifies whether to enable TACACS+ command authorization.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      command_logging:
+        description:
+          - Specifies whether to enable TACACS+ command logging.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      privilege_level_mapping:
+        description:
+          - Specifies whether to enable TACACS+ new privilege level mapping.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      command_logging_type:
+        description:
+          - Specifies command logging type.
+        required: false
+        default: null
+        choices:
+        - admin
+        - accounting
+      otp:
+        description:
+          - Enable/Disable OTP.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+  radius_auth:
+    description:
+      - RADIUS authentication secrets and the parameters written with them.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_system_radius_auth).
+      - I(primary_secret) and I(secondary_secret) are rotated.
+      - Other parameters are written only when a secret of the object is rotated.
+    required: false
+    type: dict
+    suboptions:
+      state:
+        description:
+          - Specifies whether to enable RADIUS authentication.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      port:
+        description:
+          - The RADIUS port number.
+        required: false
+        default: 1645
+        type: int
+      primary_ip4_address:
+        description:
+          - The address of the primary RADIUS server.
+        required: false
+        default: null
+        type: str
+      secondary_ip4_address:
+        description:
+          - The IP version of the address of the secondary RADIUS server.
+        required: false
+        default: null
+        type: str
+      primary_ip6_address:
+        description:
+          - The IP version of the address of the primary RADIUS server.
+        required: false
+        default: null
+        type: str
+      secondary_ip6_address:
+        description:
+          - The address of the secondary RADIUS server.
+        required: false
+        default: null
+        type: str
+      timeout_second:
+        description:
+          - The time, in seconds, before re-sending an authentication to the RADIUS server after receiving no answer.
+        required: false
+        default: null
+        type: int
+      retries:
+        description:
+          - Number of retries to the RADIUS server.
+        required: false
+        default: null
+        type: int
+      primary_secret:
+        description:
+          - The RADIUS authentication string.
+        required: false
+        default: null
+        type: str
+      secondary_secret:
+        description:
+          - The secondary RADIUS authentication string.
+        required: false
+        default: null
+        type: str
+      local_user_priority:
+        description:
+          - Specifies that Alteon should first search for the user in the Local User Table, and only if not
+            found/authenticated there to connect to the remote authentication server.
+        required: false
+        default: disabled
+        choices:
+        - localFirst
+        - disabled
+      local_user_fallback:
+        description:
+          - Specifies whether to enable RADIUS secure backdoor for Telnet.
+        required: false
+        default: disabled
+        choices:
+        - localFirst
+        - disabled
+      otp:
+        description:
+          - Enable/disable RADIUS Server OTP configuration
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+  local_users:
+    description:
+      - Local users secrets and the parameters written with them.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_system_local_user).
+      - I(user_password) is rotated and verified by a login of I(user_name), unless the user is disabled.
+      - I(admin_password) authorizes the change, defaults to the provider password.
+      - Other parameters are written only when a secret of the object is rotated.
+    required: false
+    default: []
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - The user identifier.
+        required: true
+        default: null
+        type: int
+      user_role:
+        description:
+          - The user class of service.
+        required: false
+        default: user
+        choices:
+        - user
+        - crtadmin
+        - slboper
+        - l4oper
+        - oper
+        - slbadmin
+        - l4admin
+        - admin
+        - slbview
+        - l3oper
+        - l3admin
+        - l1oper
+        - l2oper
+        - wsadmin
+        - wsowner
+        - wsview
+      user_name:
+        description:
+          - The username for the local user.
+        required: false
+        default: null
+        type: str
+      state:
+        description:
+          - Specifies whether to enable the user.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      admin_password:
+        description:
+          - The character string representing the current administrator password.
+        required: false
+        default: null
+        type: str
+      user_password:
+        description:
+          - The character string representing the user password.
+        required: false
+        default: null
+        type: str
+      radius_tacacs_fallback:
+        description:
+          - Specifies whether to enable back-door administrator access.
+          - When back-door administrator access is enabled, the user can log in to Telnet/SSH/Web UI using administrator
+            credentials when the TACACS+ server is down.
+        required: false
+        default: null
+        choices:
+        - enabled
+        - disabled
+      language_display:
+        description:
+          - Sets the Alteon Web Based Management (WBM) interface language for a local user.
+        required: false
+        default: english
+        choices:
+        - english
+        - chinese
+        - korean
+        - japanese
+      ssh_key:
+        description:
+          - user open-ssh txt public key or SSH2 public key.
+        required: false
+        default: null
+        type: str
+      certificate_management:
+        description:
+          - Enable/disable certificate management permissions.
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+  predefined_local_users:
+    description:
+      - Predefined local users secrets and the parameters written with them.
+      - Same format as the C(parameters) of M(radware.radware_alteon.alteon_config_system_predefined_local_users).
+      - The C(new_*_password) values are rotated, a new administrator password is verified by a login of C(admin).
+      - I(current_admin_password) authorizes the change, defaults to the provider password.
+      - Other parameters are written only when a secret of the object is rotated.
+    required: false
+    type: dict
+    suboptions:
+      current_admin_password:
+        description:
+          - The character string representing the current administrator password.
+        required: false
+        default: null
+        type: str
+      new_admin_password:
+        description:
+          - New user admin password.
+        required: false
+        default: null
+        type: str
+      new_l4_admin_password:
+        description:
+          - New user l4 admin password.
+        required: false
+        default: null
+        type: str
+      new_slb_admin_password:
+        description:
+          - New user slb admin password.
+        required: false
+        default: null
+        type: str
+      new_webapp_admin_password:
+        description:
+          - New user webapp admin password.
+        required: false
+        default: null
+        type: str
+      new_oper_password:
+        description:
+          - New user oper password.
+        required: false
+        default: null
+        type: str
+      new_l4_oper_password:
+        description:
+          - New user l4 oper password.
+        required: false
+        default: null
+        type: str
+      new_slb_viewer_password:
+        description:
+          - New user slb viewer password.
+        required: false
+        default: null
+        type: str
+      new_user_password:
+        description:
+          - New user user password.
+        required: false
+        default: null
+        type: str
+      global_language_display:
+        description:
+          - Sets the Alteon Web Based Management (WBM) interface language for a local user.
+        required: false
+        default: english
+        choices:
+        - english
+        - chinese
+        - korean
+        - japanese
+      user_lockout_state:
+        description:
+          - Globally enables user lockout upon authentication failure (when the user enters incorrect password).
+        required: false
+        default: disabled
+        choices:
+        - enabled
+        - disabled
+      user_lock_login_failed_attempts:
+        description:
+          - The number of failed login attempts (entering an incorrect password) during the lockout reset duration time, before user lockout.
+        required: false
+        default: 5
+        type: int
+      user_lockout_login_duration_minute:
+        description:
+          - The number of minutes that a user remains locked out due to failed login attempts (in minutes).
+        required: false
+        default: 10
+        type: int
+      user_lockout_login_reset_duration_minute:
+        description:
+          - The number of minutes within which failed login attempts must occur in order for the use to be locked out.
+        required: false
+        default: 10
+        type: int
+notes:
+  - Requires the Radware alteon-sdk Python package on the controller. This is as easy as
+      C(pip3 install alteon-sdk)
+  - Device writes, apply and save are taken under the device lock when the provider I(lock) is enabled.
+requirements:
+  - alteon-sdk
+'''
+
+EXAMPLES = r'''
+- name: alteon credential rotation
+  radware.radware_alteon.alteon_fleet_credential_rotation:
+    provider:
+      user: admin
+      password: "{{ alteon_admin_password }}"
+      validate_certs: false
+      https_port: 443
+      timeout: 5
+    devices:
+      - server: 192.168.1.1
+      - server: 192.168.1.2
+      - server: 192.168.1.3
+    forks: 20
+    save: true
+    local_users:
+      - index: 7
+        user_name: automation
+        user_password: "{{ automation_password }}"
+    tacacs_auth:
+      primary_secret: "{{ tacacs_secret }}"
+      secondary_secret: "{{ tacacs_secret }}"
+    auth_probe:
+      user: netops
+      password: "{{ netops_password }}"
+'''
+
+RETURN = r'''
+status:
+  description: Message detailing run result
+  returned: success
+  type: str
+  sample: 2 of 3 devices rotated
+devices:
+  description: Per device result, with the rotated, unapplied and skipped secrets and the verified logins
+  returned: always
+  type: list
+  sample: [{"server": "192.168.1.1", "changed": true, "rotated": ["local_users/7/user_password"],
+            "skipped": ["tacacs_auth/primary_secret", "tacacs_auth/secondary_secret"], "verified": ["automation"]}]
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.credentials import CredentialRotationRunner, \
+    CredentialRotationArgumentSpec
+try:
+    import radware.alteon  # noqa: F401
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'devices': {'type': 'list', 'elements': 'dict', 'required': True},
+                       'provider': {'type': 'dict', 'required': False, 'default': {}},
+                       'local_users': {'type': 'list', 'elements': 'dict', 'required': False, 'default': []},
+                       'predefined_local_users': {'type': 'dict', 'required': False},
+                       'tacacs_auth': {'type': 'dict', 'required': False},
+                       'radius_auth': {'type': 'dict', 'required': False}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+
+def main():
+    spec = CredentialRotationArgumentSpec()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode)
+
+    try:
+        runner = CredentialRotationRunner(module.params, check_mode=module.check_mode)
+        result = runner.run()
+        if result.get('failed'):
+            module.fail_json(**result)
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
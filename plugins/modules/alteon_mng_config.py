@@ -64,6 +64,96 @@ options:
           - Timeout for connection.
         required: true
         default: null
+      retries:
+        description:
+          - Maximum attempts of a device REST request failing on a transient error.
+        required: false
+        default: 3
+        type: int
+      retry_backoff:
+        description:
+          - Base delay in seconds between attempts, doubled on every attempt and randomized by a jitter.
+        required: false
+        default: 0.5
+        type: float
+      retry_max_backoff:
+        description:
+          - Maximum delay in seconds between attempts.
+        required: false
+        default: 10.0
+        type: float
+      retry_on_status:
+        description:
+          - HTTP statuses considered transient.
+          - Requests without a response, e.g. on timeout, are always retried.
+        required: false
+        default: [500, 502, 503, 504]
+        type: list
+        elements: int
+      lock:
+        description:
+          - Serialize configuration writes and apply, save and revert to the device among the tasks of this controller.
+          - Writers are served in arrival order through a queue directory per device.
+        required: false
+        default: false
+        type: bool
+      lock_section:
+        description:
+          - Configuration section guarded by the lock.
+          - Writers of different sections of one device run concurrently, C(device) waits for all sections.
+          - Apply, save and revert always lock the whole device.
+        required: false
+        default: device
+        type: str
+      lock_dir:
+        description:
+          - Directory holding the lock queues, shared by the writers of the controller.
+          - Defaults to a directory under the system temporary directory.
+        required: false
+        type: path
+      lock_timeout:
+        description:
+          - Maximum seconds waiting for the lock before failing.
+        required: false
+        default: 600
+        type: int
+      lock_lease:
+        description:
+          - Seconds after which a lock left by an interrupted writer is dropped.
+          - The lease applies to writers of other hosts sharing I(lock_dir), a writer of this host keeps its lock while
+            its process runs. The lock of a running writer is refreshed every third of the lease.
+        required: false
+        default: 900
+        type: int
+      ha_mode:
+        description:
+          - When C(primary), configuration is written to the HA master only. The master applies the changes and
+            syncs them to its peers, HA peers which are not the master are skipped.
+          - Devices which are not part of an HA pair are configured as with C(all).
+        required: false
+        default: all
+        type: str
+        choices:
+        - all
+        - primary
+      ha_peers:
+        description:
+          - Addresses of the HA peers of the master, sharing the master credentials.
+          - With I(ha_mode=primary), the objects written by the task are compared on every peer after the
+            config sync, by checksum of the object configuration.
+        required: false
+        type: list
+        elements: str
+      read_concurrency:
+        description:
+          - Maximum number of independent device reads run concurrently, e.g. the tables of the configured
+            object or the configurators and state tables gathered as facts.
+          - Reads share the keep-alive connections of the device, C(1) reads one table at a time.
+          - Concurrent reads need a keep-alive connection pool sized for them in the SDK REST client, reads run one
+            table at a time with a warning when the installed SDK does not allow it.
+        required: false
+        default: 1
+        type: int
   command:
     description:
       - Action to run.
@@ -127,6 +217,16 @@ pending:
   description: pending configuration state
   returned: diff, diff_flash
   type: bool
+ha:
+  description: HA role of the device, when not run on the HA master with provider I(ha_mode=primary)
+  returned: when skipped on an HA peer
+  type: dict
+  sample: {"role": "backup"}
+lock:
+  description: device lock wait and hold times in seconds, and the number of writers queued ahead
+  returned: when provider lock is enabled
+  type: dict
+  sample: {"server": "192.168.1.1", "section": "device", "waited": 4.2, "held": 1.3, "queued_behind": 2}
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -135,6 +235,8 @@ import traceback
 from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
 from ansible_collections.radware.radware_alteon.plugins.module_utils.alteon import AlteonManagementArgumentSpec, \
     AlteonManagementModule
+from ansible_collections.radware.radware_alteon.plugins.module_utils.device_lock import LOCK_SECTION_DEVICE
+from ansible_collections.radware.radware_alteon.plugins.module_utils.ha import MSG_HA_SKIPPED
 try:
     from radware.alteon.sdk.alteon_managment import AlteonMngConfig
 except ModuleNotFoundError:
@@ -147,12 +249,23 @@ except ModuleNotFoundError:
         module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False)
         module.fail_json(msg="The alteon-sdk package is required")
 
+READ_COMMANDS = ['diff', 'diff_flash', 'pending_configuration_validation']
+
 
 class ModuleManager(AlteonManagementModule):
     def __init__(self, **kwargs):
         super(ModuleManager, self).__init__(AlteonMngConfig, **kwargs)
 
     def exec_mng_config(self):
+        if self._command in READ_COMMANDS:
+            return self._exec_mng_config()
+        role = self.ha_skipped()
+        if role is not None:
+            return dict(changed=False, status=MSG_HA_SKIPPED, ha=dict(role=role))
+        # apply, save and revert act on the whole device, they wait for all configuration writers
+        return self.exec_locked(self._exec_mng_config, LOCK_SECTION_DEVICE)
+
+    def _exec_mng_config(self):
         changed = False
         if self._command in ['apply', 'commit'] and self._mng_instance.pending_apply():
             changed = True
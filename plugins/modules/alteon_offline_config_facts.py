@@ -0,0 +1,159 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2024, Radware LTD.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: alteon_offline_config_facts
+short_description: Parse a saved Alteon configuration into configuration modules parameters
+description:
+  - Parse an Alteon configuration text, as downloaded by M(radware.radware_alteon.alteon_device_configuration)
+    C(config_download), into the parameters of the C(alteon_config_*) modules.
+  - No device connection is used, saved configurations can be audited and compared locally.
+  - Supported configuration menus are real servers, server groups, virtual servers, virtual services including
+    their ssl and http menus, VLANs, IP interfaces and SSL policies.
+version_added: '1.2.0'
+author:
+  - Leon Meguira (@leonmeguira)
+options:
+  src:
+    description:
+      - Path to the configuration file.
+      - Mutually exclusive with I(content).
+    required: false
+    type: path
+  content:
+    description:
+      - Configuration text.
+      - Mutually exclusive with I(src).
+    required: false
+    type: str
+  configurators:
+    description:
+      - Configurators to return, all supported configurators are returned when not provided.
+    required: false
+    type: list
+    elements: str
+    choices:
+    - server
+    - server_group
+    - virtual_server
+    - virtual_service
+    - l2_vlan
+    - l3_interface
+    - ssl_policy
+notes:
+  - Requires the Radware alteon-sdk Python package on the host. This is as easy as
+      C(pip3 install alteon-sdk)
+  - Virtual services are numbered by their order under the virtual server, as listed in the configuration.
+requirements:
+  - alteon-sdk
+'''
+
+EXAMPLES = r'''
+- name: alteon offline configuration
+  radware.radware_alteon.alteon_offline_config_facts:
+    src: /backups/alteon1.cfg
+    configurators:
+      - server
+      - virtual_service
+  register: saved
+
+- name: alteon configuration command
+  radware.radware_alteon.alteon_config_server:
+    provider:
+      server: 192.168.1.1
+      user: admin
+      password: admin
+      validate_certs: false
+      https_port: 443
+      ssh_port: 22
+      timeout: 5
+    state: present
+    parameters: "{{ item }}"
+  loop: "{{ saved.config_obj.server }}"
+'''
+
+RETURN = r'''
+config_obj:
+  description: Parameters of the configuration entries per configurator
+  returned: success
+  type: dict
+  sample:
+    server: [{"index": "1", "state": "enabled", "ip_ver": "ipv4", "ip_address": "10.1.1.1", "name": "web1"}]
+    virtual_service: [{"index": "1", "service_index": 1, "service_port": 80, "application_type": "http",
+                       "server_group_name": "1", "server_port": 80}]
+unparsed_lines:
+  description: Line numbers of menus and commands not translated to parameters
+  returned: success
+  type: list
+  sample: [4, 5]
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.offline_config import OfflineConfig, \
+    OFFLINE_CONFIGURATORS
+try:
+    from radware.alteon.api.config import AlteonConfigurators  # noqa: F401
+except ModuleNotFoundError:
+    if __name__ == '__main__':
+        module_args = {'src': {'type': 'path', 'required': False},
+                       'content': {'type': 'str', 'required': False},
+                       'configurators': {'type': 'list', 'elements': 'str', 'required': False}
+                       }
+        module = AnsibleModule(argument_spec=module_args, check_invalid_arguments=False, supports_check_mode=True)
+        module.fail_json(msg="The alteon-sdk package is required")
+
+class ArgumentSpecs(object):
+    def __init__(self):
+        self.supports_check_mode = True
+        self.argument_spec = {"src": {"required": False, "type": "path"},
+                              "content": {"required": False, "type": "str"},
+                              "configurators": {"required": False, "type": "list", "elements": "str",
+                                                "choices": OFFLINE_CONFIGURATORS}}
+        self.mutually_exclusive = [['src', 'content']]
+        self.required_one_of = [['src', 'content']]
+
+
+class ModuleManager(object):
+    def __init__(self, **kwargs):
+        self.module = kwargs.get('module')
+        self.params = self.module.params
+
+    def _config_text(self):
+        if self.params.get('content') is not None:
+            return self.params['content']
+        try:
+            with open(self.params['src']) as config_file:
+                return config_file.read()
+        except IOError as e:
+            raise RadwareModuleError(f'unable to read configuration file {self.params["src"]}: {e}') from e
+
+    def exec_module(self):
+        model = OfflineConfig(self._config_text())
+        configurators = self.params.get('configurators') or OFFLINE_CONFIGURATORS
+        result = dict((key, model.entries(key)) for key in configurators)
+        return dict(changed=False, config_obj=result, unparsed_lines=model.unparsed)
+
+
+def main():
+    spec = ArgumentSpecs()
+    module = AnsibleModule(argument_spec=spec.argument_spec, supports_check_mode=spec.supports_check_mode,
+                           mutually_exclusive=spec.mutually_exclusive, required_one_of=spec.required_one_of)
+
+    try:
+        mm = ModuleManager(module=module)
+        result = mm.exec_module()
+        module.exit_json(**result)
+    except RadwareModuleError as e:
+        module.fail_json(msg=str(e), exception=traceback.format_exc())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+micro-benchmark of the check mode diff layer, 10k element lists by default
+the reference is the list.remove / append patching the configuration modules used before the keyed diff layer
+
+    python tests/units/benchmarks/bench_diff.py [--size 10000] [--repeat 3]
+
+the collection must be importable as ansible_collections.radware.radware_alteon, e.g. installed with
+ansible-galaxy or checked out under a collections path on PYTHONPATH
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import copy
+import time
+from ansible_collections.radware.radware_alteon.plugins.module_utils.diff import patch_configuration, \
+    DIFF_APPEND_KEY, DIFF_REMOVE_KEY
+
+IDENTITY = ('name', 'network_type')
+
+
+def reference_patch_configuration(current, changes):
+    for key, value in (changes.get(DIFF_REMOVE_KEY) or {}).items():
+        if key in current:
+            if type(value) == list:
+                for item in value:
+                    current[key].remove(item)
+            else:
+                del current[key]
+    for key, value in (changes.get(DIFF_APPEND_KEY) or {}).items():
+        if type(value) == list:
+            if type(current.get(key)) != list:
+                current[key] = []
+            for item in value:
+                current[key].append(item)
+        else:
+            current[key] = value
+    return current
+
+
+def workloads(size):
+    """
+    (name, current configuration, changes, identities), half of the list removed and as many items added
+    """
+    half = size // 2
+    entries = [dict(name=f'net{i}', network_type='address', ip=f'10.{i // 65536}.{i // 256 % 256}.{i % 256}',
+                    match='include') for i in range(size)]
+    added = [dict(name=f'new{i}', network_type='address', ip='192.168.0.1', match='include') for i in range(half)]
+    integers = list(range(size))
+    return [
+        ('keyed dict entries', dict(classes=entries),
+         {DIFF_REMOVE_KEY: dict(classes=entries[half:]), DIFF_APPEND_KEY: dict(classes=added)}, dict(classes=IDENTITY)),
+        ('unkeyed dict entries', dict(classes=entries),
+         {DIFF_REMOVE_KEY: dict(classes=entries[half:]), DIFF_APPEND_KEY: dict(classes=added)}, None),
+        ('integers', dict(ports=integers),
+         {DIFF_REMOVE_KEY: dict(ports=integers[half:]), DIFF_APPEND_KEY: dict(ports=list(range(size, size + half)))},
+         None),
+        ('duplicate keys', dict(classes=entries + entries),
+         {DIFF_REMOVE_KEY: dict(classes=entries[half:]), DIFF_APPEND_KEY: dict(classes=added)}, dict(classes=IDENTITY))
+    ]
+
+
+def measure(func, current, repeat):
+    best = None
+    for dummy in range(repeat):
+        data = copy.deepcopy(current)
+        start = time.perf_counter()
+        func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"workload":<22}{"reference":>12}{"keyed diff":>12}')
+    for name, current, changes, identities in workloads(args.size):
+        reference = measure(lambda data: reference_patch_configuration(data, changes), current, args.repeat)
+        keyed = measure(lambda data: patch_configuration(data, changes, identities), current, args.repeat)
+        print(f'{name:<22}{reference:>11.3f}s{keyed:>11.3f}s')
+
+
+if __name__ == '__main__':
+    main()
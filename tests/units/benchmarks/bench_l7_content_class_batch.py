@@ -0,0 +1,68 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+benchmark of alteon_config_l7_content_class_batch against the in-memory REST double, 5000 path rules by default
+the reference evaluates every entry with the SDK dry run, as done before the compiled entry matcher
+
+    python tests/units/benchmarks/bench_l7_content_class_batch.py [--rules 5000]
+
+the collection must be importable as ansible_collections.radware.radware_alteon, e.g. installed with
+ansible-galaxy or checked out under a collections path on PYTHONPATH
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import time
+from unittest import mock
+from ansible_collections.radware.radware_alteon.plugins.module_utils.bulk import CompiledEntryMatcher
+from ansible_collections.radware.radware_alteon.plugins.modules import alteon_config_l7_content_class_batch
+from ansible_collections.radware.radware_alteon.tests.units.device_double import FakeConnection, FakeModule, \
+    patch_device
+
+CONTENT_CLASS = dict(content_class_id='bench', name='bench', content_class_type='http', logical_expression=None)
+
+
+def paths(rules, changed=None):
+    return [dict(url_path_id=str(i), url_path=f'/app/{i}' if i != changed else f'/app/{i}/changed',
+                 match_type='equal', case_sensitive=None, data_class_id=None) for i in range(1, rules + 1)]
+
+
+def run(connection, entries, purge=False):
+    params = dict(provider={}, state='present', validate_references=True, revert_on_error=False, purge=purge,
+                  content_class=CONTENT_CLASS, hostnames=[], paths=entries, filenames=[], filetypes=[], headers=[],
+                  cookies=[])
+    connection.rest.calls = dict.fromkeys(connection.rest.calls, 0)
+    start = time.perf_counter()
+    with patch_device(connection):
+        result = alteon_config_l7_content_class_batch.ModuleManager(module=FakeModule(params)).exec_module()
+    return time.perf_counter() - start, result, dict(connection.rest.calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rules', type=int, default=5000)
+    args = parser.parse_args()
+
+    connection = FakeConnection()
+    runs = [('initial deploy', lambda: run(connection, paths(args.rules)))]
+    runs.append(('no change, reference', lambda: run(connection, paths(args.rules))))
+    runs.append(('no change', lambda: run(connection, paths(args.rules))))
+    runs.append(('one rule changed', lambda: run(connection, paths(args.rules, changed=args.rules // 2))))
+    runs.append(('one rule purged', lambda: run(connection, paths(args.rules - 1), purge=True)))
+
+    print(f'{"run":<24}{"elapsed":>10}{"changes":>9}{"reads":>7}{"writes":>8}')
+    for name, func in runs:
+        if name.endswith('reference'):
+            with mock.patch.object(CompiledEntryMatcher, 'matches', return_value=False):
+                elapsed, result, calls = func()
+        else:
+            elapsed, result, calls = func()
+        print(f'{name:<24}{elapsed:>9.3f}s{len(result["changes"]):>9}{calls["read_all"] + calls["read"]:>7}'
+              f'{calls["update"] + calls["delete"]:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+in-memory Alteon REST double shared by the unit tests and benchmarks
+rows are kept per bean class and keyed by their index attributes, reads return copies like the device does
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+from unittest import mock
+from radware.alteon.beans.Global import Root
+from radware.sdk.beans_common import READ_PROP
+from ansible_collections.radware.radware_alteon.plugins.module_utils import alteon
+
+
+class FakeRest(object):
+    def __init__(self):
+        self.tables = {}
+        self.root = Root()
+        self.calls = dict(read_all=0, read=0, update=0, delete=0)
+
+    @staticmethod
+    def _key(bean):
+        return tuple(str(getattr(bean, idx)) for idx in bean.get_index_names())
+
+    @staticmethod
+    def _match(query, bean):
+        for idx in query.get_index_names():
+            value = getattr(query, idx)
+            if value is not None and value != READ_PROP and str(getattr(bean, idx)) != str(value):
+                return False
+        return True
+
+    def add(self, bean):
+        self.tables.setdefault(type(bean), {})[self._key(bean)] = bean
+
+    def rows(self, bean_class):
+        return list(self.tables.get(bean_class, {}).values())
+
+    def _select(self, bean):
+        if isinstance(bean, Root):
+            return copy.deepcopy(self.root)
+        return [copy.deepcopy(row) for row in self.tables.get(type(bean), {}).values() if self._match(bean, row)]
+
+    def read_all(self, bean, retries=3, timeout=None):
+        self.calls['read_all'] += 1
+        return self._select(bean)
+
+    def read(self, bean, retries=3, timeout=None):
+        self.calls['read'] += 1
+        result = self._select(bean)
+        if isinstance(bean, Root):
+            return result
+        return result[0] if result else None
+
+    def read_all_no_translation(self, bean, retries=3):
+        return [dict(row.__dict__) for row in self.read_all(bean)]
+
+    def update(self, bean, retries=3, dry_run=False, timeout=None):
+        self.calls['update'] += 1
+        if dry_run:
+            return True
+        current = self.root if isinstance(bean, Root) else \
+            self.tables.setdefault(type(bean), {}).setdefault(self._key(bean), type(bean)())
+        for attr, value in bean.__dict__.items():
+            if value is not None and value != READ_PROP:
+                setattr(current, attr, value)
+        return True
+
+    def delete(self, bean, retries=3, dry_run=False):
+        self.calls['delete'] += 1
+        if not dry_run:
+            self.tables.get(type(bean), {}).pop(self._key(bean), None)
+        return True
+
+
+class FakeConnection(object):
+    def __init__(self, server='1.1.1.1'):
+        self.id = server
+        self.rest = FakeRest()
+
+
+class FakeModule(object):
+    def __init__(self, params, check_mode=False, diff=False):
+        self.params = params
+        self.check_mode = check_mode
+        self._diff = diff
+        self.warnings = []
+
+    def warn(self, warning):
+        self.warnings.append(warning)
+
+
+def patch_device(connection):
+    """
+    context manager routing the Alteon modules device connection to the double
+    """
+    patches = mock.patch.multiple(alteon, AlteonDeviceConnection=mock.Mock(return_value=connection),
+                                  AlteonManagement=mock.MagicMock())
+    return patches
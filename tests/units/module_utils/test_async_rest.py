@@ -0,0 +1,69 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.async_rest import AsyncDeviceAPI, \
+    AsyncDeviceConnection, DEFAULT_READ_CONCURRENCY
+from ansible_collections.radware.radware_alteon.tests.units.device_double import FakeConnection, FakeModule, \
+    FakeRest
+
+
+class FakePoolManager(object):
+    def __init__(self, maxsize=1):
+        self.connection_pool_kw = dict(maxsize=maxsize)
+        self.cleared = 0
+
+    def clear(self):
+        self.cleared += 1
+
+
+class FakeRestClient(object):
+    def __init__(self, pool_manager):
+        self.http = pool_manager
+
+
+def pooled_rest(pool_manager):
+    rest = FakeRest()
+    rest._rest_client = FakeRestClient(pool_manager)
+    return rest
+
+
+def test_default_reads_one_at_a_time():
+    assert DEFAULT_READ_CONCURRENCY == 1
+    pool_manager = FakePoolManager()
+    assert AsyncDeviceAPI(pooled_rest(pool_manager)).concurrency == 1
+    assert pool_manager.connection_pool_kw['maxsize'] == 1
+    assert pool_manager.cleared == 0
+
+
+def test_keep_alive_pool_sized_for_concurrency():
+    pool_manager = FakePoolManager()
+    engine = AsyncDeviceAPI(pooled_rest(pool_manager), 4)
+    assert engine.concurrency == 4
+    assert pool_manager.connection_pool_kw['maxsize'] == 4
+    assert pool_manager.cleared == 1
+    assert engine.run_all((pow, 2, n) for n in range(8)) == [2 ** n for n in range(8)]
+
+
+def test_larger_keep_alive_pool_kept():
+    pool_manager = FakePoolManager(maxsize=10)
+    assert AsyncDeviceAPI(pooled_rest(pool_manager), 4).concurrency == 4
+    assert pool_manager.connection_pool_kw['maxsize'] == 10
+    assert pool_manager.cleared == 0
+
+
+def test_missing_keep_alive_pool_warns_and_reads_one_at_a_time():
+    module = FakeModule({})
+    engine = AsyncDeviceAPI(FakeRest(), 4, module.warn)
+    assert engine.concurrency == 1
+    assert len(module.warnings) == 1
+    assert 'read_concurrency 4' in module.warnings[0]
+
+
+def test_connection_passes_warnings_to_the_engine():
+    module = FakeModule({})
+    async_connection = AsyncDeviceConnection.from_provider(FakeConnection(), dict(read_concurrency=2), module.warn)
+    assert async_connection.engine.concurrency == 1
+    assert len(module.warnings) == 1
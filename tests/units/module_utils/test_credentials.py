@@ -0,0 +1,55 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+from unittest import mock
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from radware.sdk.exceptions import RestRequestError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.credentials import CredentialRotationRunner, \
+    CredentialRotationArgumentSpec
+from ansible_collections.radware.radware_alteon.tests.units.device_double import FakeConnection, patch_device
+
+SECRETS = ['tacacs-new-secret', 'user-new-password', 'provider-password', 'probe-password']
+
+
+class FailedResponse(object):
+    def __init__(self, body):
+        self.status = 400
+        self.reason = 'Bad Request'
+        self.content = b'{"status": "err"}'
+        self.request = mock.Mock(url='https://1.1.1.1/config', method='PUT', body=body)
+
+
+def failing_connection():
+    connection = FakeConnection()
+
+    def update(bean, retries=3, dry_run=False, timeout=None):
+        if dry_run:
+            return True
+        raise RestRequestError(FailedResponse(json.dumps(dict((k, v) for k, v in bean.__dict__.items() if v))))
+    connection.rest.update = update
+    return connection
+
+
+def rotation_params(tmp_path):
+    params = dict(devices=[dict(server='1.1.1.1')], provider=dict(user='admin', password='provider-password'),
+                  fingerprint_store=str(tmp_path / 'fingerprints.json'),
+                  auth_probe=dict(user='probe', password='probe-password'),
+                  tacacs_auth=dict(primary_secret='tacacs-new-secret'),
+                  local_users=[dict(index=7, user_name='ops', user_password='user-new-password')])
+    return ArgumentSpecValidator(CredentialRotationArgumentSpec().argument_spec).validate(params).validated_parameters
+
+
+def test_failed_write_does_not_return_secrets(tmp_path):
+    with patch_device(failing_connection()):
+        result = CredentialRotationRunner(rotation_params(tmp_path)).run()
+    assert result['failed']
+    device = result['devices'][0]
+    assert device['failed']
+    assert 'Rest Request Error' in device['msg']
+    assert 'exception' not in device
+    text = json.dumps(result)
+    assert not [secret for secret in SECRETS if secret in text]
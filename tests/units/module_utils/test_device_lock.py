@@ -0,0 +1,48 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import time
+import pytest
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.device_lock import DeviceLock, Ticket
+
+
+def ticket_path(lock):
+    return os.path.join(lock._queue_dir, lock._ticket.name)
+
+
+def test_aged_ticket_of_live_holder_is_kept(tmp_path):
+    holder = DeviceLock('1.1.1.1', lock_dir=str(tmp_path), lease=1)
+    with holder:
+        path = ticket_path(holder)
+        os.utime(path, (time.time() - 3600, time.time() - 3600))
+        waiter = DeviceLock('1.1.1.1', lock_dir=str(tmp_path), timeout=0.5, lease=1, poll=0.05)
+        with pytest.raises(RadwareModuleError, match='timeout'):
+            waiter.acquire()
+        assert os.path.exists(path)
+    assert not os.listdir(os.path.join(str(tmp_path), '1_1_1_1'))
+
+
+def test_held_ticket_is_refreshed(tmp_path):
+    holder = DeviceLock('1.1.1.1', lock_dir=str(tmp_path), lease=0.3)
+    with holder:
+        path = ticket_path(holder)
+        os.utime(path, (time.time() - 3600, time.time() - 3600))
+        time.sleep(0.4)
+        assert os.path.getmtime(path) > time.time() - 0.3
+
+
+def test_expired_ticket_of_other_host_is_dropped(tmp_path):
+    queue_dir = tmp_path / '1_1_1_1'
+    queue_dir.mkdir()
+    enqueued, host, pid, nonce, section = Ticket.new_name('device').split('.')
+    other = queue_dir / '.'.join([enqueued, 'otherhost', pid, nonce, section])
+    other.write_text('')
+    os.utime(str(other), (time.time() - 3600, time.time() - 3600))
+    with DeviceLock('1.1.1.1', lock_dir=str(tmp_path), timeout=0.5, lease=60) as lock:
+        assert lock.metrics['queued_behind'] == 0
+    assert not other.exists()
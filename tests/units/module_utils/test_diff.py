@@ -0,0 +1,108 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.diff import patch_list, patch_configuration, \
+    item_key, DIFF_APPEND_KEY, DIFF_REMOVE_KEY
+
+IDENTITY = ('name', 'network_type')
+
+
+def entry(name, network_type='address', ip=None):
+    return dict(name=name, network_type=network_type, ip=ip)
+
+
+def test_item_key_identity_and_whole_item():
+    assert item_key(entry('a', ip='1.1.1.1'), IDENTITY) == item_key(entry('a', ip='2.2.2.2'), IDENTITY)
+    assert item_key(entry('a', ip='1.1.1.1')) != item_key(entry('a', ip='2.2.2.2'))
+    assert item_key(dict(a=[1, dict(b=2)])) == item_key(dict(a=[1, dict(b=2)]))
+
+
+def test_patch_list_keyed_remove_and_merge():
+    current = [entry('a', ip='1.1.1.1'), entry('b', ip='2.2.2.2'), entry('c', ip='3.3.3.3')]
+    result = patch_list(current, removed=[entry('b')], added=[dict(name='c', network_type='address', ip='9.9.9.9'),
+                                                             entry('d', ip='4.4.4.4')], identity=IDENTITY)
+    assert result == [entry('a', ip='1.1.1.1'), entry('c', ip='9.9.9.9'), entry('d', ip='4.4.4.4')]
+
+
+def test_patch_list_keyed_merge_keeps_unchanged_fields():
+    current = [dict(name='a', network_type='address', ip='1.1.1.1', mask='255.0.0.0')]
+    result = patch_list(current, added=[dict(name='a', network_type='address', ip='2.2.2.2')], identity=IDENTITY)
+    assert result == [dict(name='a', network_type='address', ip='2.2.2.2', mask='255.0.0.0')]
+
+
+def test_patch_list_keyed_identity_includes_every_field():
+    current = [entry('a', 'address', '1.1.1.1')]
+    result = patch_list(current, added=[entry('a', 'range', '1.1.1.1')], identity=IDENTITY)
+    assert result == [entry('a', 'address', '1.1.1.1'), entry('a', 'range', '1.1.1.1')]
+
+
+def test_patch_list_unkeyed():
+    result = patch_list([1, 2, 3, 4], removed=[2, 4], added=[5, 1])
+    assert result == [1, 3, 5, 1]
+
+
+def test_patch_list_unkeyed_removes_one_occurrence_per_item():
+    assert patch_list([7, 7, 8, 7], removed=[7, 7]) == [8, 7]
+    assert patch_list([dict(a=1), dict(a=1)], removed=[dict(a=1)]) == [dict(a=1)]
+
+
+def test_patch_list_duplicate_keys():
+    current = [entry('a', ip='1.1.1.1'), entry('a', ip='2.2.2.2'), entry('b')]
+    # one removed item drops one of the items sharing its identity
+    assert patch_list(current, removed=[entry('a')], identity=IDENTITY) == [entry('a', ip='2.2.2.2'), entry('b')]
+    # added items sharing an identity are merged into a single item
+    result = patch_list([], added=[entry('c', ip='1.1.1.1'), entry('c', ip='2.2.2.2')], identity=IDENTITY)
+    assert result == [entry('c', ip='2.2.2.2')]
+
+
+def test_patch_list_does_not_mutate_current():
+    current = [entry('a', ip='1.1.1.1')]
+    patch_list(current, removed=[entry('a')], added=[entry('b')], identity=IDENTITY)
+    patch_list(current, added=[entry('a', ip='2.2.2.2')], identity=IDENTITY)
+    assert current == [entry('a', ip='1.1.1.1')]
+
+
+def test_patch_list_without_changes_returns_current():
+    current = [1, 2]
+    assert patch_list(current) is current
+
+
+def test_patch_configuration_scalars():
+    current = dict(name='vs1', description='old', port=80)
+    changes = {DIFF_REMOVE_KEY: dict(description='old', missing='x'), DIFF_APPEND_KEY: dict(port=443, state='on')}
+    assert patch_configuration(current, changes) == dict(name='vs1', port=443, state='on')
+
+
+def test_patch_configuration_keyed_list():
+    current = dict(name='nc1', classes=[entry('a', ip='1.1.1.1'), entry('b', ip='2.2.2.2')])
+    changes = {DIFF_REMOVE_KEY: dict(classes=[entry('b', ip='2.2.2.2')]),
+               DIFF_APPEND_KEY: dict(classes=[entry('a', ip='5.5.5.5'), entry('c', ip='3.3.3.3')])}
+    result = patch_configuration(current, changes, dict(classes=IDENTITY))
+    assert result['classes'] == [entry('a', ip='5.5.5.5'), entry('c', ip='3.3.3.3')]
+
+
+def test_patch_configuration_unkeyed_list():
+    current = dict(sync_peers=['1.1.1.1', '2.2.2.2'])
+    changes = {DIFF_REMOVE_KEY: dict(sync_peers=['1.1.1.1']), DIFF_APPEND_KEY: dict(sync_peers=['3.3.3.3'])}
+    assert patch_configuration(current, changes)['sync_peers'] == ['2.2.2.2', '3.3.3.3']
+
+
+def test_patch_configuration_duplicate_keys():
+    current = dict(classes=[entry('a', ip='1.1.1.1'), entry('a', ip='1.1.1.1')])
+    changes = {DIFF_REMOVE_KEY: dict(classes=[entry('a', ip='1.1.1.1')])}
+    assert patch_configuration(current, changes, dict(classes=IDENTITY))['classes'] == [entry('a', ip='1.1.1.1')]
+
+
+def test_patch_configuration_list_added_to_missing_field():
+    current = dict(name='x', values=None)
+    assert patch_configuration(current, {DIFF_APPEND_KEY: dict(values=[1], other=[2])}) == \
+        dict(name='x', values=[1], other=[2])
+
+
+def test_patch_configuration_without_changes():
+    current = dict(name='x')
+    assert patch_configuration(current, None) is current
+    assert patch_configuration(current, {}) is current
@@ -0,0 +1,35 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.radware.radware_alteon.plugins.module_utils.facts import to_columnar, from_columnar, \
+    compress_facts, decompress_facts
+
+
+def test_to_columnar_parallel_arrays():
+    records = [dict(index='1', state='enabled'), dict(index='2', state='disabled')]
+    assert to_columnar(records) == dict(alteon_facts_format='columnar', fields=['index', 'state'],
+                                        values=[['1', '2'], ['enabled', 'disabled']], count=2)
+
+
+def test_to_columnar_missing_fields():
+    records = [dict(index='1', name='web'), dict(index='2'), dict(index='3', name=None)]
+    assert to_columnar(records) == dict(alteon_facts_format='columnar', fields=['index', 'name'],
+                                        values=[['1', '2', '3'], ['web', None, None]], count=3, missing=dict(name=[1]))
+
+
+@pytest.mark.parametrize('facts', [
+    dict(server=[dict(index='1', name='web'), dict(index='2'), dict(index='3', name=None)]),
+    dict(server=[{}, {}]),
+    dict(server=[dict(index='1', ports=[dict(port=80), dict(port=443, name='https')])], vlan=[], sys=dict(name='a')),
+    dict(server=[dict(index='1'), {}]),
+    dict(stats=dict(fields=['a'], values=[[1]], count=1), sessions=dict(count=3)),
+    dict(stats=[dict(fields=['a'], values=[[1]], count=1, missing={})]),
+])
+def test_columnar_round_trip(facts):
+    assert from_columnar(to_columnar(facts)) == facts
+    assert from_columnar(decompress_facts(compress_facts(to_columnar(facts)))) == facts
@@ -0,0 +1,25 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+from ansible_collections.radware.radware_alteon.plugins.module_utils.common import RadwareModuleError
+from ansible_collections.radware.radware_alteon.plugins.module_utils.facts_plan import profile_facts
+
+
+def test_user_profile_overrides_builtin():
+    assert profile_facts('slb', dict(slb=['server', 'server_state']), ['virtual_server']) == \
+        ('server', 'server_state', 'virtual_server')
+
+
+@pytest.mark.parametrize('facts', ['server', None, dict(server=True), ['server', 1]])
+def test_user_profile_must_be_a_list_of_fact_names(facts):
+    with pytest.raises(RadwareModuleError, match='facts profile mine must be a list of fact names'):
+        profile_facts('mine', dict(mine=facts))
+
+
+def test_user_profile_unknown_fact():
+    with pytest.raises(RadwareModuleError, match='unknown facts nope in profile mine'):
+        profile_facts(None, dict(mine=['server', 'nope']), ['server'])
@@ -0,0 +1,81 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from radware.alteon.sdk.configurators.server import ServerConfigurator, ServerParameters
+from radware.alteon.sdk.configurators.virtual_service import VirtualServiceConfigurator, VirtualServiceParameters
+from ansible_collections.radware.radware_alteon.plugins.module_utils.offline_config import OFFLINE_CONFIGURATORS
+from ansible_collections.radware.radware_alteon.plugins.module_utils.snapshot import SnapshotConfigurator, \
+    load_snapshot
+from ansible_collections.radware.radware_alteon.plugins.modules import alteon_config_server
+from ansible_collections.radware.radware_alteon.tests.units.device_double import FakeConnection, FakeModule, \
+    patch_device
+
+CONFIG = '''
+/c/slb/real 1
+\tena
+\trip 10.0.0.1
+/c/slb/virt 1
+\tena
+\tvip 10.0.1.1
+/c/slb/virt 1/service 443 https
+\tgroup 1
+\trport 443
+'''
+
+
+def snapshot_configurator(configurator_class, entries):
+    return SnapshotConfigurator(configurator_class(FakeConnection()), entries)
+
+
+def service(**values):
+    params = VirtualServiceParameters()
+    params.set_attributes(**values)
+    return params
+
+
+def test_load_snapshot_src_covers_offline_configurators(tmp_path):
+    snapshot_src = tmp_path / 'alteon.cfg'
+    snapshot_src.write_text(CONFIG)
+    snapshot = load_snapshot(snapshot_src=str(snapshot_src))
+    assert sorted(snapshot) == sorted(OFFLINE_CONFIGURATORS)
+    assert snapshot['l2_vlan'] == []
+    assert snapshot['server'] == [dict(index='1', state='enabled', ip_address='10.0.0.1')]
+
+
+def test_virtual_service_matched_by_port():
+    configurator = snapshot_configurator(VirtualServiceConfigurator, [
+        dict(index='1', service_index=1, service_port=443, server_group_name='1', server_port=443)])
+    result = configurator.read(service(index='1', service_index=3, service_port=443))
+    assert result.service_index == 3
+    assert result.server_group_name == '1'
+    assert configurator.read(service(index='1', service_index=1, service_port=80)) is None
+
+
+def test_virtual_service_matched_by_index_without_port():
+    configurator = snapshot_configurator(VirtualServiceConfigurator, [
+        dict(index='1', service_index=1, service_port=443)])
+    assert configurator.read(service(index='1', service_index=1)).service_port == 443
+    assert configurator.read(service(index='1', service_index=2)) is None
+
+
+def test_field_missing_from_snapshot_is_not_filled():
+    configurator = snapshot_configurator(ServerConfigurator, [dict(index='1', ip_address='10.0.0.1')])
+    requested = ServerParameters()
+    requested.set_attributes(index='1', ip_address='10.0.0.1', weight=5)
+    result = configurator.read(requested)
+    assert result.index == '1'
+    assert result.weight is None
+
+
+def test_field_missing_from_snapshot_is_reported_as_change():
+    snapshot = dict(server=[dict(index='1', ip_address='10.0.0.1')])
+    params = dict(provider=dict(server='1.1.1.1'), write_on_change=False, revert_on_error=False, snapshot=snapshot,
+                  state='present', parameters=dict(index='1', ip_address='10.0.0.1', weight=5))
+    with patch_device(FakeConnection()):
+        module = FakeModule(params, check_mode=True, diff=True)
+        result = alteon_config_server.ModuleManager(module=module).exec_module()
+    assert result['changed']
+    assert result['diff']['+++'] == dict(weight=5)
@@ -0,0 +1,104 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+from radware.alteon.beans.Layer7NewCfgContentClassPathTable import Layer7NewCfgContentClassPathTable
+from radware.alteon.sdk.configurators.l7_content_class_path import L7ContentClassPathConfigurator
+from radware.alteon.sdk.configurators.server_group import ServerGroupConfigurator
+from ansible_collections.radware.radware_alteon.plugins.module_utils.bulk import CompiledEntryMatcher, DeviceTableCache
+from ansible_collections.radware.radware_alteon.plugins.modules import alteon_config_l7_content_class_batch
+from ansible_collections.radware.radware_alteon.tests.units.device_double import FakeConnection, FakeModule, \
+    patch_device
+
+
+def content_class(class_id='c1'):
+    return dict(content_class_id=class_id, name=f'web_{class_id}', content_class_type='http', logical_expression=None)
+
+
+def path(path_id, url_path, match_type='equal'):
+    return dict(url_path_id=str(path_id), url_path=url_path, match_type=match_type, case_sensitive=None,
+                data_class_id=None)
+
+
+def run(connection, check_mode=False, **params):
+    module_params = dict(provider={}, state='present', validate_references=True, revert_on_error=False, purge=False,
+                         hostnames=[], paths=[], filenames=[], filetypes=[], headers=[], cookies=[])
+    module_params.update(params)
+    with patch_device(connection):
+        return alteon_config_l7_content_class_batch.ModuleManager(module=FakeModule(module_params, check_mode)) \
+            .exec_module()
+
+
+def device_paths(connection, class_id='c1'):
+    return sorted((row.ID, row.FilePath) for row in connection.rest.rows(Layer7NewCfgContentClassPathTable)
+                  if row.ContentClassID == class_id)
+
+
+@pytest.fixture
+def connection():
+    connection = FakeConnection()
+    run(connection, content_class=content_class('c1'), paths=[path(1, '/a'), path(2, '/b'), path(3, '/c')])
+    run(connection, content_class=content_class('c2'), paths=[path(1, '/other')])
+    return connection
+
+
+def test_matcher_compiles_flat_indexed_configurator(connection):
+    matcher = CompiledEntryMatcher(L7ContentClassPathConfigurator(connection))
+    assert matcher.supported
+    assert matcher.required == ['content_class_id', 'url_path_id']
+    assert matcher.key(dict(path(1, '/a'), content_class_id='c1')) == ('c1', '1')
+
+
+def test_matcher_unsupported_for_list_parameters(connection):
+    assert not CompiledEntryMatcher(ServerGroupConfigurator(connection)).supported
+
+
+def test_matcher_matches_cached_rows(connection):
+    matcher = CompiledEntryMatcher(L7ContentClassPathConfigurator(connection))
+    cache = DeviceTableCache(connection.rest)
+    connection.rest.calls = dict.fromkeys(connection.rest.calls, 0)
+    assert matcher.matches(cache, dict(path(1, '/a'), content_class_id='c1'))
+    # fields left out of the entry are not compared
+    assert matcher.matches(cache, dict(content_class_id='c1', url_path_id='1', url_path='/a'))
+    assert not matcher.matches(cache, dict(path(1, '/changed'), content_class_id='c1'))
+    assert not matcher.matches(cache, dict(path(1, '/a', 'prefix'), content_class_id='c1'))
+    assert not matcher.matches(cache, dict(path(9, '/a'), content_class_id='c1'))
+    # the path table is read once for all the entries
+    assert connection.rest.calls['read_all'] == 1
+
+
+def test_unchanged_entries_skip_the_sdk_evaluation(connection):
+    connection.rest.calls = dict.fromkeys(connection.rest.calls, 0)
+    result = run(connection, content_class=content_class('c1'), paths=[path(1, '/a'), path(2, '/b'), path(3, '/c')])
+    assert not result['changed']
+    assert connection.rest.calls['update'] == 0
+
+
+def test_changed_entry_is_written(connection):
+    result = run(connection, content_class=content_class('c1'), paths=[path(2, '/changed')])
+    assert result['changes'] == [dict(section='paths', command='update', id=dict(content_class_id='c1', url_path_id='2'))]
+    assert device_paths(connection) == [('1', '/a'), ('2', '/changed'), ('3', '/c')]
+
+
+def test_purge_deletes_unlisted_entries_of_the_class(connection):
+    result = run(connection, content_class=content_class('c1'), paths=[path(1, '/a')], purge=True)
+    assert sorted(change['id']['url_path_id'] for change in result['changes'] if change['command'] == 'delete') == \
+        ['2', '3']
+    assert device_paths(connection) == [('1', '/a')]
+    assert device_paths(connection, 'c2') == [('1', '/other')]
+
+
+def test_purge_check_mode_reports_without_deleting(connection):
+    result = run(connection, check_mode=True, content_class=content_class('c1'), paths=[path(1, '/a')], purge=True)
+    assert result['changed']
+    assert len(result['changes']) == 2
+    assert device_paths(connection) == [('1', '/a'), ('2', '/b'), ('3', '/c')]
+
+
+def test_purge_is_ignored_with_append(connection):
+    result = run(connection, content_class=content_class('c1'), paths=[path(4, '/d')], purge=True, state='append')
+    assert all(change['command'] != 'delete' for change in result['changes'])
+    assert device_paths(connection) == [('1', '/a'), ('2', '/b'), ('3', '/c'), ('4', '/d')]